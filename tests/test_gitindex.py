@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+Tests for the git index reader.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+from os.path import join
+from pathlib import Path
+from shutil import which
+from subprocess import run
+
+import pytest
+
+from vim_eof_comment.gitindex import read_index
+
+pytestmark = pytest.mark.skipif(which("git") is None, reason="git is not installed")
+
+
+@pytest.fixture(params=[2, 3, 4])
+def git_dir(request: pytest.FixtureRequest, tmp_path: Path) -> str:
+    """Create a repository with a few staged files, using the given index version."""
+    run(["git", "init", "-q", str(tmp_path)], check=True)
+    for name in ("a.py", "b.py", join("sub", "c.py")):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text("pass\n")
+
+    run(["git", "-C", str(tmp_path), "add", "."], check=True)
+    run(
+        ["git", "-C", str(tmp_path), "update-index", f"--index-version={request.param}"],
+        check=True,
+    )
+    return str(tmp_path / ".git")
+
+
+def test_read_index(git_dir: str) -> None:
+    """An intact index yields all of its entries."""
+    assert [entry.path for entry in read_index(git_dir)] == ["a.py", "b.py", "sub/c.py"]
+
+
+def test_read_truncated_index(git_dir: str) -> None:
+    """A truncated index raises ``ValueError`` wherever it's cut."""
+    index = Path(git_dir, "index")
+    data = index.read_bytes()
+    for size in range(len(data) - 20):
+        index.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            list(read_index(git_dir))
+
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
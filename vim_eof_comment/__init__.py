@@ -9,38 +9,119 @@ Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 __all__ = [
     "BatchPairDict",
     "BatchPathDict",
+    "CheckResult",
     "CommentMap",
     "EOFCommentSearch",
     "IndentHandler",
     "IndentMap",
+    "IndexEntry",
     "LineBool",
     "ParserSpec",
+    "RunStats",
     "VersionInfo",
     "__version__",
     "append_eof_comment",
     "args",
+    "cache",
+    "check_paths",
+    "check_tree",
     "comments",
     "eof_comment_search",
     "file",
+    "fix_paths",
+    "fix_tree",
+    "gitindex",
+    "hooks",
     "main",
+    "process_tree",
     "regex",
+    "stats",
     "util",
     "version",
+    "watch",
 ]
 
-from . import args, comments, file, regex, util, version
-from .core import append_eof_comment, eof_comment_search, main
-from .types import (
-    BatchPairDict,
-    BatchPathDict,
-    CommentMap,
-    EOFCommentSearch,
-    IndentHandler,
-    IndentMap,
-    LineBool,
-    ParserSpec,
-    VersionInfo,
-)
-from .version import __version__
+from importlib import import_module
+from typing import Any, Dict, List
+
+_SUBMODULES: List[str] = [
+    "args",
+    "cache",
+    "comments",
+    "file",
+    "gitindex",
+    "hooks",
+    "regex",
+    "stats",
+    "util",
+    "version",
+    "watch",
+]
+_ATTRIBUTES: Dict[str, str] = {
+    "BatchPairDict": "types",
+    "BatchPathDict": "types",
+    "CheckResult": "types",
+    "CommentMap": "types",
+    "EOFCommentSearch": "types",
+    "IndentHandler": "types",
+    "IndentMap": "types",
+    "IndexEntry": "types",
+    "LineBool": "types",
+    "ParserSpec": "types",
+    "RunStats": "stats",
+    "VersionInfo": "types",
+    "__version__": "version",
+    "append_eof_comment": "core",
+    "check_paths": "core",
+    "check_tree": "core",
+    "eof_comment_search": "core",
+    "fix_paths": "core",
+    "fix_tree": "core",
+    "main": "core",
+    "process_tree": "core",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the public submodules and attributes of the package on first use.
+
+    Parameters
+    ----------
+    name : str
+        The name of the requested attribute.
+
+    Returns
+    -------
+    Any
+        The requested submodule or attribute.
+
+    Raises
+    ------
+    AttributeError
+        If the package has no such attribute.
+    """
+    if name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    elif name in _ATTRIBUTES:
+        value = getattr(import_module(f".{_ATTRIBUTES[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the attributes of the package, including the ones not imported yet.
+
+    Returns
+    -------
+    List[str]
+        The sorted attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
+
 
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
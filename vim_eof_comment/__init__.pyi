@@ -1,18 +1,31 @@
 from . import args as args
+from . import cache as cache
 from . import comments as comments
 from . import file as file
+from . import gitindex as gitindex
+from . import hooks as hooks
 from . import regex as regex
+from . import stats as stats
 from . import util as util
 from . import version as version
+from . import watch as watch
 from .core import append_eof_comment as append_eof_comment
+from .core import check_paths as check_paths
+from .core import check_tree as check_tree
 from .core import eof_comment_search as eof_comment_search
+from .core import fix_paths as fix_paths
+from .core import fix_tree as fix_tree
 from .core import main as main
+from .core import process_tree as process_tree
+from .stats import RunStats as RunStats
 from .types import BatchPairDict as BatchPairDict
 from .types import BatchPathDict as BatchPathDict
+from .types import CheckResult as CheckResult
 from .types import CommentMap as CommentMap
 from .types import EOFCommentSearch as EOFCommentSearch
 from .types import IndentHandler as IndentHandler
 from .types import IndentMap as IndentMap
+from .types import IndexEntry as IndexEntry
 from .types import LineBool as LineBool
 from .types import ParserSpec as ParserSpec
 from .types import VersionInfo as VersionInfo
@@ -21,23 +34,36 @@ from .version import __version__ as __version__
 __all__ = [
     "BatchPairDict",
     "BatchPathDict",
+    "CheckResult",
     "CommentMap",
     "EOFCommentSearch",
     "IndentHandler",
     "IndentMap",
+    "IndexEntry",
     "LineBool",
     "ParserSpec",
+    "RunStats",
     "VersionInfo",
     "__version__",
     "append_eof_comment",
     "args",
+    "cache",
+    "check_paths",
+    "check_tree",
     "comments",
     "eof_comment_search",
     "file",
+    "fix_paths",
+    "fix_tree",
+    "gitindex",
+    "hooks",
     "main",
+    "process_tree",
     "regex",
+    "stats",
     "util",
     "version",
+    "watch",
 ]
 
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -9,7 +9,28 @@ Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 
 import sys
 
-from .core import main
+
+def main() -> int:
+    """
+    Execute the program, answering shell completion requests early if possible.
+
+    The rest of the program is only imported if the request can't be served from the
+    precomputed completion table.
+
+    Returns
+    -------
+    int
+        The exit code for the program.
+    """
+    from .args.completion import fast_complete
+
+    if fast_complete():
+        return 0
+
+    from .core import main as run
+
+    return run()
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -3,11 +3,55 @@
 """
 Argument parsing utilities for `vim-eof-comment`.
 
+The submodules are imported on first use, so shell completion can be served from
+``table`` without importing the argument parser.
+
 Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 """
 
-__all__ = ["completion", "parsing"]
+__all__ = ["completion", "parsing", "table"]
+
+from importlib import import_module
+from typing import Any, List
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the submodules of the package on first use.
+
+    Parameters
+    ----------
+    name : str
+        The name of the requested submodule.
+
+    Returns
+    -------
+    Any
+        The requested submodule.
+
+    Raises
+    ------
+    AttributeError
+        If the package has no such submodule.
+    """
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = import_module(f".{name}", __name__)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the attributes of the package, including the submodules not imported yet.
+
+    Returns
+    -------
+    List[str]
+        The sorted attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
 
-from . import completion, parsing
 
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -1,6 +1,7 @@
 from . import completion as completion
 from . import parsing as parsing
+from . import table as table
 
-__all__ = ["completion", "parsing"]
+__all__ = ["completion", "parsing", "table"]
 
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -6,12 +6,72 @@ Argument parsing completion utilities for ``vim-eof-comment``.
 Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 """
 
-__all__ = ["complete_parser", "complete_validator"]
+__all__ = [
+    "choices_completer",
+    "complete_parser",
+    "complete_validator",
+    "completing",
+    "fast_complete",
+    "files_completer",
+]
 
 from argparse import ArgumentParser
-from typing import List
+from os import environ, write
+from typing import TYPE_CHECKING, Iterable, List
 
-from argcomplete import autocomplete
+if TYPE_CHECKING:
+    from argcomplete.completers import ChoicesCompleter, FilesCompleter
+
+
+def completing() -> bool:
+    """
+    Check whether the program was invoked by ``argcomplete`` to complete a command line.
+
+    Returns
+    -------
+    bool
+        Whether shell completion is active.
+    """
+    return "_ARGCOMPLETE" in environ
+
+
+def choices_completer(choices: Iterable[str]) -> "ChoicesCompleter | None":
+    """
+    Create a completer for a fixed set of choices, importing ``argcomplete`` only if needed.
+
+    Parameters
+    ----------
+    choices : Iterable[str]
+        The choices to be completed.
+
+    Returns
+    -------
+    argcomplete.completers.ChoicesCompleter or None
+        The completer, or ``None`` if shell completion isn't active.
+    """
+    if not completing():
+        return None
+
+    from argcomplete.completers import ChoicesCompleter
+
+    return ChoicesCompleter(choices)
+
+
+def files_completer() -> "FilesCompleter | None":
+    """
+    Create a file path completer, importing ``argcomplete`` only if needed.
+
+    Returns
+    -------
+    argcomplete.completers.FilesCompleter or None
+        The completer, or ``None`` if shell completion isn't active.
+    """
+    if not completing():
+        return None
+
+    from argcomplete.completers import FilesCompleter
+
+    return FilesCompleter()
 
 
 def complete_validator(completion_candidate: List[str], current_input: str) -> bool:
@@ -33,10 +93,98 @@ def complete_validator(completion_candidate: List[str], current_input: str) -> b
     return current_input in completion_candidate
 
 
+def _static_completions(words: List[str], prefix: str) -> List[str] | None:
+    """
+    Look up the completions of a command line word in the precomputed ``table`` module.
+
+    Parameters
+    ----------
+    words : List[str]
+        The program arguments before the word being completed.
+    prefix : str
+        The part of the word being completed before the cursor.
+
+    Returns
+    -------
+    List[str] or None
+        The completions, or ``None`` if they can't be served from the table
+        (e.g. file paths, abbreviated or grouped options).
+    """
+    from .table import CHOICES, OPTIONS, VALUES
+
+    if "--" in words or "=" in prefix or ":" in prefix:
+        return None
+
+    previous: str = words[-1] if words else ""
+    if previous.startswith("-") and previous not in OPTIONS:
+        return None
+
+    if previous in VALUES and not prefix.startswith("-"):
+        if VALUES[previous] or previous not in CHOICES:
+            return None
+
+        return [choice for choice in CHOICES[previous] if prefix in choice]
+
+    if not prefix.startswith("-"):
+        return None
+
+    return [opt for opt in OPTIONS if opt.startswith(prefix)]
+
+
+def fast_complete() -> bool:
+    """
+    Answer a shell completion request from the precomputed ``table`` module, if possible.
+
+    Option strings and the values of options with fixed choices are served without building
+    the argument parser nor importing the rest of the program. Anything else (file paths,
+    quoted words, non-bash shells) is left to ``complete_parser()``.
+
+    Returns
+    -------
+    bool
+        Whether the request was answered, in which case the program must exit right away.
+    """
+    if not completing() or environ.get("_ARGCOMPLETE_SHELL", "bash") != "bash":
+        return False
+
+    if environ.get("_ARGCOMPLETE_DFS"):
+        return False
+
+    try:
+        line: str = environ["COMP_LINE"][: int(environ["COMP_POINT"])]
+        start: int = int(environ["_ARGCOMPLETE"])
+    except (KeyError, ValueError):
+        return False
+
+    if any(char in line for char in "\"'\\$`"):
+        return False
+
+    words: List[str] = line.split()
+    prefix: str = "" if not words or line[-1].isspace() else words.pop()
+    completions = _static_completions(words[start:], prefix)
+    if completions is None:
+        return False
+
+    if len(completions) == 1:
+        completions[0] += " "
+
+    data: bytes = environ.get("_ARGCOMPLETE_IFS", "\013").join(completions).encode()
+    output: str | None = environ.get("_ARGCOMPLETE_STDOUT_FILENAME")
+    if output is not None:
+        with open(output, "wb") as file:
+            file.write(data)
+    else:
+        write(8, data)
+
+    return True
+
+
 def complete_parser(parser: ArgumentParser, **kwargs) -> None:
     """
     Complete the script argument parser.
 
+    Nothing is done (nor imported) unless shell completion is active.
+
     Parameters
     ----------
     parser : argparse.ArgumentParser
@@ -44,6 +192,11 @@ def complete_parser(parser: ArgumentParser, **kwargs) -> None:
     **kwargs
         Extra parameters to be passed to ``argcomplete.autocomplete()``.
     """
+    if not completing():
+        return
+
+    from argcomplete import autocomplete
+
     autocomplete(parser, validator=complete_validator, **kwargs)
 
 
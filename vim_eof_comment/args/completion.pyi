@@ -1,6 +1,51 @@
 from argparse import ArgumentParser
+from typing import Iterable
 
-__all__ = ["complete_parser", "complete_validator"]
+from argcomplete.completers import ChoicesCompleter, FilesCompleter
+
+__all__ = [
+    "choices_completer",
+    "complete_parser",
+    "complete_validator",
+    "completing",
+    "fast_complete",
+    "files_completer",
+]
+
+def completing() -> bool:
+    """
+    Check whether the program was invoked by ``argcomplete`` to complete a command line.
+
+    Returns
+    -------
+    bool
+        Whether shell completion is active.
+    """
+
+def choices_completer(choices: Iterable[str]) -> ChoicesCompleter | None:
+    """
+    Create a completer for a fixed set of choices, importing ``argcomplete`` only if needed.
+
+    Parameters
+    ----------
+    choices : Iterable[str]
+        The choices to be completed.
+
+    Returns
+    -------
+    argcomplete.completers.ChoicesCompleter or None
+        The completer, or ``None`` if shell completion isn't active.
+    """
+
+def files_completer() -> FilesCompleter | None:
+    """
+    Create a file path completer, importing ``argcomplete`` only if needed.
+
+    Returns
+    -------
+    argcomplete.completers.FilesCompleter or None
+        The completer, or ``None`` if shell completion isn't active.
+    """
 
 def complete_validator(completion_candidate: list[str], current_input: str) -> bool:
     """
@@ -19,10 +64,26 @@ def complete_validator(completion_candidate: list[str], current_input: str) -> b
         Whether the current input fits the completion candidates pool.
     """
 
+def fast_complete() -> bool:
+    """
+    Answer a shell completion request from the precomputed ``table`` module, if possible.
+
+    Option strings and the values of options with fixed choices are served without building
+    the argument parser nor importing the rest of the program. Anything else (file paths,
+    quoted words, non-bash shells) is left to ``complete_parser()``.
+
+    Returns
+    -------
+    bool
+        Whether the request was answered, in which case the program must exit right away.
+    """
+
 def complete_parser(parser: ArgumentParser, **kwargs) -> None:
     """
     Complete the script argument parser.
 
+    Nothing is done (nor imported) unless shell completion is active.
+
     Parameters
     ----------
     parser : argparse.ArgumentParser
@@ -9,14 +9,31 @@ Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 __all__ = ["gen_parser_specs", "bootstrap_args", "arg_parser_init", "indent_handler"]
 
 from argparse import ArgumentDefaultsHelpFormatter, ArgumentError, ArgumentParser, Namespace
-from typing import List, Tuple
-
-from argcomplete.completers import ChoicesCompleter, DirectoriesCompleter
+from os.path import dirname, join
+from typing import Dict, List, Tuple
 
+from ..cache import CACHE_MODES, DEFAULT_CACHE_FILE
 from ..comments.generator import get_extensions
+from ..file import DEFAULT_MAX_OPEN, ENGINES
 from ..types import IndentHandler, ParserSpec
-from ..util import die
-from .completion import complete_parser
+from ..util import die, render_literal, render_mapping
+from ..watch import DEFAULT_DEBOUNCE
+from .completion import choices_completer, complete_parser, files_completer
+
+_TABLE_FILE: str = join(dirname(__file__), "table.py")
+_TABLE_HEADER: str = '''# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+# Generated from the argument parser by `make table`. Do not edit by hand!
+"""
+Precomputed shell completion table.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+__all__ = ["CHOICES", "OPTIONS", "VALUES"]
+
+from types import MappingProxyType
+from typing import Mapping, Tuple'''
 
 
 def gen_parser_specs(*specs) -> List[ParserSpec]:
@@ -69,26 +86,27 @@ def bootstrap_args(parser: ArgumentParser, specs: List[ParserSpec]) -> Namespace
     return namespace
 
 
-def arg_parser_init(prog: str = "vim-eof-comment") -> Tuple[ArgumentParser, Namespace]:
+def _build_parser(prog: str) -> Tuple[ArgumentParser, List[ParserSpec]]:
     """
-    Generate the argparse namespace.
+    Create the argument parser and the specs of its arguments.
 
     Parameters
     ----------
-    prog : str, optional, default="vim-eof-comment"
+    prog : str
         The program name.
 
     Returns
     -------
     parser : argparse.ArgumentParser
-        The generated ``argparse.ArgumentParser`` object.
-    namespace : argparse.Namespace
-        The generated ``argparse.Namespace`` object.
+        The ``argparse.ArgumentParser`` object, without any arguments yet.
+    specs : List[vim_eof_comment.types.ParserSpec]
+        The specs of the program arguments.
     """
+    exts: Tuple[str, ...] = tuple(get_extensions())
     parser = ArgumentParser(
         prog=prog,
         description="Checks for Vim EOF comments in all matching files in specific directories",
-        epilog="Both the directory path(s) and the `-e` option are required!",
+        epilog="Both the directory path(s) (or `--files-from`) and the `-e` option are required!",
         exit_on_error=False,
         formatter_class=ArgumentDefaultsHelpFormatter,
         add_help=True,
@@ -97,10 +115,10 @@ def arg_parser_init(prog: str = "vim-eof-comment") -> Tuple[ArgumentParser, Name
     spec: List[ParserSpec] = gen_parser_specs(
         {
             "opts": ["directories"],
-            "completer": DirectoriesCompleter(),
+            "completer": files_completer(),
             "kwargs": {
                 "nargs": "*",
-                "help": "The target directories to be checked",
+                "help": "The target directories (or files) to be checked",
                 "metavar": "/path/to/directory",
             },
         },
@@ -136,10 +154,10 @@ def arg_parser_init(prog: str = "vim-eof-comment") -> Tuple[ArgumentParser, Name
         },
         {
             "opts": ["-c", "--show-comment"],
-            "completer": ChoicesCompleter(tuple(get_extensions())),
+            "completer": choices_completer(exts),
             "kwargs": {
                 "required": False,
-                "choices": tuple(get_extensions()),
+                "choices": exts,
                 "help": """
                 Show default comment for either a specific file extension or,
                 if none passed, all of the available ones.
@@ -162,6 +180,98 @@ def arg_parser_init(prog: str = "vim-eof-comment") -> Tuple[ArgumentParser, Name
                 "dest": "dry_run",
             },
         },
+        {
+            "opts": ["--stdin"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "action": "store_true",
+                "help": "Read a file from stdin and write it to stdout with its EOF comment fixed",
+                "dest": "stdin",
+            },
+        },
+        {
+            "opts": ["--ft"],
+            "completer": choices_completer(exts),
+            "kwargs": {
+                "required": False,
+                "choices": exts,
+                "metavar": "EXT",
+                "help": "The file-type/file-extension of the file read through `--stdin`",
+                "default": None,
+                "dest": "ft",
+            },
+        },
+        {
+            "opts": ["--files-from"],
+            "completer": files_completer(),
+            "kwargs": {
+                "required": False,
+                "metavar": "FILE",
+                "help": "Also check the paths listed in FILE, one per line (`-` reads stdin)",
+                "default": None,
+                "dest": "files_from",
+            },
+        },
+        {
+            "opts": ["-0", "--null"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "action": "store_true",
+                "help": "The paths passed through `--files-from` are NUL-separated",
+                "dest": "null",
+            },
+        },
+        {
+            "opts": ["-w", "--watch"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "action": "store_true",
+                "help": """
+                After the first pass, keep watching the target directories
+                and check (and fix) every matching file as soon as it's written
+                """,
+                "dest": "watch",
+            },
+        },
+        {
+            "opts": ["--debounce"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "type": float,
+                "metavar": "SECONDS",
+                "help": "How long to wait for a burst of writes to settle on watch mode",
+                "default": DEFAULT_DEBOUNCE,
+                "dest": "debounce",
+            },
+        },
+        {
+            "opts": ["--git-tracked"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "action": "store_true",
+                "help": "Only check the files tracked by git, as listed in the local git index",
+                "dest": "git_tracked",
+            },
+        },
+        {
+            "opts": ["--changed-since"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "metavar": "REF",
+                "help": """
+                Only check the files changed since the merge base with a git revision
+                (implies `--git-tracked`, since only tracked files are compared)
+                """,
+                "default": None,
+                "dest": "changed_since",
+            },
+        },
         {
             "opts": ["-l", "--list-filetypes"],
             "completer": None,
@@ -207,11 +317,170 @@ def arg_parser_init(prog: str = "vim-eof-comment") -> Tuple[ArgumentParser, Name
                 "dest": "indent",
             },
         },
+        {
+            "opts": ["-x", "--exclude"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "action": "append",
+                "metavar": "GLOB",
+                "help": """
+                Skip files and directories whose name or relative path matches a glob pattern.
+                Can be called multiple times
+                """,
+                "dest": "excludes",
+            },
+        },
+        {
+            "opts": ["-j", "--jobs"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "type": int,
+                "metavar": "N",
+                "help": "The amount of files to be checked and fixed in parallel",
+                "default": 1,
+                "dest": "jobs",
+            },
+        },
+        {
+            "opts": ["--executor"],
+            "completer": choices_completer(("thread", "process")),
+            "kwargs": {
+                "required": False,
+                "choices": ("thread", "process"),
+                "help": "The kind of workers used to check files when running more than one job",
+                "default": "thread",
+                "dest": "executor",
+            },
+        },
+        {
+            "opts": ["--engine"],
+            "completer": choices_completer(ENGINES),
+            "kwargs": {
+                "required": False,
+                "choices": ENGINES,
+                "help": """
+                How files are read: decoded as text (\"text\"), or compared and patched
+                as raw bytes (\"bytes\"), which never decodes them and round-trips them byte-exact
+                """,
+                "default": "text",
+                "dest": "engine",
+            },
+        },
+        {
+            "opts": ["--cache"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "nargs": "?",
+                "const": DEFAULT_CACHE_FILE,
+                "metavar": "FILE",
+                "help": f"""
+                Skip files that didn't change since their last check,
+                using a persistent cache file (\"{DEFAULT_CACHE_FILE}\" if no FILE is passed)
+                """,
+                "dest": "cache",
+            },
+        },
+        {
+            "opts": ["--cache-mode"],
+            "completer": choices_completer(CACHE_MODES),
+            "kwargs": {
+                "required": False,
+                "choices": CACHE_MODES,
+                "help": """
+                How cached files are identified: by path and stat signature (\"stat\"),
+                or by the blob IDs in the local git index (\"blob\"), which survive fresh clones
+                """,
+                "default": "stat",
+                "dest": "cache_mode",
+            },
+        },
+        {
+            "opts": ["--stats"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "action": "store_true",
+                "help": """
+                Print the time spent discovering, opening, checking and writing files,
+                and the amount of files and bytes processed (to stderr)
+                """,
+                "dest": "stats",
+            },
+        },
+        {
+            "opts": ["--max-open"],
+            "completer": None,
+            "kwargs": {
+                "required": False,
+                "type": int,
+                "metavar": "N",
+                "help": "The maximum amount of files to be kept open at the same time",
+                "default": DEFAULT_MAX_OPEN,
+                "dest": "max_open",
+            },
+        },
     )
 
+    return parser, spec
+
+
+def arg_parser_init(prog: str = "vim-eof-comment") -> Tuple[ArgumentParser, Namespace]:
+    """
+    Generate the argparse namespace.
+
+    Parameters
+    ----------
+    prog : str, optional, default="vim-eof-comment"
+        The program name.
+
+    Returns
+    -------
+    parser : argparse.ArgumentParser
+        The generated ``argparse.ArgumentParser`` object.
+    namespace : argparse.Namespace
+        The generated ``argparse.Namespace`` object.
+    """
+    parser, spec = _build_parser(prog)
     return parser, bootstrap_args(parser, spec)
 
 
+def export_table() -> None:
+    """
+    Compile the option strings of the argument parser into the ``table`` module.
+
+    The generated module is what ``completion.fast_complete()`` serves shell completions from,
+    without building the argument parser.
+    """
+    parser, specs = _build_parser("vim-eof-comment")
+    for spec in specs:
+        parser.add_argument(*spec.opts, **spec.kwargs)
+
+    options: List[str] = list()
+    values: Dict[str, bool] = dict()
+    choices: Dict[str, Tuple[str, ...]] = dict()
+    for action in parser._actions:
+        options.extend(action.option_strings)
+        for opt in action.option_strings:
+            if action.nargs != 0:
+                values[opt] = action.nargs == "?"
+
+            if action.choices is not None:
+                choices[opt] = tuple(action.choices)
+
+    blocks: List[str] = [
+        _TABLE_HEADER,
+        f"OPTIONS: Tuple[str, ...] = {render_literal(tuple(options), '')}",
+        render_mapping("VALUES", "Mapping[str, bool]", values),
+        render_mapping("CHOICES", "Mapping[str, Tuple[str, ...]]", choices),
+        "# vim: set ts=4 sts=4 sw=4 et ai si sta:\n",
+    ]
+    with open(_TABLE_FILE, "w") as file:
+        file.write("\n\n".join(blocks))
+
+
 def indent_handler(indent: str) -> List[IndentHandler]:
     """
     Parse indent levels defined by the user.
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+# Generated from the argument parser by `make table`. Do not edit by hand!
+"""
+Precomputed shell completion table.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+__all__ = ["CHOICES", "OPTIONS", "VALUES"]
+
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+OPTIONS: Tuple[str, ...] = (
+    "-h",
+    "--help",
+    "-V",
+    "--version",
+    "-v",
+    "--verbose",
+    "-L",
+    "--list-versions",
+    "-c",
+    "--show-comment",
+    "-D",
+    "--dry-run",
+    "--stdin",
+    "--ft",
+    "--files-from",
+    "-0",
+    "--null",
+    "-w",
+    "--watch",
+    "--debounce",
+    "--git-tracked",
+    "--changed-since",
+    "-l",
+    "--list-filetypes",
+    "-n",
+    "--newline",
+    "-e",
+    "--extensions",
+    "-i",
+    "--indents",
+    "-x",
+    "--exclude",
+    "-j",
+    "--jobs",
+    "--executor",
+    "--engine",
+    "--cache",
+    "--cache-mode",
+    "--stats",
+    "--max-open",
+)
+
+VALUES: Mapping[str, bool] = MappingProxyType(
+    {
+        "-c": True,
+        "--show-comment": True,
+        "--ft": False,
+        "--files-from": False,
+        "--debounce": False,
+        "--changed-since": False,
+        "-e": False,
+        "--extensions": False,
+        "-i": False,
+        "--indents": False,
+        "-x": False,
+        "--exclude": False,
+        "-j": False,
+        "--jobs": False,
+        "--executor": False,
+        "--engine": False,
+        "--cache": True,
+        "--cache-mode": False,
+        "--max-open": False,
+    }
+)
+
+CHOICES: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "-c": (
+            "BSDmakefile",
+            "C",
+            "H",
+            "Makefile",
+            "bash",
+            "c",
+            "c++",
+            "cc",
+            "coffee",
+            "cpp",
+            "cson",
+            "css",
+            "fish",
+            "h",
+            "hh",
+            "hpp",
+            "htm",
+            "html",
+            "javascript",
+            "javascriptreact",
+            "jl",
+            "js",
+            "jsonc",
+            "jsx",
+            "julia",
+            "latex",
+            "litcoffee",
+            "lua",
+            "make",
+            "markdown",
+            "md",
+            "mk",
+            "py",
+            "pyi",
+            "python",
+            "rb",
+            "rs",
+            "ruby",
+            "rust",
+            "sh",
+            "tex",
+            "toml",
+            "ts",
+            "tsx",
+            "typescript",
+            "typescriptreact",
+            "xhtml",
+            "xml",
+            "yaml",
+            "yml",
+            "zsh",
+        ),
+        "--show-comment": (
+            "BSDmakefile",
+            "C",
+            "H",
+            "Makefile",
+            "bash",
+            "c",
+            "c++",
+            "cc",
+            "coffee",
+            "cpp",
+            "cson",
+            "css",
+            "fish",
+            "h",
+            "hh",
+            "hpp",
+            "htm",
+            "html",
+            "javascript",
+            "javascriptreact",
+            "jl",
+            "js",
+            "jsonc",
+            "jsx",
+            "julia",
+            "latex",
+            "litcoffee",
+            "lua",
+            "make",
+            "markdown",
+            "md",
+            "mk",
+            "py",
+            "pyi",
+            "python",
+            "rb",
+            "rs",
+            "ruby",
+            "rust",
+            "sh",
+            "tex",
+            "toml",
+            "ts",
+            "tsx",
+            "typescript",
+            "typescriptreact",
+            "xhtml",
+            "xml",
+            "yaml",
+            "yml",
+            "zsh",
+        ),
+        "--ft": (
+            "BSDmakefile",
+            "C",
+            "H",
+            "Makefile",
+            "bash",
+            "c",
+            "c++",
+            "cc",
+            "coffee",
+            "cpp",
+            "cson",
+            "css",
+            "fish",
+            "h",
+            "hh",
+            "hpp",
+            "htm",
+            "html",
+            "javascript",
+            "javascriptreact",
+            "jl",
+            "js",
+            "jsonc",
+            "jsx",
+            "julia",
+            "latex",
+            "litcoffee",
+            "lua",
+            "make",
+            "markdown",
+            "md",
+            "mk",
+            "py",
+            "pyi",
+            "python",
+            "rb",
+            "rs",
+            "ruby",
+            "rust",
+            "sh",
+            "tex",
+            "toml",
+            "ts",
+            "tsx",
+            "typescript",
+            "typescriptreact",
+            "xhtml",
+            "xml",
+            "yaml",
+            "yml",
+            "zsh",
+        ),
+        "--executor": ("thread", "process"),
+        "--engine": ("text", "bytes"),
+        "--cache-mode": ("stat", "blob"),
+    }
+)
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
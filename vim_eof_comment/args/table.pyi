@@ -0,0 +1,9 @@
+from typing import Mapping
+
+__all__ = ["CHOICES", "OPTIONS", "VALUES"]
+
+OPTIONS: tuple[str, ...]
+VALUES: Mapping[str, bool]
+CHOICES: Mapping[str, tuple[str, ...]]
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
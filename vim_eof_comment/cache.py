@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+Persistent scan cache utilities.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+__all__ = ["CACHE_MODES", "DEFAULT_CACHE_FILE", "ScanCache", "config_hash"]
+
+from os import sep, stat
+from os.path import abspath, dirname, join, relpath
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Tuple
+
+from .gitindex import entry_is_clean, find_repo, read_index
+from .types import CheckResult, EOFCommentSearch, IndexEntry, IOWrapperBool
+
+if TYPE_CHECKING:
+    import sqlite3
+
+DEFAULT_CACHE_FILE: str = ".vim-eof-comment.cache"
+CACHE_MODES: Tuple[str, str] = ("stat", "blob")
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    ino INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    config TEXT NOT NULL,
+    ext TEXT NOT NULL,
+    verdict INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    oid TEXT NOT NULL,
+    ext TEXT NOT NULL,
+    config TEXT NOT NULL,
+    verdict INTEGER NOT NULL,
+    PRIMARY KEY (oid, ext, config)
+);
+"""
+
+_OK: int = -1
+_HAD_NWL: int = 1
+_CRLF: int = 2
+_MATCH: int = 4
+
+_Repo = Tuple[str, Dict[str, IndexEntry], int]
+
+
+def _encode(result: CheckResult) -> int:
+    """
+    Encode the verdict of a check.
+
+    Parameters
+    ----------
+    result : CheckResult
+        The result of the check.
+
+    Returns
+    -------
+    int
+        The encoded verdict.
+    """
+    if result.search is None:
+        return _OK
+
+    verdict = 0
+    if result.search.state.had_nwl:
+        verdict |= _HAD_NWL
+
+    if result.search.state.crlf:
+        verdict |= _CRLF
+
+    if result.search.match:
+        verdict |= _MATCH
+
+    return verdict
+
+
+def _decode(fpath: str, ext: str, verdict: int) -> CheckResult:
+    """
+    Decode a cached verdict.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+    ext : str
+        The file-type/file-extension.
+    verdict : int
+        The encoded verdict.
+
+    Returns
+    -------
+    CheckResult
+        The decoded result.
+    """
+    if verdict == _OK:
+        return CheckResult(fpath=fpath, ft_ext=ext, search=None)
+
+    search = EOFCommentSearch(
+        state=IOWrapperBool(
+            file=None, had_nwl=bool(verdict & _HAD_NWL), crlf=bool(verdict & _CRLF)
+        ),
+        lang=ext,
+        match=bool(verdict & _MATCH),
+    )
+    return CheckResult(fpath=fpath, ft_ext=ext, search=search)
+
+
+def config_hash(comment_map: Dict[str, str], newline: bool, engine: str = "text") -> str:
+    """
+    Hash the configuration a verdict depends on.
+
+    Parameters
+    ----------
+    comment_map : Dict[str, str]
+        The generated comments dictionary.
+    newline : bool
+        Whether a newline is required before the comment.
+    engine : str, optional, default="text"
+        The engine the files are checked with.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the configuration.
+    """
+    from hashlib import sha1
+
+    config = (sorted(comment_map.items()), newline, engine)
+    return sha1(repr(config).encode("utf-8")).hexdigest()
+
+
+class ScanCache:
+    """
+    On-disk cache of check verdicts.
+
+    In ``"stat"`` mode verdicts are keyed by the path and stat signature of each file.
+    In ``"blob"`` mode files tracked by git are keyed by the blob ID recorded in the local
+    ``.git/index`` instead, so a cache file restored on a fresh clone (e.g. in CI) still
+    applies. The blob ID of a file is only trusted if its stat data matches its index entry,
+    otherwise its stat signature is used. Either way, files whose key and configuration
+    didn't change since their last check can be skipped without being opened.
+    All methods are thread-safe.
+
+    Parameters
+    ----------
+    path : str
+        The path of the SQLite cache file.
+    config : str
+        The configuration hash, as returned by ``config_hash()``.
+    mode : str, optional, default="stat"
+        Either ``"stat"`` or ``"blob"``.
+
+    Attributes
+    ----------
+    path : str
+        The path of the SQLite cache file.
+    config : str
+        The configuration hash, as returned by ``config_hash()``.
+    mode : str
+        Either ``"stat"`` or ``"blob"``.
+
+    Methods
+    -------
+    signature(fpath)
+    lookup(fpath, ext, signature)
+    store(result, signature)
+    close()
+    """
+
+    path: str
+    config: str
+    mode: str
+    __lock: Lock
+    __conn: "sqlite3.Connection"
+    __dirs: Dict[str, _Repo | None]
+    __repos: Dict[str, _Repo | None]
+
+    def __init__(self, path: str, config: str, mode: str = "stat"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode `{mode}`")
+
+        import sqlite3
+
+        self.path = path
+        self.config = config
+        self.mode = mode
+        self.__lock = Lock()
+        self.__dirs = dict()
+        self.__repos = dict()
+        self.__conn = sqlite3.connect(path, check_same_thread=False)
+        self.__conn.executescript(_SCHEMA)
+
+    def __load_repo(self, directory: str) -> _Repo | None:
+        """
+        Load the git index of the work tree containing a directory.
+
+        Parameters
+        ----------
+        directory : str
+            The absolute path of the directory.
+
+        Returns
+        -------
+        Tuple[str, Dict[str, IndexEntry], int] or None
+            The work tree, its index entries by path and the modification time of its index,
+            or ``None`` if the directory isn't inside a git work tree with a readable index.
+        """
+        found = find_repo(directory)
+        if found is None:
+            return None
+
+        work_tree, git_dir = found
+        if git_dir not in self.__repos:
+            try:
+                index_mtime = stat(join(git_dir, "index")).st_mtime_ns
+                entries = {entry.path: entry for entry in read_index(git_dir)}
+                self.__repos[git_dir] = (work_tree, entries, index_mtime)
+            except (OSError, ValueError):
+                self.__repos[git_dir] = None
+
+        return self.__repos[git_dir]
+
+    def signature(self, fpath: str) -> Tuple[int, int, int] | str:
+        """
+        Get the cache key of a file.
+
+        Parameters
+        ----------
+        fpath : str
+            The path of the file.
+
+        Returns
+        -------
+        Tuple[int, int, int] or str
+            The blob ID of the file if available in ``"blob"`` mode,
+            otherwise its stat signature.
+        """
+        st = stat(fpath)
+        if self.mode == "blob":
+            fpath = abspath(fpath)
+            directory = dirname(fpath)
+            with self.__lock:
+                if directory not in self.__dirs:
+                    self.__dirs[directory] = self.__load_repo(directory)
+
+                repo = self.__dirs[directory]
+
+            if repo is not None:
+                work_tree, entries, index_mtime = repo
+                entry = entries.get(relpath(fpath, work_tree).replace(sep, "/"))
+                if entry is not None and entry_is_clean(entry, st, index_mtime):
+                    return entry.oid
+
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def lookup(
+        self, fpath: str, ext: str, signature: Tuple[int, int, int] | str
+    ) -> CheckResult | None:
+        """
+        Look up the last verdict of a file.
+
+        Parameters
+        ----------
+        fpath : str
+            The path of the file.
+        ext : str
+            The file-type/file-extension.
+        signature : Tuple[int, int, int] or str
+            The current key of the file, as returned by ``signature()``.
+
+        Returns
+        -------
+        CheckResult or None
+            The cached result, or ``None`` if the file or the configuration changed.
+        """
+        with self.__lock:
+            if isinstance(signature, str):
+                row = self.__conn.execute(
+                    "SELECT verdict FROM blobs WHERE oid = ? AND ext = ? AND config = ?",
+                    (signature, ext, self.config),
+                ).fetchone()
+            else:
+                row = self.__conn.execute(
+                    "SELECT verdict FROM files WHERE path = ? AND ino = ? AND size = ?"
+                    " AND mtime_ns = ? AND config = ? AND ext = ?",
+                    (abspath(fpath), *signature, self.config, ext),
+                ).fetchone()
+
+        if row is None:
+            return None
+
+        return _decode(fpath, ext, row[0])
+
+    def store(self, result: CheckResult, signature: Tuple[int, int, int] | str) -> None:
+        """
+        Store the verdict of a file, unless its check failed.
+
+        Parameters
+        ----------
+        result : CheckResult
+            The result of the check.
+        signature : Tuple[int, int, int] or str
+            The key of the file taken before it was checked, as returned by ``signature()``.
+        """
+        if result.error is not None:
+            return
+
+        verdict = _encode(result)
+        with self.__lock:
+            if isinstance(signature, str):
+                self.__conn.execute(
+                    "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?)",
+                    (signature, result.ft_ext, self.config, verdict),
+                )
+            else:
+                self.__conn.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (abspath(result.fpath), *signature, self.config, result.ft_ext, verdict),
+                )
+
+    def close(self) -> None:
+        """Commit all the stored verdicts and close the cache file."""
+        with self.__lock:
+            self.__conn.commit()
+            self.__conn.close()
+
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -0,0 +1,146 @@
+import sqlite3
+from threading import Lock
+from typing import Dict, Tuple
+
+from .types import CheckResult, IndexEntry
+
+__all__ = ["CACHE_MODES", "DEFAULT_CACHE_FILE", "ScanCache", "config_hash"]
+
+DEFAULT_CACHE_FILE: str
+CACHE_MODES: Tuple[str, str]
+
+def config_hash(comment_map: Dict[str, str], newline: bool, engine: str = "text") -> str:
+    """
+    Hash the configuration a verdict depends on.
+
+    Parameters
+    ----------
+    comment_map : Dict[str, str]
+        The generated comments dictionary.
+    newline : bool
+        Whether a newline is required before the comment.
+    engine : str, optional, default="text"
+        The engine the files are checked with.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the configuration.
+    """
+
+class ScanCache:
+    """
+    On-disk cache of check verdicts.
+
+    In ``"stat"`` mode verdicts are keyed by the path and stat signature of each file.
+    In ``"blob"`` mode files tracked by git are keyed by the blob ID recorded in the local
+    ``.git/index`` instead, so a cache file restored on a fresh clone (e.g. in CI) still
+    applies. The blob ID of a file is only trusted if its stat data matches its index entry,
+    otherwise its stat signature is used. Either way, files whose key and configuration
+    didn't change since their last check can be skipped without being opened.
+    All methods are thread-safe.
+
+    Parameters
+    ----------
+    path : str
+        The path of the SQLite cache file.
+    config : str
+        The configuration hash, as returned by ``config_hash()``.
+    mode : str, optional, default="stat"
+        Either ``"stat"`` or ``"blob"``.
+
+    Attributes
+    ----------
+    path : str
+        The path of the SQLite cache file.
+    config : str
+        The configuration hash, as returned by ``config_hash()``.
+    mode : str
+        Either ``"stat"`` or ``"blob"``.
+
+    Methods
+    -------
+    signature(fpath)
+    lookup(fpath, ext, signature)
+    store(result, signature)
+    close()
+    """
+
+    path: str
+    config: str
+    mode: str
+    __lock: Lock
+    __conn: sqlite3.Connection
+    __dirs: Dict[str, tuple[str, Dict[str, IndexEntry], int] | None]
+    __repos: Dict[str, tuple[str, Dict[str, IndexEntry], int] | None]
+
+    def __init__(self, path: str, config: str, mode: str = "stat") -> None: ...
+    def __load_repo(self, directory: str) -> tuple[str, Dict[str, IndexEntry], int] | None:
+        """
+        Load the git index of the work tree containing a directory.
+
+        Parameters
+        ----------
+        directory : str
+            The absolute path of the directory.
+
+        Returns
+        -------
+        Tuple[str, Dict[str, IndexEntry], int] or None
+            The work tree, its index entries by path and the modification time of its index,
+            or ``None`` if the directory isn't inside a git work tree with a readable index.
+        """
+
+    def signature(self, fpath: str) -> Tuple[int, int, int] | str:
+        """
+        Get the cache key of a file.
+
+        Parameters
+        ----------
+        fpath : str
+            The path of the file.
+
+        Returns
+        -------
+        Tuple[int, int, int] or str
+            The blob ID of the file if available in ``"blob"`` mode,
+            otherwise its stat signature.
+        """
+
+    def lookup(
+        self, fpath: str, ext: str, signature: Tuple[int, int, int] | str
+    ) -> CheckResult | None:
+        """
+        Look up the last verdict of a file.
+
+        Parameters
+        ----------
+        fpath : str
+            The path of the file.
+        ext : str
+            The file-type/file-extension.
+        signature : Tuple[int, int, int] or str
+            The current key of the file, as returned by ``signature()``.
+
+        Returns
+        -------
+        CheckResult or None
+            The cached result, or ``None`` if the file or the configuration changed.
+        """
+
+    def store(self, result: CheckResult, signature: Tuple[int, int, int] | str) -> None:
+        """
+        Store the verdict of a file, unless its check failed.
+
+        Parameters
+        ----------
+        result : CheckResult
+            The result of the check.
+        signature : Tuple[int, int, int] or str
+            The key of the file taken before it was checked, as returned by ``signature()``.
+        """
+
+    def close(self) -> None:
+        """Commit all the stored verdicts and close the cache file."""
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -6,8 +6,8 @@ Comment class module for ``vim-eof-comment``.
 Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 """
 
-__all__ = ["generator"]
+__all__ = ["generator", "table"]
 
-from . import generator
+from . import generator, table
 
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
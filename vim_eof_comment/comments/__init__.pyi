@@ -1,5 +1,6 @@
 from . import generator as generator
+from . import table as table
 
-__all__ = ["generator"]
+__all__ = ["generator", "table"]
 
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -6,39 +6,88 @@ Per-filetype modeline comment class.
 Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 """
 
-__all__ = [
-    "Comments",
-    "generate_list_items",
-    "get_extensions",
-    "list_comments",
-    "list_filetypes",
-]
-
-import json
-import os
-from io import TextIOWrapper
-from os.path import exists, isdir, realpath
-from typing import Dict, List, Tuple
+__all__ = ["Comments", "generate_list_items", "get_extensions", "list_comments", "list_filetypes"]
 
-from colorama import Fore, Style
-from colorama import init as color_init
+from functools import lru_cache
+from io import TextIOWrapper
+from os.path import dirname, join
+from typing import Any, Dict, List, Tuple
 
 from ..types import IndentMap
-from ..util import die
+from ..util import die, render_mapping
+from .table import COMMENTS, DEFAULT_MAPS, FORMATS, TEMPLATES
 
 _COMMENT_STR: str = "vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:"
-_JSON_FILE: str = realpath("./vim_eof_comment/comments/filetypes.json")
-_BLUE: int = Fore.BLUE
-_YELLOW: int = Fore.YELLOW
-_CYAN: int = Fore.CYAN
-_BRIGHT: int = Style.BRIGHT
-_RESET: int = Style.RESET_ALL
-_BOLD: int = Style.BRIGHT
+_JSON_FILE: str = join(dirname(__file__), "filetypes.json")
+_TABLE_FILE: str = join(dirname(__file__), "table.py")
+_TABLE_HEADER: str = '''# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+# Generated from `filetypes.json` by `make table`. Do not edit by hand!
+"""
+Precomputed filetype table.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+__all__ = ["COMMENTS", "COMMENT_BYTES", "DEFAULT_MAPS", "FORMATS", "TEMPLATES"]
+
+from types import MappingProxyType
+from typing import Mapping'''
+_BLUE: str = ""
+_YELLOW: str = ""
+_CYAN: str = ""
+_BRIGHT: str = ""
+_RESET: str = ""
+_BOLD: str = ""
+
+
+def _load_colors() -> None:
+    """Import ``colorama`` and load its color codes, only on first use."""
+    global _BLUE, _YELLOW, _CYAN, _BRIGHT, _RESET, _BOLD
+    if _RESET:
+        return
+
+    from colorama import Fore, Style
+
+    _BLUE, _YELLOW, _CYAN = Fore.BLUE, Fore.YELLOW, Fore.CYAN
+    _BRIGHT, _RESET, _BOLD = Style.BRIGHT, Style.RESET_ALL, Style.BRIGHT
+
+
+def _color_init() -> None:
+    """Initialize ``colorama`` and load its color codes."""
+    from colorama import init as color_init
+
+    _load_colors()
+    color_init()
+
+
+def _format_comment(fmt: str, level: int, expandtab: bool) -> str:
+    """
+    Fill the indentation options of a comment format.
+
+    Parameters
+    ----------
+    fmt : str
+        The comment format, as found in ``table.FORMATS``.
+    level : int
+        The indentation level.
+    expandtab : bool
+        Whether spaces are used for indentation.
+
+    Returns
+    -------
+    str
+        The ready-to-use comment.
+    """
+    et, sw = ("et", level) if expandtab else ("noet", 0)
+    return fmt.format(ts=level, sts=level, sw=sw, et=et)
 
 
 def import_json() -> Tuple[Dict[str, str], Dict[str, IndentMap]]:
     """
-    Import default vars from JSON file.
+    Import the default comment formats and indent mappings.
+
+    They are read from the precomputed ``table`` module, every call returns fresh copies.
 
     Returns
     -------
@@ -47,23 +96,35 @@ def import_json() -> Tuple[Dict[str, str], Dict[str, IndentMap]]:
     map_dict : Dict[str, IndentMap]
         The default indent mappings dict.
     """
-    splitter: str = "/" if os.name != "nt" else "\\"
-    split = __file__.split(splitter)
-    length = len(split) - 1
-    parent: str = splitter.join(split[:length])
-    file: TextIOWrapper = open(parent + f"{splitter}filetypes.json", "r")
+    return dict(FORMATS), {
+        k: IndentMap(level=v["level"], expandtab=bool(v["expandtab"]))
+        for k, v in DEFAULT_MAPS.items()
+    }
 
-    data: str = "".join(file.read().split("\n"))
-    file.close()
 
-    result: Tuple[Dict[str, str], Dict[str, IndentMap]] = json.loads(data)
-    comments = result[0]
-    maps = result[1]
+@lru_cache(maxsize=None)
+def _generate_comments(overrides: Tuple[Tuple[str, int, bool], ...]) -> Dict[str, str]:
+    """
+    Generate the comments dictionary for a set of indent overrides, only once per process.
+
+    The precomputed default comments are reused, so only the overridden ones are formatted.
+    The returned dictionary is shared, so it must never be modified.
+
+    Parameters
+    ----------
+    overrides : Tuple[Tuple[str, int, bool], ...]
+        The sorted ``(lang, level, expandtab)`` overrides of the default indent mappings.
 
-    for k, v in comments.items():
-        comments[k] = v.format(comment=_COMMENT_STR)
+    Returns
+    -------
+    Dict[str, str]
+        The generated comments dictionary.
+    """
+    comments: Dict[str, str] = dict(COMMENTS)
+    for lang, level, expandtab in overrides:
+        comments[lang] = _format_comment(FORMATS[lang], level, expandtab)
 
-    return comments, maps
+    return comments
 
 
 class Comments:
@@ -90,6 +151,7 @@ class Comments:
     -------
     __is_available(lang)
     __fill_langs(langs)
+    __get_overrides()
     get_defaults()
     get_ft()
     """
@@ -161,6 +223,27 @@ class Comments:
 
         self.langs = langs.copy()
 
+    def __get_overrides(self) -> Tuple[Tuple[str, int, bool], ...]:
+        """
+        Collect the current indent mappings that differ from the default ones.
+
+        Returns
+        -------
+        Tuple[Tuple[str, int, bool], ...]
+            The sorted ``(lang, level, expandtab)`` overrides, as taken by ``_generate_comments()``.
+        """
+        overrides: List[Tuple[str, int, bool]] = list()
+        for lang, mapping in self.langs.items():
+            default = self.__DEFAULT.get(lang)
+            if default is None:
+                continue
+
+            level, expandtab = mapping["level"], bool(mapping.get("expandtab", True))
+            if (level, expandtab) != (default["level"], bool(default["expandtab"])):
+                overrides.append((lang, level, expandtab))
+
+        return tuple(sorted(overrides))
+
     def get_defaults(self) -> Dict[str, IndentMap]:
         """
         Retrieve the default comment dictionary.
@@ -176,22 +259,15 @@ class Comments:
         """
         Generate the comments list.
 
+        The result is memoized per process for every set of indent overrides, which are
+        computed from the current ``langs`` on every call.
+
         Returns
         -------
         Dict[str, str]
             The customly generated comments dictionary.
         """
-        comments: Dict[str, str] = dict()
-        for lang, fmt in self.formats.items():
-            lvl, expandtab = self.langs[lang]["level"], self.langs[lang]["expandtab"]
-            et, sw = "noet", 0
-
-            if expandtab:
-                et, sw = "et", lvl
-
-            comments[lang] = fmt.format(ts=lvl, sts=lvl, sw=sw, et=et)
-
-        self.comments: Dict[str, str] = comments.copy()
+        self.comments: Dict[str, str] = _generate_comments(self.__get_overrides()).copy()
         return self.comments
 
     def get_ft(self, ext: str) -> str | None:
@@ -230,6 +306,8 @@ def generate_list_items(ft: str, level: int, expandtab: str) -> str:
     str
         The generated string.
     """
+    _load_colors()
+
     txt = f"{_RESET}{_BRIGHT}{_BLUE}{ft}\n"
     txt += f"   {_RESET}{_BRIGHT}indent size{_RESET}{_BRIGHT} ==> {_CYAN}{level}\n"
     txt += f"   {_RESET}{_BRIGHT}expandtab{_RESET}{_BRIGHT} ==> {_CYAN}{expandtab}"
@@ -253,7 +331,7 @@ def list_comments(exts: List[str]) -> None:
     ValueError
         Raised when a given extension is not supported.
     """
-    color_init()
+    _color_init()
 
     formats: Dict[str, str] = Comments().formats
     max_len: int = 0
@@ -296,13 +374,13 @@ def get_extensions() -> List[str]:
     List[str]
         List of strings with all the available file extensions.
     """
-    res: List[str] = [ext for ext in Comments().get_defaults().keys()]
+    res: List[str] = [ext for ext in DEFAULT_MAPS.keys()]
     return res
 
 
 def list_filetypes() -> None:
     """List all available filetypes, then stop command execution."""
-    color_init()
+    _color_init()
 
     defaults = Comments().get_defaults()
     items: Dict[str, Tuple[int, str]] = dict()
@@ -321,12 +399,13 @@ def list_filetypes() -> None:
 
 
 def export_json() -> None:
-    """Export default vars to JSON."""
-    if not (exists("./vim_eof_comment/comments") and isdir("./vim_eof_comment/comments")):
-        return
+    """Export the default comment templates and indent mappings to ``filetypes.json``."""
+    import json
 
     try:
-        data: str = json.dumps(import_json(), ensure_ascii=False)
+        data: str = json.dumps(
+            [dict(TEMPLATES), {k: dict(v) for k, v in DEFAULT_MAPS.items()}], ensure_ascii=False
+        )
     except KeyboardInterrupt:
         die(code=1)
     except Exception:
@@ -344,4 +423,39 @@ def export_json() -> None:
     file.close()
 
 
+def export_table() -> None:
+    """
+    Compile ``filetypes.json`` into the ``table`` module.
+
+    The generated module holds frozen dictionaries of the comment templates and formats,
+    the default indent mappings, and the ready-to-use default comments (also encoded),
+    so importing it needs neither JSON parsing nor any string formatting.
+    """
+    import json
+
+    with open(_JSON_FILE, "r") as file:
+        data: List[Dict[str, Any]] = json.load(file)
+
+    templates: Dict[str, str] = data[0]
+    maps: Dict[str, Dict[str, Any]] = data[1]
+
+    formats = {k: v.format(comment=_COMMENT_STR) for k, v in templates.items()}
+    comments = {
+        k: _format_comment(v, maps[k]["level"], maps[k]["expandtab"]) for k, v in formats.items()
+    }
+    encoded = {k: v.encode("utf-8") for k, v in comments.items()}
+
+    blocks: List[str] = [
+        _TABLE_HEADER,
+        render_mapping("TEMPLATES", "Mapping[str, str]", templates),
+        render_mapping("FORMATS", "Mapping[str, str]", formats),
+        render_mapping("DEFAULT_MAPS", "Mapping[str, Mapping[str, int]]", maps),
+        render_mapping("COMMENTS", "Mapping[str, str]", comments),
+        render_mapping("COMMENT_BYTES", "Mapping[str, bytes]", encoded),
+        "# vim: set ts=4 sts=4 sw=4 et ai si sta:\n",
+    ]
+    with open(_TABLE_FILE, "w") as file:
+        file.write("\n\n".join(blocks))
+
+
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
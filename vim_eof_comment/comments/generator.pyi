@@ -26,6 +26,7 @@ class Comments:
     -------
     __is_available(lang)
     __fill_langs(langs)
+    __get_overrides()
     get_defaults()
     get_ft()
     """
@@ -66,6 +67,15 @@ class Comments:
         langs : Dict[str, IndentMap]
             A dictionary of ``IndentMap`` type objects.
         """
+    def __get_overrides(self) -> tuple[tuple[str, int, bool], ...]:
+        """
+        Collect the current indent mappings that differ from the default ones.
+
+        Returns
+        -------
+        Tuple[Tuple[str, int, bool], ...]
+            The sorted ``(lang, level, expandtab)`` overrides, as taken by ``_generate_comments()``.
+        """
     def get_defaults(self) -> dict[str, IndentMap]:
         """
         Retrieve the default comment dictionary.
@@ -79,6 +89,9 @@ class Comments:
         """
         Generate the comments list.
 
+        The result is memoized per process for every set of indent overrides, which are
+        computed from the current ``langs`` on every call.
+
         Returns
         -------
         Dict[str, str]
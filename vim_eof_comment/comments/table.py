@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+# Generated from `filetypes.json` by `make table`. Do not edit by hand!
+"""
+Precomputed filetype table.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+__all__ = ["COMMENTS", "COMMENT_BYTES", "DEFAULT_MAPS", "FORMATS", "TEMPLATES"]
+
+from types import MappingProxyType
+from typing import Mapping
+
+TEMPLATES: Mapping[str, str] = MappingProxyType(
+    {
+        "BSDmakefile": "# {comment}",
+        "C": "/* {comment} */",
+        "H": "/* {comment} */",
+        "Makefile": "# {comment}",
+        "bash": "# {comment}",
+        "c": "/* {comment} */",
+        "c++": "/* {comment} */",
+        "cc": "/* {comment} */",
+        "coffee": "# {comment}",
+        "cpp": "/* {comment} */",
+        "cson": "# {comment}",
+        "css": "/* {comment} */",
+        "fish": "# {comment}",
+        "h": "/* {comment} */",
+        "hh": "/* {comment} */",
+        "hpp": "/* {comment} */",
+        "htm": "<!-- {comment} -->",
+        "html": "<!-- {comment} -->",
+        "javascript": "/* {comment} */",
+        "javascriptreact": "/* {comment} */",
+        "jl": "# {comment}",
+        "js": "/* {comment} */",
+        "jsonc": "/* {comment} */",
+        "jsx": "/* {comment} */",
+        "julia": "# {comment}",
+        "latex": "% {comment}",
+        "litcoffee": "# {comment}",
+        "lua": "-- {comment}",
+        "make": "# {comment}",
+        "markdown": "<!-- {comment} -->",
+        "md": "<!-- {comment} -->",
+        "mk": "# {comment}",
+        "py": "# {comment}",
+        "pyi": "# {comment}",
+        "python": "# {comment}",
+        "rb": "# {comment}",
+        "rs": "/* {comment} */",
+        "ruby": "# {comment}",
+        "rust": "/* {comment} */",
+        "sh": "# {comment}",
+        "tex": "% {comment}",
+        "toml": "# {comment}",
+        "ts": "/* {comment} */",
+        "tsx": "/* {comment} */",
+        "typescript": "/* {comment} */",
+        "typescriptreact": "/* {comment} */",
+        "xhtml": "<!-- {comment} -->",
+        "xml": "<!-- {comment} -->",
+        "yaml": "# {comment}",
+        "yml": "# {comment}",
+        "zsh": "# {comment}",
+    }
+)
+
+FORMATS: Mapping[str, str] = MappingProxyType(
+    {
+        "BSDmakefile": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "C": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "H": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "Makefile": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "bash": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "c": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "c++": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "cc": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "coffee": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "cpp": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "cson": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "css": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "fish": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "h": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "hh": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "hpp": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "htm": "<!-- vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: -->",
+        "html": "<!-- vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: -->",
+        "javascript": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "javascriptreact": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "jl": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "js": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "jsonc": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "jsx": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "julia": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "latex": "% vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "litcoffee": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "lua": "-- vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "make": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "markdown": "<!-- vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: -->",
+        "md": "<!-- vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: -->",
+        "mk": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "py": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "pyi": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "python": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "rb": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "rs": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "ruby": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "rust": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "sh": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "tex": "% vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "toml": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "ts": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "tsx": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "typescript": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "typescriptreact": "/* vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: */",
+        "xhtml": "<!-- vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: -->",
+        "xml": "<!-- vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta: -->",
+        "yaml": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "yml": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+        "zsh": "# vim: set ts={ts} sts={sts} sw={sw} {et} ai si sta:",
+    }
+)
+
+DEFAULT_MAPS: Mapping[str, Mapping[str, int]] = MappingProxyType(
+    {
+        "BSDmakefile": MappingProxyType({"level": 4, "expandtab": False}),
+        "C": MappingProxyType({"level": 2, "expandtab": True}),
+        "H": MappingProxyType({"level": 2, "expandtab": True}),
+        "Makefile": MappingProxyType({"level": 4, "expandtab": False}),
+        "bash": MappingProxyType({"level": 4, "expandtab": True}),
+        "c": MappingProxyType({"level": 2, "expandtab": True}),
+        "c++": MappingProxyType({"level": 2, "expandtab": True}),
+        "cc": MappingProxyType({"level": 2, "expandtab": True}),
+        "coffee": MappingProxyType({"level": 4, "expandtab": True}),
+        "cpp": MappingProxyType({"level": 2, "expandtab": True}),
+        "cson": MappingProxyType({"level": 4, "expandtab": True}),
+        "css": MappingProxyType({"level": 4, "expandtab": True}),
+        "fish": MappingProxyType({"level": 4, "expandtab": True}),
+        "h": MappingProxyType({"level": 2, "expandtab": True}),
+        "hh": MappingProxyType({"level": 2, "expandtab": True}),
+        "hpp": MappingProxyType({"level": 2, "expandtab": True}),
+        "htm": MappingProxyType({"level": 2, "expandtab": True}),
+        "html": MappingProxyType({"level": 2, "expandtab": True}),
+        "javascript": MappingProxyType({"level": 4, "expandtab": True}),
+        "javascriptreact": MappingProxyType({"level": 4, "expandtab": True}),
+        "jl": MappingProxyType({"level": 4, "expandtab": True}),
+        "js": MappingProxyType({"level": 4, "expandtab": True}),
+        "jsonc": MappingProxyType({"level": 4, "expandtab": True}),
+        "jsx": MappingProxyType({"level": 4, "expandtab": True}),
+        "julia": MappingProxyType({"level": 4, "expandtab": True}),
+        "latex": MappingProxyType({"level": 2, "expandtab": True}),
+        "litcoffee": MappingProxyType({"level": 4, "expandtab": True}),
+        "lua": MappingProxyType({"level": 4, "expandtab": True}),
+        "make": MappingProxyType({"level": 4, "expandtab": False}),
+        "markdown": MappingProxyType({"level": 2, "expandtab": True}),
+        "md": MappingProxyType({"level": 2, "expandtab": True}),
+        "mk": MappingProxyType({"level": 4, "expandtab": False}),
+        "py": MappingProxyType({"level": 4, "expandtab": True}),
+        "pyi": MappingProxyType({"level": 4, "expandtab": True}),
+        "python": MappingProxyType({"level": 4, "expandtab": True}),
+        "rb": MappingProxyType({"level": 2, "expandtab": True}),
+        "rs": MappingProxyType({"level": 4, "expandtab": True}),
+        "ruby": MappingProxyType({"level": 2, "expandtab": True}),
+        "rust": MappingProxyType({"level": 4, "expandtab": True}),
+        "sh": MappingProxyType({"level": 4, "expandtab": True}),
+        "tex": MappingProxyType({"level": 2, "expandtab": True}),
+        "toml": MappingProxyType({"level": 4, "expandtab": True}),
+        "ts": MappingProxyType({"level": 4, "expandtab": True}),
+        "tsx": MappingProxyType({"level": 4, "expandtab": True}),
+        "typescript": MappingProxyType({"level": 4, "expandtab": True}),
+        "typescriptreact": MappingProxyType({"level": 4, "expandtab": True}),
+        "xhtml": MappingProxyType({"level": 2, "expandtab": True}),
+        "xml": MappingProxyType({"level": 2, "expandtab": True}),
+        "yaml": MappingProxyType({"level": 2, "expandtab": True}),
+        "yml": MappingProxyType({"level": 2, "expandtab": True}),
+        "zsh": MappingProxyType({"level": 4, "expandtab": True}),
+    }
+)
+
+COMMENTS: Mapping[str, str] = MappingProxyType(
+    {
+        "BSDmakefile": "# vim: set ts=4 sts=4 sw=0 noet ai si sta:",
+        "C": "/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "H": "/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "Makefile": "# vim: set ts=4 sts=4 sw=0 noet ai si sta:",
+        "bash": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "c": "/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "c++": "/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "cc": "/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "coffee": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "cpp": "/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "cson": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "css": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "fish": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "h": "/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "hh": "/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "hpp": "/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "htm": "<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "html": "<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "javascript": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "javascriptreact": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "jl": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "js": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "jsonc": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "jsx": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "julia": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "latex": "% vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "litcoffee": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "lua": "-- vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "make": "# vim: set ts=4 sts=4 sw=0 noet ai si sta:",
+        "markdown": "<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "md": "<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "mk": "# vim: set ts=4 sts=4 sw=0 noet ai si sta:",
+        "py": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "pyi": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "python": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "rb": "# vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "rs": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "ruby": "# vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "rust": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "sh": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "tex": "% vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "toml": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "ts": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "tsx": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "typescript": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "typescriptreact": "/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "xhtml": "<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "xml": "<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "yaml": "# vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "yml": "# vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "zsh": "# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+    }
+)
+
+COMMENT_BYTES: Mapping[str, bytes] = MappingProxyType(
+    {
+        "BSDmakefile": b"# vim: set ts=4 sts=4 sw=0 noet ai si sta:",
+        "C": b"/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "H": b"/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "Makefile": b"# vim: set ts=4 sts=4 sw=0 noet ai si sta:",
+        "bash": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "c": b"/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "c++": b"/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "cc": b"/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "coffee": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "cpp": b"/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "cson": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "css": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "fish": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "h": b"/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "hh": b"/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "hpp": b"/* vim: set ts=2 sts=2 sw=2 et ai si sta: */",
+        "htm": b"<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "html": b"<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "javascript": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "javascriptreact": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "jl": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "js": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "jsonc": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "jsx": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "julia": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "latex": b"% vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "litcoffee": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "lua": b"-- vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "make": b"# vim: set ts=4 sts=4 sw=0 noet ai si sta:",
+        "markdown": b"<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "md": b"<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "mk": b"# vim: set ts=4 sts=4 sw=0 noet ai si sta:",
+        "py": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "pyi": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "python": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "rb": b"# vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "rs": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "ruby": b"# vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "rust": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "sh": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "tex": b"% vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "toml": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+        "ts": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "tsx": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "typescript": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "typescriptreact": b"/* vim: set ts=4 sts=4 sw=4 et ai si sta: */",
+        "xhtml": b"<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "xml": b"<!-- vim: set ts=2 sts=2 sw=2 et ai si sta: -->",
+        "yaml": b"# vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "yml": b"# vim: set ts=2 sts=2 sw=2 et ai si sta:",
+        "zsh": b"# vim: set ts=4 sts=4 sw=4 et ai si sta:",
+    }
+)
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -0,0 +1,11 @@
+from typing import Mapping
+
+__all__ = ["COMMENTS", "COMMENT_BYTES", "DEFAULT_MAPS", "FORMATS", "TEMPLATES"]
+
+TEMPLATES: Mapping[str, str]
+FORMATS: Mapping[str, str]
+DEFAULT_MAPS: Mapping[str, Mapping[str, int]]
+COMMENTS: Mapping[str, str]
+COMMENT_BYTES: Mapping[str, bytes]
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
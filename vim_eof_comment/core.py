@@ -7,26 +7,810 @@ Ensure EOF Vim comment in specific filetypes.
 Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 """
 
-__all__ = ["append_eof_comment", "eof_comment_search", "main"]
+__all__ = [
+    "append_eof_comment",
+    "check_paths",
+    "check_tree",
+    "eof_comment_search",
+    "fix_paths",
+    "fix_tree",
+    "main",
+    "process_tree",
+]
 
+from collections import deque
+from contextlib import nullcontext
+from functools import partial
 from io import TextIOWrapper
-from typing import Dict, List, Tuple
-
-from colorama import Fore, Style
-from colorama import init as color_init
+from itertools import chain, islice
+from locale import getpreferredencoding
+from os import stat
+from os.path import getsize
+from sys import stderr, stdin, stdout
+from threading import BoundedSemaphore
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
 
 from .args.parsing import arg_parser_init, indent_handler
+from .cache import ScanCache, config_hash
 from .comments.generator import Comments, list_comments, list_filetypes
-from .file import bootstrap_paths, get_last_line, modify_file, open_batch_paths
+from .file import (
+    DEFAULT_MAX_OPEN,
+    ENGINES,
+    MMAP_THRESHOLD,
+    encode_comments,
+    filter_stream,
+    get_last_line,
+    io_counters,
+    iter_changed_paths,
+    iter_file_list,
+    iter_paths,
+    iter_tracked_paths,
+    looks_binary,
+    modify_file_tail,
+    modify_tail_bytes,
+    search_tail_bytes,
+    sniff_encoding,
+    tail_matches,
+)
+from .hooks import callbacks, emit, verdict
 from .regex import matches
-from .types import BatchPathDict, EOFCommentSearch, IndentHandler, IOWrapperBool
-from .util import die, gen_indent_maps, verbose_print
+from .stats import RunStats, format_stats, measure, measure_iter
+from .types import (
+    BatchPairDict,
+    BatchPathDict,
+    CheckResult,
+    EOFCommentSearch,
+    IndentHandler,
+    IOWrapperBool,
+)
+from .util import die, error, gen_indent_maps, verbose_print
 from .version import __version__, list_versions, version_print
+from .watch import watch_paths
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+_RED: str = ""
+_GREEN: str = ""
+_BRIGHT: str = ""
+_RESET: str = ""
+
+_PROCESS_BATCH_SIZE: int = 256
+_ASYNC_BATCH_SIZE: int = 256
+_ASYNC_CONCURRENCY: int = 8
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_CompactResult = Tuple[str, str, Tuple[bool, bool, bool] | None, str | None, str | None]
+_Signature = Tuple[int, int, int] | str
+_EncodedMap = Dict[str, Dict[bytes, bytes]]
+_Trace = Tuple[str, str, int, float]
+
+
+def _ordered_map(
+    func: Callable[[_T], _R], items: Iterable[_T], jobs: int, executor: str = "thread"
+) -> Iterator[_R]:
+    """
+    Lazily map a function over the given items using a worker pool, keeping their order.
+
+    Only a bounded amount of items is submitted ahead of the one being yielded.
+
+    Parameters
+    ----------
+    func : Callable[[_T], _R]
+        The function to be called for every item.
+    items : Iterable[_T]
+        The items to be processed.
+    jobs : int
+        The amount of workers. If it's ``1`` no pool is used at all.
+    executor : {"thread", "process"}, optional, default="thread"
+        The kind of worker pool to be used.
 
-_RED: int = Fore.LIGHTRED_EX
-_GREEN: int = Fore.LIGHTGREEN_EX
-_BRIGHT: int = Style.BRIGHT
-_RESET: int = Style.RESET_ALL
+    Yields
+    ------
+    _R
+        The result of every call, in the same order as ``items``.
+    """
+    if jobs <= 1:
+        yield from map(func, items)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    pool_type: Callable[..., Executor] = (
+        ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    )
+    with pool_type(max_workers=jobs) as pool:
+        pending: Deque[Future[_R]] = deque()
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def _batched(items: Iterable[_T], size: int) -> Iterator[List[_T]]:
+    """
+    Lazily split the given items into lists of at most ``size`` elements.
+
+    Parameters
+    ----------
+    items : Iterable[_T]
+        The items to be split.
+    size : int
+        The maximum size of each batch.
+
+    Yields
+    ------
+    List[_T]
+        The next batch of items.
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def _aiter_blocking(items: Iterable[_T]) -> AsyncIterator[_T]:
+    """
+    Asynchronously iterate over a blocking iterable, fetching its items in a worker thread.
+
+    Parameters
+    ----------
+    items : Iterable[_T]
+        The blocking iterable (e.g. a directory walk).
+
+    Yields
+    ------
+    _T
+        The next item of the iterable.
+    """
+    import asyncio
+
+    iterator = iter(items)
+    while batch := await asyncio.to_thread(lambda: list(islice(iterator, _ASYNC_BATCH_SIZE))):
+        for item in batch:
+            yield item
+
+
+async def _aordered_map(
+    func: Callable[[_T], _R], items: AsyncIterable[_T], concurrency: int
+) -> AsyncIterator[_R]:
+    """
+    Lazily map a blocking function over the given items in worker threads, keeping their order.
+
+    Parameters
+    ----------
+    func : Callable[[_T], _R]
+        The blocking function to be called for every item.
+    items : AsyncIterable[_T]
+        The items to be processed.
+    concurrency : int
+        The maximum amount of calls running at the same time.
+
+    Yields
+    ------
+    _R
+        The result of every call, in the same order as ``items``.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: _T) -> _R:
+        async with semaphore:
+            return await asyncio.to_thread(func, item)
+
+    pending: Deque[asyncio.Task[_R]] = deque()
+    try:
+        async for item in items:
+            pending.append(asyncio.create_task(run(item)))
+            if len(pending) >= 2 * concurrency:
+                yield await pending.popleft()
+
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _check_file(
+    fpath: str, file: TextIOWrapper, ext: str, comment_map: Dict[str, str], newline: bool
+) -> CheckResult:
+    """
+    Check a single opened file, closing it afterwards.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+    file : TextIOWrapper
+        The opened file.
+    ext : str
+        The file-type/file-extension.
+    comment_map : Dict[str, str]
+        The generated comments dictionary.
+    newline : bool
+        Whether a newline is required before the comment.
+
+    Returns
+    -------
+    CheckResult
+        The result of the check.
+    """
+    last_line, had_nwl, crlf = get_last_line(file)
+    if last_line == comment_map[ext] and (had_nwl or not newline):
+        return CheckResult(fpath=fpath, ft_ext=ext, search=None)
+
+    search = EOFCommentSearch(
+        state=IOWrapperBool(file=None, had_nwl=had_nwl, crlf=crlf),
+        lang=ext,
+        match=matches(last_line),
+    )
+    return CheckResult(fpath=fpath, ft_ext=ext, search=search)
+
+
+def _check_large_file(
+    fpath: str, ext: str, comment_map: Dict[str, str], newline: bool, encoding: str
+) -> CheckResult:
+    """
+    Check a file too large to be decoded in full.
+
+    The tail of the file is compared against the encoded comment through ``mmap`` first,
+    and only decoded if that isn't enough to tell the file is correct.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+    ext : str
+        The file-type/file-extension.
+    comment_map : Dict[str, str]
+        The generated comments dictionary.
+    newline : bool
+        Whether a newline is required before the comment.
+    encoding : str
+        The encoding of the file, as returned by ``sniff_encoding()``.
+
+    Returns
+    -------
+    CheckResult
+        The result of the check.
+
+    Raises
+    ------
+    UnicodeDecodeError
+        If the tail of the file can't be decoded.
+    """
+    comment: bytes = comment_map[ext].encode("utf-8" if encoding == "utf-8-sig" else encoding)
+    if tail_matches(fpath, comment, newline):
+        return CheckResult(fpath=fpath, ft_ext=ext, search=None)
+
+    with open(fpath, "r", encoding=encoding) as file:
+        return _check_file(fpath, file, ext, comment_map, newline)
+
+
+def _check_path(
+    path: BatchPairDict,
+    comment_map: Dict[str, str],
+    newline: bool,
+    gate: BoundedSemaphore,
+    cache: ScanCache | None = None,
+    encoded: _EncodedMap | None = None,
+    stats: RunStats | None = None,
+) -> CheckResult | None:
+    """
+    Open and check a single file, catching any I/O error.
+
+    Parameters
+    ----------
+    path : BatchPairDict
+        The ``BatchPairDict`` object of the file.
+    comment_map : Dict[str, str]
+        The generated comments dictionary.
+    newline : bool
+        Whether a newline is required before the comment.
+    gate : threading.BoundedSemaphore
+        The semaphore limiting the amount of opened files.
+    cache : ScanCache, optional, default=None
+        The scan cache. If the file didn't change since its last check it isn't opened at all.
+    encoded : Dict[str, Dict[bytes, bytes]], optional, default=None
+        The encoded comments returned by ``encode_comments()``. If given, the file is checked
+        by the byte-level engine and never decoded.
+    stats : RunStats, optional, default=None
+        Where the time spent opening and checking the file is added.
+
+    Returns
+    -------
+    CheckResult or None
+        The result of the check, or ``None`` if the file can't be decoded.
+    """
+    fpath, ext = path.fpath, path.ft_ext
+    try:
+        signature: _Signature | None = None
+        if cache is not None:
+            signature = cache.signature(fpath)
+            cached = cache.lookup(fpath, ext, signature)
+            if cached is not None:
+                if stats is not None:
+                    stats.add_cached()
+
+                return cached
+
+        with gate:
+            if encoded is not None:
+                with measure(stats, "open"):
+                    binary = looks_binary(fpath)
+
+                if binary:
+                    return None
+
+                with measure(stats, "check"):
+                    search = search_tail_bytes(fpath, ext, encoded[ext], newline)
+
+                result = CheckResult(fpath=fpath, ft_ext=ext, search=search)
+            else:
+                file: TextIOWrapper | None = None
+                with measure(stats, "open"):
+                    encoding = sniff_encoding(fpath)
+                    if encoding is not None and getsize(fpath) < MMAP_THRESHOLD:
+                        file = open(fpath, "r", encoding=encoding)
+
+                if encoding is None:
+                    return None
+
+                try:
+                    with measure(stats, "check"):
+                        if file is None:
+                            result = _check_large_file(fpath, ext, comment_map, newline, encoding)
+                        else:
+                            result = _check_file(fpath, file, ext, comment_map, newline)
+                finally:
+                    if file is not None:
+                        file.close()
+
+                result.encoding = encoding
+    except UnicodeDecodeError:
+        return None
+    except FileNotFoundError:
+        return CheckResult(fpath, ext, None, error=f"File `{fpath}` is not available!")
+    except OSError:
+        return CheckResult(
+            fpath, ext, None, error=f"Something went wrong while trying to open `{fpath}`!"
+        )
+    except ValueError as e:
+        return CheckResult(fpath, ext, None, error=f"Unable to check `{fpath}`: {e}")
+
+    if cache is not None and signature is not None:
+        cache.store(result, signature)
+
+    return result
+
+
+def _fix_result(
+    result: CheckResult,
+    comment_map: Dict[str, str],
+    newline: bool,
+    gate: BoundedSemaphore,
+    cache: ScanCache | None = None,
+    encoded: _EncodedMap | None = None,
+    stats: RunStats | None = None,
+) -> CheckResult:
+    """
+    Modify the file of a single check result if needed, catching any I/O error.
+
+    Parameters
+    ----------
+    result : CheckResult
+        The result of the check.
+    comment_map : Dict[str, str]
+        The generated comments dictionary.
+    newline : bool
+        Whether a newline is required before the comment.
+    gate : threading.BoundedSemaphore
+        The semaphore limiting the amount of opened files.
+    cache : ScanCache, optional, default=None
+        The scan cache, where the modified file is recorded as up to date.
+    encoded : Dict[str, Dict[bytes, bytes]], optional, default=None
+        The encoded comments returned by ``encode_comments()``. If given, the file is patched
+        by the byte-level engine and never decoded.
+    stats : RunStats, optional, default=None
+        Where the time spent modifying the file is added.
+
+    Returns
+    -------
+    CheckResult
+        The same result, with its ``error`` set if the file couldn't be modified or
+        re-encoded.
+    """
+    search = result.search
+    if search is None:
+        return result
+
+    try:
+        with gate, measure(stats, "write"):
+            if encoded is not None:
+                modify_tail_bytes(
+                    result.fpath, encoded[result.ft_ext], newline=newline, matching=search.match
+                )
+            else:
+                modify_file_tail(
+                    result.fpath,
+                    comment_map[result.ft_ext],
+                    newline=newline,
+                    had_nwl=search.state.had_nwl,
+                    matching=search.match,
+                    crlf=search.state.crlf,
+                    encoding=result.encoding or getpreferredencoding(False),
+                )
+
+        if cache is not None:
+            fixed = CheckResult(result.fpath, result.ft_ext, None)
+            cache.store(fixed, cache.signature(result.fpath))
+    except OSError:
+        result.error = f"Something went wrong while trying to modify `{result.fpath}`!"
+    except ValueError as e:  # Also covers the file no longer being decodable
+        result.error = f"Unable to modify `{result.fpath}`: {e}"
+
+    return result
+
+
+def _traced_check(
+    check: Callable[[BatchPairDict], CheckResult | None], path: BatchPairDict
+) -> Tuple[CheckResult | None, _Trace]:
+    """
+    Run a check, measuring the bytes it reads and the time it takes.
+
+    Parameters
+    ----------
+    check : Callable[[BatchPairDict], CheckResult or None]
+        The check to be run (e.g. a partial ``_check_path()`` call).
+    path : BatchPairDict
+        The ``BatchPairDict`` object of the file.
+
+    Returns
+    -------
+    result : CheckResult or None
+        The result of the check.
+    trace : Tuple[str, str, int, float]
+        The arguments of the ``on_file_checked`` hooks.
+    """
+    start, read = perf_counter(), io_counters()[0]
+    result = check(path)
+    read = io_counters()[0] - read
+    return result, (path.fpath, verdict(result), read, perf_counter() - start)
+
+
+def _hooked_check(
+    check: Callable[[BatchPairDict], CheckResult | None], path: BatchPairDict
+) -> CheckResult | None:
+    """
+    Run a check, emitting the ``on_file_checked`` hooks.
+
+    Parameters
+    ----------
+    check : Callable[[BatchPairDict], CheckResult or None]
+        The check to be run (e.g. a partial ``_check_path()`` call).
+    path : BatchPairDict
+        The ``BatchPairDict`` object of the file.
+
+    Returns
+    -------
+    CheckResult or None
+        The result of the check.
+    """
+    result, trace = _traced_check(check, path)
+    emit(callbacks("on_file_checked"), *trace)
+
+    return result
+
+
+def _hooked_fix(fix: Callable[[CheckResult], CheckResult], result: CheckResult) -> CheckResult:
+    """
+    Run a fix, emitting the ``on_file_written`` hooks if the file was modified.
+
+    Parameters
+    ----------
+    fix : Callable[[CheckResult], CheckResult]
+        The fix to be run (e.g. a partial ``_fix_result()`` call).
+    result : CheckResult
+        The result of the check.
+
+    Returns
+    -------
+    CheckResult
+        The result returned by the fix.
+    """
+    start, written = perf_counter(), io_counters()[1]
+    fixed = fix(result)
+    if fixed.changed and fixed.error is None:
+        written = io_counters()[1] - written
+        elapsed = perf_counter() - start
+        emit(callbacks("on_file_written"), fixed.fpath, written, elapsed)
+
+    return fixed
+
+
+def _encode_engine(engine: str, comment_map: Dict[str, str]) -> _EncodedMap | None:
+    """
+    Prepare the comments needed by the given engine.
+
+    Parameters
+    ----------
+    engine : str
+        Either ``"text"`` or ``"bytes"``.
+    comment_map : Dict[str, str]
+        The generated comments dictionary.
+
+    Returns
+    -------
+    Dict[str, Dict[bytes, bytes]] or None
+        The encoded comments for the byte-level engine, or ``None`` for the text engine.
+
+    Raises
+    ------
+    ValueError
+        If the engine is unknown.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine `{engine}`")
+
+    return encode_comments(comment_map) if engine == "bytes" else None
+
+
+def _compact(result: CheckResult) -> _CompactResult:
+    """
+    Convert a check result into a tuple that is cheap to send between processes.
+
+    Parameters
+    ----------
+    result : CheckResult
+        The result to be converted.
+
+    Returns
+    -------
+    Tuple[str, str, Tuple[bool, bool, bool] or None, str or None, str or None]
+        The path, file extension, ``(had_nwl, crlf, match)`` flags, error and encoding
+        of the result.
+    """
+    search = result.search
+    if search is None:
+        return (result.fpath, result.ft_ext, None, result.error, result.encoding)
+
+    return (
+        result.fpath,
+        result.ft_ext,
+        (search.state.had_nwl, search.state.crlf, search.match),
+        result.error,
+        result.encoding,
+    )
+
+
+def _expand(compact: _CompactResult) -> CheckResult:
+    """
+    Convert a tuple generated by ``_compact()`` back into a check result.
+
+    Parameters
+    ----------
+    compact : Tuple[str, str, Tuple[bool, bool, bool] or None, str or None, str or None]
+        The compact result.
+
+    Returns
+    -------
+    CheckResult
+        The restored result.
+    """
+    fpath, ext, flags, err, encoding = compact
+    if flags is None:
+        return CheckResult(fpath, ext, None, error=err, encoding=encoding)
+
+    had_nwl, crlf, match = flags
+    search = EOFCommentSearch(
+        state=IOWrapperBool(file=None, had_nwl=had_nwl, crlf=crlf), lang=ext, match=match
+    )
+    return CheckResult(fpath, ext, search, error=err, encoding=encoding)
+
+
+def _check_batch(
+    batch: List[Tuple[str, str, _CompactResult | None]],
+    comment_map: Dict[str, str],
+    newline: bool,
+    encoded: _EncodedMap | None = None,
+    measured: bool = False,
+    traced: bool = False,
+) -> Tuple[List[_CompactResult], RunStats | None, List[_Trace] | None]:
+    """
+    Check a batch of files inside a worker process.
+
+    Parameters
+    ----------
+    batch : List[Tuple[str, str, Tuple or None]]
+        The path, file extension and cached compact result (if any) of every file in the batch.
+    comment_map : Dict[str, str]
+        The generated comments dictionary.
+    newline : bool
+        Whether a newline is required before the comment.
+    encoded : Dict[str, Dict[bytes, bytes]], optional, default=None
+        The encoded comments, if the byte-level engine is used.
+    measured : bool, optional, default=False
+        Whether to measure the phases of the checks.
+    traced : bool, optional, default=False
+        Whether to record the arguments of the ``on_file_checked`` hooks, which are emitted
+        by the parent process.
+
+    Returns
+    -------
+    results : List[Tuple[str, str, Tuple[bool, bool, bool] or None, str or None]]
+        The compact results of the files that could be decoded.
+    stats : RunStats or None
+        The timings of the checks and the amount of skipped files, if measured.
+    traces : List[Tuple[str, str, int, float]] or None
+        The arguments of the ``on_file_checked`` hooks for every file, if traced.
+    """
+    gate = BoundedSemaphore(1)
+    stats: RunStats | None = RunStats() if measured else None
+    traces: List[_Trace] | None = list() if traced else None
+    check = partial(
+        _check_path,
+        comment_map=comment_map,
+        newline=newline,
+        gate=gate,
+        encoded=encoded,
+        stats=stats,
+    )
+    results: List[_CompactResult] = list()
+    for fpath, ext, cached in batch:
+        if cached is not None:
+            results.append(cached)
+            if traces is not None:
+                traces.append((fpath, verdict(_expand(cached)), 0, 0.0))
+
+            continue
+
+        path = BatchPairDict(fpath=fpath, ft_ext=ext)
+        if traces is not None:
+            result, trace = _traced_check(check, path)
+            traces.append(trace)
+        else:
+            result = check(path)
+
+        if result is not None:
+            results.append(_compact(result))
+        elif stats is not None:
+            stats.count_check(None)
+
+    return results, stats, traces
+
+
+def _lookup_batches(
+    paths: Iterable[BatchPairDict],
+    cache: ScanCache | None,
+    signatures: Dict[str, _Signature],
+    stats: RunStats | None = None,
+) -> Iterator[List[Tuple[str, str, _CompactResult | None]]]:
+    """
+    Lazily split the given files into batches for ``_check_batch()``, looking them up in the cache.
+
+    Parameters
+    ----------
+    paths : Iterable[BatchPairDict]
+        The ``BatchPairDict`` objects of the files to be checked.
+    cache : ScanCache or None
+        The scan cache, if any.
+    signatures : Dict[str, Tuple[int, int, int] or str]
+        Where the cache keys of the files missing from the cache are recorded.
+    stats : RunStats, optional, default=None
+        Where the cache hits are counted.
+
+    Yields
+    ------
+    List[Tuple[str, str, Tuple or None]]
+        The next batch of files.
+    """
+
+    def lookup(path: BatchPairDict) -> Tuple[str, str, _CompactResult | None]:
+        if cache is None:
+            return (path.fpath, path.ft_ext, None)
+
+        try:
+            signature = cache.signature(path.fpath)
+        except OSError:
+            return (path.fpath, path.ft_ext, None)
+
+        cached = cache.lookup(path.fpath, path.ft_ext, signature)
+        if cached is not None:
+            if stats is not None:
+                stats.add_cached()
+
+            return (path.fpath, path.ft_ext, _compact(cached))
+
+        signatures[path.fpath] = signature
+        return (path.fpath, path.ft_ext, None)
+
+    yield from _batched(map(lookup, paths), _PROCESS_BATCH_SIZE)
+
+
+def _discover(dirs: Iterable[str], exts: List[str], **kwargs) -> Iterator[BatchPairDict]:
+    """
+    Lazily find the matching files in the given directories.
+
+    Parameters
+    ----------
+    dirs : Iterable[str]
+        The target directories (or files).
+    exts : List[str]
+        The file extensions to be checked.
+    **kwargs
+        Contains the ``git_tracked`` boolean option, the ``changed_since`` git revision
+        and the ``excludes`` glob patterns. Only tracked files can be changed since a git
+        revision, so ``changed_since`` implies ``git_tracked``.
+
+    Returns
+    -------
+    Iterator[BatchPairDict]
+        The ``BatchPairDict`` objects of the matching files.
+    """
+    discover = iter_tracked_paths if kwargs.get("git_tracked", False) else iter_paths
+    if kwargs.get("changed_since") is not None:
+        discover = partial(iter_changed_paths, ref=kwargs["changed_since"])
+
+    return discover(dirs, exts, excludes=kwargs.get("excludes"))
+
+
+def _color_init() -> None:
+    """
+    Initialize ``colorama`` and load its color codes, importing it only on first use.
+
+    Only verbose mode prints colors, so otherwise ``colorama`` is never imported.
+    """
+    global _RED, _GREEN, _BRIGHT, _RESET
+    from colorama import Fore, Style
+    from colorama import init as color_init
+
+    color_init()
+    _RED, _GREEN = Fore.LIGHTRED_EX, Fore.LIGHTGREEN_EX
+    _BRIGHT, _RESET = Style.BRIGHT, Style.RESET_ALL
+
+
+def _report(result: CheckResult, verbose: bool) -> None:
+    """
+    Print the result of a check if verbose mode is enabled.
+
+    Errors are always printed to stderr.
+
+    Parameters
+    ----------
+    result : CheckResult
+        The result to be printed.
+    verbose : bool
+        Whether verbose mode is enabled.
+    """
+    if result.error is not None:
+        error(result.error)
+        return
+
+    verbose_print(f"{_RESET} - {result.fpath} ==> ", verbose=verbose, end="", sep="")
+    if result.changed:
+        verbose_print(f"{_BRIGHT}{_RED}CHANGED", verbose=verbose)
+    else:
+        verbose_print(f"{_BRIGHT}{_GREEN}OK", verbose=verbose)
 
 
 def eof_comment_search(
@@ -61,31 +845,335 @@ def eof_comment_search(
 
     result: Dict[str, EOFCommentSearch] = dict()
     comment_map = comments.generate()
+    crlf: bool = False
 
-    color_init()
+    if verbose:
+        _color_init()
 
     verbose_print(f"{_RESET}Analyzing files...\n", verbose=verbose)
     for path, file in files.items():
-        file_obj: TextIOWrapper = file.file
-        ext: str = file.ft_ext
-
-        wrapper = get_last_line(file_obj)
-        last_line, had_nwl, crlf = wrapper.line, wrapper.had_nwl, wrapper.crlf
-
-        verbose_print(f"{_RESET} - {path} ==> ", verbose=verbose, end="", sep="")
-        if last_line != comment_map[ext] or (newline and not had_nwl):
-            verbose_print(f"{_BRIGHT}{_RED}CHANGED", verbose=verbose)
-            result[path] = EOFCommentSearch(
-                state=IOWrapperBool(file=open(path, "r"), had_nwl=had_nwl, crlf=crlf),
-                lang=ext,
-                match=matches(last_line),
-            )
-        else:
-            verbose_print(f"{_BRIGHT}{_GREEN}OK", verbose=verbose)
+        checked = _check_file(path, file.file, file.ft_ext, comment_map, newline)
+        _report(checked, verbose)
+        if checked.search is not None:
+            result[path] = checked.search
+            crlf = checked.search.state.crlf
 
     return result, crlf
 
 
+def check_paths(
+    paths: Iterable[BatchPairDict], comments: Comments, **kwargs
+) -> Iterator[CheckResult]:
+    """
+    Lazily check the given files, yielding each result as soon as it is ready.
+
+    The ``on_file_checked`` hooks are emitted for every file, including the skipped ones.
+
+    Parameters
+    ----------
+    paths : Iterable[BatchPairDict]
+        The ``BatchPairDict`` objects of the files to be checked.
+    comments : Comments
+        The ``Comments`` object containing the hardcoded comments per file-type/file-extension.
+    **kwargs
+        Contains the ``verbose`` and ``newline`` boolean options, the ``max_open`` limit of
+        simultaneously opened files, the amount of workers (``jobs``),
+        the kind of ``executor`` (either ``"thread"`` or ``"process"``), the ``engine``
+        (either ``"text"`` or ``"bytes"``), an optional ``ScanCache`` object (``cache``)
+        and an optional ``RunStats`` object (``stats``) where every phase is measured.
+
+    Yields
+    ------
+    CheckResult
+        The result for each file that could be decoded, in the same order as ``paths``.
+    """
+    verbose: bool = kwargs.get("verbose", False)
+    newline: bool = kwargs.get("newline", False)
+    jobs: int = kwargs.get("jobs", 1)
+    executor: str = kwargs.get("executor", "thread")
+    cache: ScanCache | None = kwargs.get("cache", None)
+    stats: RunStats | None = kwargs.get("stats", None)
+    gate = BoundedSemaphore(kwargs.get("max_open", DEFAULT_MAX_OPEN))
+
+    comment_map = comments.generate()
+    encoded = _encode_engine(kwargs.get("engine", "text"), comment_map)
+    checked = callbacks("on_file_checked")
+    paths = measure_iter(stats, "discovery", paths)
+
+    results: Iterator[CheckResult | None]
+    signatures: Dict[str, _Signature] = dict()
+    if executor == "process" and jobs > 1:
+        check_batch = partial(
+            _check_batch,
+            comment_map=comment_map,
+            newline=newline,
+            encoded=encoded,
+            measured=stats is not None,
+            traced=len(checked) > 0,
+        )
+
+        def expand(
+            batch: Tuple[List[_CompactResult], RunStats | None, List[_Trace] | None],
+        ) -> List[CheckResult]:
+            compacts, batch_stats, traces = batch
+            if stats is not None and batch_stats is not None:
+                stats.merge(batch_stats)
+
+            for trace in traces or ():
+                emit(checked, *trace)
+
+            return [_expand(compact) for compact in compacts]
+
+        batches = _lookup_batches(paths, cache, signatures, stats)
+        results = (
+            result
+            for batch in _ordered_map(check_batch, batches, jobs, executor)
+            for result in expand(batch)
+        )
+    else:
+        check = partial(
+            _check_path,
+            comment_map=comment_map,
+            newline=newline,
+            gate=gate,
+            cache=cache,
+            encoded=encoded,
+            stats=stats,
+        )
+        if checked:
+            check = partial(_hooked_check, check)
+
+        results = _ordered_map(check, paths, jobs)
+
+    if verbose:
+        _color_init()
+
+    verbose_print(f"{_RESET}Analyzing files...\n", verbose=verbose)
+    for result in results:
+        if stats is not None:
+            stats.count_check(result)
+
+        if result is None:
+            continue
+
+        signature = signatures.pop(result.fpath, None)
+        if cache is not None and signature is not None:
+            cache.store(result, signature)
+
+        _report(result, verbose)
+        yield result
+
+
+def fix_paths(
+    results: Iterable[CheckResult], comments: Comments, **kwargs
+) -> Iterator[CheckResult]:
+    """
+    Lazily append a Vim EOF comment to the checked files missing it.
+
+    The ``on_file_written`` hooks are emitted for every file modified successfully.
+
+    Parameters
+    ----------
+    results : Iterable[CheckResult]
+        The results of ``check_paths()``.
+    comments : Comments
+        The ``Comments`` object containing the hardcoded comments per file extension.
+    **kwargs
+        Contains the ``newline`` boolean option, the ``max_open`` limit of
+        simultaneously opened files, the amount of worker threads (``jobs``), the ``engine``
+        (either ``"text"`` or ``"bytes"``), an optional ``ScanCache`` object (``cache``)
+        and an optional ``RunStats`` object (``stats``) where the writes are measured.
+
+    Yields
+    ------
+    CheckResult
+        Every given result, after its file has been modified if needed.
+    """
+    newline: bool = kwargs.get("newline", False)
+    jobs: int = kwargs.get("jobs", 1)
+    cache: ScanCache | None = kwargs.get("cache", None)
+    stats: RunStats | None = kwargs.get("stats", None)
+    gate = BoundedSemaphore(kwargs.get("max_open", DEFAULT_MAX_OPEN))
+
+    comment_map = comments.generate()
+    fix = partial(
+        _fix_result,
+        comment_map=comment_map,
+        newline=newline,
+        gate=gate,
+        cache=cache,
+        encoded=_encode_engine(kwargs.get("engine", "text"), comment_map),
+        stats=stats,
+    )
+    if callbacks("on_file_written"):
+        fix = partial(_hooked_fix, fix)
+
+    for result in _ordered_map(fix, results, jobs):
+        if stats is not None:
+            stats.count_fix(result)
+
+        if result.error is not None and result.changed:
+            error(result.error)
+
+        yield result
+
+
+async def check_tree(
+    dirs: List[str], exts: List[str], comments: Comments | None = None, **kwargs
+) -> AsyncIterator[CheckResult]:
+    """
+    Asynchronously check all the matching files in the given directories.
+
+    All blocking file I/O is offloaded to worker threads, so the event loop is never blocked.
+    The ``on_file_checked`` hooks are emitted from those threads.
+
+    Parameters
+    ----------
+    dirs : List[str]
+        The target directories.
+    exts : List[str]
+        The file extensions to be checked.
+    comments : Comments, optional, default=None
+        The ``Comments`` object to be used. If ``None`` the default comments are used.
+    **kwargs
+        Contains the ``newline`` and ``git_tracked`` boolean options, the ``changed_since``
+        git revision, the ``excludes`` glob patterns, the ``max_open`` limit of
+        simultaneously opened files, the maximum amount of files being checked at once
+        (``concurrency``), the ``engine`` (either ``"text"`` or ``"bytes"``),
+        an optional ``ScanCache`` object (``cache``) and an optional ``RunStats`` object
+        (``stats``) where every phase is measured.
+
+    Yields
+    ------
+    CheckResult
+        The result for each file that could be decoded, in discovery order.
+    """
+    newline: bool = kwargs.get("newline", False)
+    concurrency: int = kwargs.get("concurrency", _ASYNC_CONCURRENCY)
+    gate = BoundedSemaphore(kwargs.get("max_open", DEFAULT_MAX_OPEN))
+    cache: ScanCache | None = kwargs.get("cache", None)
+    stats: RunStats | None = kwargs.get("stats", None)
+
+    comment_map = (comments if comments is not None else Comments()).generate()
+    check = partial(
+        _check_path,
+        comment_map=comment_map,
+        newline=newline,
+        gate=gate,
+        cache=cache,
+        encoded=_encode_engine(kwargs.get("engine", "text"), comment_map),
+        stats=stats,
+    )
+    if callbacks("on_file_checked"):
+        check = partial(_hooked_check, check)
+
+    paths = measure_iter(stats, "discovery", _discover(dirs, exts, **kwargs))
+    async for result in _aordered_map(check, _aiter_blocking(paths), concurrency):
+        if stats is not None:
+            stats.count_check(result)
+
+        if result is not None:
+            yield result
+
+
+async def fix_tree(
+    dirs: List[str], exts: List[str], comments: Comments | None = None, **kwargs
+) -> AsyncIterator[CheckResult]:
+    """
+    Asynchronously check and fix all the matching files in the given directories.
+
+    All blocking file I/O is offloaded to worker threads, so the event loop is never blocked.
+    The ``on_file_written`` hooks are emitted from those threads.
+
+    Parameters
+    ----------
+    dirs : List[str]
+        The target directories.
+    exts : List[str]
+        The file extensions to be checked.
+    comments : Comments, optional, default=None
+        The ``Comments`` object to be used. If ``None`` the default comments are used.
+    **kwargs
+        Contains the ``newline`` and ``git_tracked`` boolean options, the ``changed_since``
+        git revision, the ``excludes`` glob patterns, the ``max_open`` limit of
+        simultaneously opened files, the maximum amount of files being processed at once
+        (``concurrency``), the ``engine`` (either ``"text"`` or ``"bytes"``),
+        an optional ``ScanCache`` object (``cache``) and an optional ``RunStats`` object
+        (``stats``) where every phase is measured.
+
+    Yields
+    ------
+    CheckResult
+        Every result of ``check_tree()``, after its file has been modified if needed.
+    """
+    newline: bool = kwargs.get("newline", False)
+    concurrency: int = kwargs.get("concurrency", _ASYNC_CONCURRENCY)
+    gate = BoundedSemaphore(kwargs.get("max_open", DEFAULT_MAX_OPEN))
+    cache: ScanCache | None = kwargs.get("cache", None)
+    stats: RunStats | None = kwargs.get("stats", None)
+
+    if comments is None:
+        comments = Comments()
+
+    comment_map = comments.generate()
+    fix = partial(
+        _fix_result,
+        comment_map=comment_map,
+        newline=newline,
+        gate=gate,
+        cache=cache,
+        encoded=_encode_engine(kwargs.get("engine", "text"), comment_map),
+        stats=stats,
+    )
+    if callbacks("on_file_written"):
+        fix = partial(_hooked_fix, fix)
+
+    async for result in _aordered_map(fix, check_tree(dirs, exts, comments, **kwargs), concurrency):
+        if stats is not None:
+            stats.count_fix(result)
+
+        yield result
+
+
+def process_tree(
+    dirs: Iterable[str], exts: List[str], comments: Comments | None = None, **kwargs
+) -> RunStats:
+    """
+    Check and fix all the matching files in the given directories, measuring every phase.
+
+    Parameters
+    ----------
+    dirs : Iterable[str]
+        The target directories (or files).
+    exts : List[str]
+        The file extensions to be checked.
+    comments : Comments, optional, default=None
+        The ``Comments`` object to be used. If ``None`` the default comments are used.
+    **kwargs
+        Contains the ``dry_run`` boolean option (to leave the files untouched),
+        the discovery options of ``check_tree()`` and the options of ``check_paths()``
+        and ``fix_paths()``.
+
+    Returns
+    -------
+    RunStats
+        The timings and counters of the run.
+    """
+    if comments is None:
+        comments = Comments()
+
+    stats = RunStats()
+    start = perf_counter()
+    opts: Dict[str, Any] = dict(kwargs, stats=stats)
+    results = check_paths(_discover(dirs, exts, **kwargs), comments, **opts)
+    if not kwargs.get("dry_run", False):
+        results = fix_paths(results, comments, **opts)
+
+    deque(results, maxlen=0)
+    stats.elapsed = perf_counter() - start
+    return stats
+
+
 def append_eof_comment(
     files: Dict[str, EOFCommentSearch], comments: Comments, newline: bool, crlf: bool
 ) -> None:
@@ -105,22 +1193,148 @@ def append_eof_comment(
     """
     comment_map = comments.generate()
     for path, file in files.items():
-        file_obj = file.state.file
+        encoding: str = getpreferredencoding(False)
+        if file.state.file is not None:
+            encoding = file.state.file.encoding
+            file.state.file.close()
+
         had_nwl = file.state.had_nwl
         matching = file.match
         ext = file.lang
 
-        txt = modify_file(
-            file_obj,
-            comment_map,
-            ext=ext,
+        modify_file_tail(
+            path,
+            comment_map[ext],
             newline=newline,
             had_nwl=had_nwl,
             matching=matching,
             crlf=crlf,
+            encoding=encoding,
         )
-        with open(path, "w") as file_obj:
-            file_obj.write(txt)
+
+
+def _filter_stdin(ext: str, newline: bool, indent: List[IndentHandler]) -> int:
+    """
+    Copy stdin to stdout, ensuring its EOF comment.
+
+    Parameters
+    ----------
+    ext : str
+        The file-type/file-extension of the input.
+    newline : bool
+        Whether a newline is required before the comment.
+    indent : List[IndentHandler]
+        The indentation overrides.
+
+    Returns
+    -------
+    int
+        The exit code for the program.
+    """
+    comment_map = Comments(gen_indent_maps(indent.copy())).generate()
+    try:
+        filter_stream(stdin.buffer, stdout.buffer, comment_map[ext], newline=newline)
+    except UnicodeDecodeError:
+        error("The input couldn't be decoded, so it was left unchanged!")
+        return 1
+    finally:
+        stdout.flush()
+
+    return 0
+
+
+def _run_pass(
+    paths: Iterable[BatchPairDict],
+    comments: Comments,
+    dry_run: bool,
+    verbose: bool,
+    executor: str,
+    opts: Dict[str, Any],
+    written: Dict[str, Tuple[int, int]] | None = None,
+    stats: RunStats | None = None,
+) -> Tuple[int, int]:
+    """
+    Check (and fix, unless on dry-run mode) the given files.
+
+    Parameters
+    ----------
+    paths : Iterable[BatchPairDict]
+        The ``BatchPairDict`` objects of the files to be processed.
+    comments : Comments
+        The ``Comments`` object containing the hardcoded comments per file-type/file-extension.
+    dry_run : bool
+        Whether to leave the files untouched.
+    verbose : bool
+        Whether verbose mode is enabled.
+    executor : str
+        The kind of workers used to check the files.
+    opts : Dict[str, Any]
+        The options shared by ``check_paths()`` and ``fix_paths()``.
+    written : Dict[str, Tuple[int, int]], optional, default=None
+        If given, the modification time and size of every modified file are recorded here.
+    stats : RunStats, optional, default=None
+        If given, every phase is measured and the statistics are printed to stderr afterwards.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The amount of files found and the amount of files that couldn't be processed.
+    """
+    start = perf_counter()
+    results = check_paths(
+        paths, comments, verbose=verbose, executor=executor, stats=stats, **opts
+    )
+    if not dry_run:
+        results = fix_paths(results, comments, stats=stats, **opts)
+
+    found, failed = 0, 0
+    for result in results:
+        found += 1
+        if result.error is not None:
+            failed += 1
+        elif written is not None and result.changed and not dry_run:
+            try:
+                st = stat(result.fpath)
+                written[result.fpath] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+
+    if stats is not None:
+        stats.elapsed = perf_counter() - start
+        print(format_stats(stats), file=stderr)
+
+    return found, failed
+
+
+def _unwritten(
+    batch: List[BatchPairDict], written: Dict[str, Tuple[int, int]]
+) -> List[BatchPairDict]:
+    """
+    Drop the files that didn't change since they were last modified by this program.
+
+    Parameters
+    ----------
+    batch : List[BatchPairDict]
+        The ``BatchPairDict`` objects of the files reported by the watcher.
+    written : Dict[str, Tuple[int, int]]
+        The modification time and size of every file modified so far.
+
+    Returns
+    -------
+    List[BatchPairDict]
+        The files that were written by someone else.
+    """
+    result: List[BatchPairDict] = list()
+    for path in batch:
+        try:
+            st = stat(path.fpath)
+        except OSError:
+            continue
+
+        if written.pop(path.fpath, None) != (st.st_mtime_ns, st.st_size):
+            result.append(path)
+
+    return result
 
 
 def main() -> int:
@@ -153,28 +1367,102 @@ def main() -> int:
     if ns.list_versions:
         list_versions()
 
-    if not (ns.directories and ns.exts) or len(ns.directories) == 0 or ns.exts == "":
+    if ns.stdin:
+        if ns.ft is None:
+            die("The `--ft` option is required when reading from stdin!", code=1)
+
+        return _filter_stdin(ns.ft, ns.newline, indent_handler(ns.indent))
+
+    if not ((ns.directories or ns.files_from) and ns.exts) or ns.exts == "":
         die(code=1, func=parser.print_usage)
 
-    dirs: List[str] = ns.directories
+    dirs: Iterable[str] = ns.directories
+    if ns.files_from is not None:
+        dirs = chain(dirs, iter_file_list(ns.files_from, ns.null))
+
     exts: List[str] = ns.exts.split(",")
     newline: bool = ns.newline
     verbose: bool = ns.verbose
     dry_run: bool = ns.dry_run
+    max_open: int = ns.max_open
+    jobs: int = ns.jobs
+    executor: str = ns.executor
+    engine: str = ns.engine
+    excludes: List[str] = ns.excludes or list()
     indent: List[IndentHandler] = indent_handler(ns.indent)
 
+    if max_open < 1:
+        die("The maximum amount of open files must be positive!", code=1)
+
+    if jobs < 1:
+        die("The amount of jobs must be positive!", code=1)
+
+    if ns.debounce < 0:
+        die("The debounce delay can't be negative!", code=1)
+
     if dry_run:
         verbose = True
 
-    files = open_batch_paths(bootstrap_paths(dirs, exts))
-    if len(files) == 0:
+    comments = Comments(gen_indent_maps(indent.copy()))
+    cache: ScanCache | None = None
+    if ns.cache is not None:
+        config = config_hash(comments.generate(), newline, engine)
+        cache = ScanCache(ns.cache, config, ns.cache_mode)
+
+    if ns.watch:
+        dirs = list(dirs)
+
+    opts = {
+        "newline": newline,
+        "max_open": max_open,
+        "jobs": jobs,
+        "engine": engine,
+        "cache": cache,
+    }
+    found, failed = 0, 0
+    watcher = watch_paths(dirs, exts, excludes, debounce=ns.debounce) if ns.watch else None
+    try:
+        # The watcher is set up first, so nothing written during the first pass is missed
+        with watcher or nullcontext() as batches:
+            written: Dict[str, Tuple[int, int]] = dict()
+            paths = _discover(
+                dirs,
+                exts,
+                git_tracked=ns.git_tracked,
+                changed_since=ns.changed_since,
+                excludes=excludes,
+            )
+            found, failed = _run_pass(
+                paths,
+                comments,
+                dry_run,
+                verbose,
+                executor,
+                opts,
+                written,
+                RunStats() if ns.stats else None,
+            )
+            if batches is not None:
+                try:
+                    for batch in batches:
+                        batch = _unwritten(batch, written)
+                        if batch:
+                            stats = RunStats() if ns.stats else None
+                            _run_pass(
+                                batch, comments, dry_run, verbose, executor, opts, written, stats
+                            )
+                except KeyboardInterrupt:
+                    pass
+    finally:
+        if cache is not None:
+            cache.close()
+
+    if found == 0 and ns.changed_since is None:
         code = 1 if not dry_run else 0
         die("No matching files found!", code=code)
 
-    comments = Comments(gen_indent_maps(indent.copy()))
-    results, crlf = eof_comment_search(files, comments, verbose=verbose, newline=newline)
-    if len(results) > 0 and not dry_run:
-        append_eof_comment(results, comments, newline, crlf)
+    if failed > 0:
+        return 1
 
     return 0
 
@@ -1,7 +1,19 @@
+from typing import AsyncIterator, Iterable, Iterator
+
 from .comments.generator import Comments
-from .types import BatchPathDict, EOFCommentSearch
+from .stats import RunStats
+from .types import BatchPairDict, BatchPathDict, CheckResult, EOFCommentSearch
 
-__all__ = ["append_eof_comment", "eof_comment_search", "main"]
+__all__ = [
+    "append_eof_comment",
+    "check_paths",
+    "check_tree",
+    "eof_comment_search",
+    "fix_paths",
+    "fix_tree",
+    "main",
+    "process_tree",
+]
 
 def eof_comment_search(
     files: dict[str, BatchPathDict], comments: Comments, **kwargs
@@ -31,6 +43,146 @@ def eof_comment_search(
         The object type for the returning dictionary values.
     """
 
+def check_paths(
+    paths: Iterable[BatchPairDict], comments: Comments, **kwargs
+) -> Iterator[CheckResult]:
+    """
+    Lazily check the given files, yielding each result as soon as it is ready.
+
+    The ``on_file_checked`` hooks are emitted for every file, including the skipped ones.
+
+    Parameters
+    ----------
+    paths : Iterable[BatchPairDict]
+        The ``BatchPairDict`` objects of the files to be checked.
+    comments : Comments
+        The ``Comments`` object containing the hardcoded comments per file-type/file-extension.
+    **kwargs
+        Contains the ``verbose`` and ``newline`` boolean options, the ``max_open`` limit of
+        simultaneously opened files, the amount of workers (``jobs``),
+        the kind of ``executor`` (either ``"thread"`` or ``"process"``), the ``engine``
+        (either ``"text"`` or ``"bytes"``), an optional ``ScanCache`` object (``cache``)
+        and an optional ``RunStats`` object (``stats``) where every phase is measured.
+
+    Yields
+    ------
+    CheckResult
+        The result for each file that could be decoded, in the same order as ``paths``.
+    """
+
+def fix_paths(
+    results: Iterable[CheckResult], comments: Comments, **kwargs
+) -> Iterator[CheckResult]:
+    """
+    Lazily append a Vim EOF comment to the checked files missing it.
+
+    The ``on_file_written`` hooks are emitted for every file modified successfully.
+
+    Parameters
+    ----------
+    results : Iterable[CheckResult]
+        The results of ``check_paths()``.
+    comments : Comments
+        The ``Comments`` object containing the hardcoded comments per file extension.
+    **kwargs
+        Contains the ``newline`` boolean option, the ``max_open`` limit of
+        simultaneously opened files, the amount of worker threads (``jobs``), the ``engine``
+        (either ``"text"`` or ``"bytes"``), an optional ``ScanCache`` object (``cache``)
+        and an optional ``RunStats`` object (``stats``) where the writes are measured.
+
+    Yields
+    ------
+    CheckResult
+        Every given result, after its file has been modified if needed.
+    """
+
+async def check_tree(
+    dirs: list[str], exts: list[str], comments: Comments | None = None, **kwargs
+) -> AsyncIterator[CheckResult]:
+    """
+    Asynchronously check all the matching files in the given directories.
+
+    All blocking file I/O is offloaded to worker threads, so the event loop is never blocked.
+    The ``on_file_checked`` hooks are emitted from those threads.
+
+    Parameters
+    ----------
+    dirs : List[str]
+        The target directories.
+    exts : List[str]
+        The file extensions to be checked.
+    comments : Comments, optional, default=None
+        The ``Comments`` object to be used. If ``None`` the default comments are used.
+    **kwargs
+        Contains the ``newline`` and ``git_tracked`` boolean options, the ``changed_since``
+        git revision, the ``excludes`` glob patterns, the ``max_open`` limit of
+        simultaneously opened files, the maximum amount of files being checked at once
+        (``concurrency``), the ``engine`` (either ``"text"`` or ``"bytes"``),
+        an optional ``ScanCache`` object (``cache``) and an optional ``RunStats`` object
+        (``stats``) where every phase is measured.
+
+    Yields
+    ------
+    CheckResult
+        The result for each file that could be decoded, in discovery order.
+    """
+
+async def fix_tree(
+    dirs: list[str], exts: list[str], comments: Comments | None = None, **kwargs
+) -> AsyncIterator[CheckResult]:
+    """
+    Asynchronously check and fix all the matching files in the given directories.
+
+    All blocking file I/O is offloaded to worker threads, so the event loop is never blocked.
+    The ``on_file_written`` hooks are emitted from those threads.
+
+    Parameters
+    ----------
+    dirs : List[str]
+        The target directories.
+    exts : List[str]
+        The file extensions to be checked.
+    comments : Comments, optional, default=None
+        The ``Comments`` object to be used. If ``None`` the default comments are used.
+    **kwargs
+        Contains the ``newline`` and ``git_tracked`` boolean options, the ``changed_since``
+        git revision, the ``excludes`` glob patterns, the ``max_open`` limit of
+        simultaneously opened files, the maximum amount of files being processed at once
+        (``concurrency``), the ``engine`` (either ``"text"`` or ``"bytes"``),
+        an optional ``ScanCache`` object (``cache``) and an optional ``RunStats`` object
+        (``stats``) where every phase is measured.
+
+    Yields
+    ------
+    CheckResult
+        Every result of ``check_tree()``, after its file has been modified if needed.
+    """
+
+def process_tree(
+    dirs: Iterable[str], exts: list[str], comments: Comments | None = None, **kwargs
+) -> RunStats:
+    """
+    Check and fix all the matching files in the given directories, measuring every phase.
+
+    Parameters
+    ----------
+    dirs : Iterable[str]
+        The target directories (or files).
+    exts : List[str]
+        The file extensions to be checked.
+    comments : Comments, optional, default=None
+        The ``Comments`` object to be used. If ``None`` the default comments are used.
+    **kwargs
+        Contains the ``dry_run`` boolean option (to leave the files untouched),
+        the discovery options of ``check_tree()`` and the options of ``check_paths()``
+        and ``fix_paths()``.
+
+    Returns
+    -------
+    RunStats
+        The timings and counters of the run.
+    """
+
 def append_eof_comment(
     files: dict[str, EOFCommentSearch], comments: Comments, newline: bool, crlf: bool
 ) -> None:
@@ -7,20 +7,82 @@ Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 """
 
 __all__ = [
+    "DEFAULT_MAX_OPEN",
+    "ENGINES",
     "EXCLUDED_DIRS",
+    "MMAP_THRESHOLD",
+    "SNIFF_SIZE",
     "bootstrap_paths",
+    "build_suffix_index",
+    "compile_excludes",
+    "encode_comments",
+    "filter_stream",
     "get_last_line",
+    "io_counters",
+    "is_excluded",
+    "iter_changed_paths",
+    "iter_file_list",
+    "iter_paths",
+    "iter_tracked_paths",
+    "looks_binary",
+    "match_suffix",
     "modify_file",
+    "modify_file_tail",
+    "modify_tail_bytes",
+    "open_batch_path",
     "open_batch_paths",
+    "scan_dir",
+    "search_tail_bytes",
+    "sniff_encoding",
+    "tail_matches",
     "try_open",
 ]
 
-from io import TextIOWrapper
-from os import walk
-from os.path import isdir, join
-from typing import Dict, List
+from codecs import (
+    BOM_UTF8,
+    BOM_UTF16_BE,
+    BOM_UTF16_LE,
+    BOM_UTF32_BE,
+    BOM_UTF32_LE,
+    getincrementaldecoder,
+)
+from collections import deque
+from fnmatch import translate
+from io import BufferedReader, BytesIO, TextIOWrapper
+from locale import getpreferredencoding
+from mmap import ACCESS_READ, mmap
+from os import SEEK_END, DirEntry, fsdecode, scandir, sep
+from os.path import abspath, basename, dirname, isdir, isfile, join, normpath, realpath, relpath
+from re import Pattern, compile
+from sys import stdin
+from threading import local
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    cast,
+)
 
-from .types import BatchPairDict, BatchPathDict, LineBool
+from .comments.table import COMMENT_BYTES, COMMENTS
+from .gitindex import changed_paths, find_repo, read_index
+from .hooks import callbacks, emit
+from .regex import matches, matches_bytes
+from .types import (
+    BatchPairDict,
+    BatchPathDict,
+    EOFCommentSearch,
+    IndexEntry,
+    IOWrapperBool,
+    LineBool,
+)
 from .util import die, error
 
 EXCLUDED_DIRS: List[str] = [
@@ -29,37 +91,897 @@ EXCLUDED_DIRS: List[str] = [
     ".ropeproject",
     ".venv",
     "build",
+    "node_modules",
     "venv",
 ]
+DEFAULT_MAX_OPEN: int = 64
+MMAP_THRESHOLD: int = 16 * 1024 * 1024
+SNIFF_SIZE: int = 8192
+ENGINES: Tuple[str, str] = ("text", "bytes")
+
+_TAIL_BLOCK_SIZE: int = 8192
+_LIST_BLOCK_SIZE: int = 65536
+_STREAM_LOOKAHEAD: int = 4
+_WIDE_BOMS: Tuple[bytes, ...] = (BOM_UTF32_LE, BOM_UTF32_BE, BOM_UTF16_LE, BOM_UTF16_BE)
+_NEWLINE: Pattern[bytes] = compile(b"\r\n|\r|\n")
+_SEPARATORS: Tuple[bytes, ...] = (b"", b"\n", b"\r\n", b"\r")
+_COUNTERS = local()
+
+_Span = Tuple[int, int, int]
+
+
+def io_counters() -> Tuple[int, int]:
+    """
+    Get the amount of bytes read from and written to files by the current thread so far.
+
+    Only the reads and writes done while checking and fixing files are counted.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The amount of bytes read and written.
+    """
+    return getattr(_COUNTERS, "read", 0), getattr(_COUNTERS, "written", 0)
+
+
+def _count_io(read: int = 0, written: int = 0) -> None:
+    """
+    Add to the I/O counters of the current thread.
+
+    Parameters
+    ----------
+    read : int, optional, default=0
+        The amount of bytes read.
+    written : int, optional, default=0
+        The amount of bytes written.
+    """
+    _COUNTERS.read = getattr(_COUNTERS, "read", 0) + read
+    _COUNTERS.written = getattr(_COUNTERS, "written", 0) + written
+
+
+def _count_newlines(data: bytes) -> int:
+    """
+    Count the universal newline separators in a chunk of bytes.
+
+    Parameters
+    ----------
+    data : bytes
+        The data to be scanned.
+
+    Returns
+    -------
+    int
+        The amount of LF, CRLF and CR separators.
+    """
+    return data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+
+
+def _read_tail(raw: BinaryIO, lines: int) -> Tuple[int, bytes]:
+    """
+    Read the last lines of a binary stream by seeking backwards from its end.
+
+    The stream is read in fixed-size blocks until enough line separators are found,
+    so the cost does not depend on the size of the file.
+
+    Parameters
+    ----------
+    raw : BinaryIO
+        The seekable binary stream to be read.
+    lines : int
+        The amount of trailing line separators to be included.
+
+    Returns
+    -------
+    offset : int
+        The offset where the returned data starts, always at the beginning of a line.
+    data : bytes
+        The trailing data of the stream.
+    """
+    offset: int = raw.seek(0, SEEK_END)
+    chunks: List[bytes] = list()
+    found: int = 0
+    while offset > 0 and found <= lines:
+        size: int = min(_TAIL_BLOCK_SIZE, offset)
+        offset -= size
+        raw.seek(offset)
+
+        chunk: bytes = raw.read(size)
+        _count_io(read=len(chunk))
+        found += _count_newlines(chunk)
+        if chunks and chunk.endswith(b"\r") and chunks[-1].startswith(b"\n"):
+            found -= 1
+
+        chunks.append(chunk)
+
+    data: bytes = b"".join(reversed(chunks))
+    ends: List[int] = [m.end() for m in _NEWLINE.finditer(data)]
+    if len(ends) > lines:
+        cut: int = ends[-lines - 1]
+        return offset + cut, data[cut:]
+
+    return offset, data
+
+
+def _strip_separator(data: bytes | mmap, end: int) -> int:
+    """
+    Skip backwards over the universal newline separator ending right before an offset, if any.
+
+    Parameters
+    ----------
+    data : bytes or mmap.mmap
+        The data to be scanned.
+    end : int
+        The offset right after the separator.
+
+    Returns
+    -------
+    int
+        The offset where the separator starts, or ``end`` if there's no separator.
+    """
+    if end >= 2 and data[end - 2:end] == b"\r\n":
+        return end - 2
+
+    if end >= 1 and data[end - 1:end] in (b"\n", b"\r"):
+        return end - 1
+
+    return end
+
+
+def tail_matches(fpath: str, comment: bytes, newline: bool) -> bool:
+    """
+    Check whether a file already ends with the given EOF comment, without decoding it.
+
+    The file is memory-mapped and only the bytes around the comment are compared, so only
+    its last pages are ever touched. A ``False`` result means that the file has to be checked
+    the regular way, not that it's wrong.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+    comment : bytes
+        The encoded EOF comment.
+    newline : bool
+        Whether an empty line is required before the comment.
+
+    Returns
+    -------
+    bool
+        Whether the file is known to be correct.
+    """
+    with open(fpath, "rb") as file:
+        try:
+            data = mmap(file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:  # The file is (or just became) empty, so it can't be mapped
+            return False
+
+    with data:
+        end: int = _strip_separator(data, len(data))
+        start: int = end - len(comment)
+        _count_io(read=len(data) - max(start - 4, 0))
+        if start < 0 or data[start:end] != comment:
+            return False
+
+        if start == 0:
+            return not newline
+
+        prev: int = _strip_separator(data, start)
+        if prev == start:
+            return False
+
+        return not newline or prev == 0 or _strip_separator(data, prev) != prev
+
+
+def _decode_tail(file: TextIOWrapper, lines: int) -> Tuple[int, str]:
+    """
+    Decode the last lines of a text file without reading all of its contents.
+
+    Parameters
+    ----------
+    file : TextIOWrapper
+        The file to be read.
+    lines : int
+        The amount of trailing line separators to be included.
+
+    Returns
+    -------
+    offset : int
+        The byte offset where the returned text starts.
+    text : str
+        The decoded text, with its newlines translated to LF.
+    """
+    offset, data = _read_tail(cast(BinaryIO, file.buffer), lines)
+    text: str = data.decode(file.encoding, file.errors or "strict")
+
+    return offset, text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_sample(fpath: str) -> Tuple[bytes, bytes]:
+    """
+    Read at most ``SNIFF_SIZE`` bytes from both the head and the tail of a file.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+
+    Returns
+    -------
+    head : bytes
+        The first bytes of the file.
+    tail : bytes
+        The last bytes of the file not included in ``head``, if any.
+    """
+    with open(fpath, "rb") as file:
+        head: bytes = file.read(SNIFF_SIZE)
+        tail: bytes = b""
+        if len(head) == SNIFF_SIZE:
+            end: int = file.seek(0, SEEK_END)
+            file.seek(max(SNIFF_SIZE, end - SNIFF_SIZE))
+            tail = file.read(SNIFF_SIZE)
+
+    _count_io(read=len(head) + len(tail))
+    return head, tail
+
+
+def looks_binary(fpath: str) -> bool:
+    """
+    Check whether a file looks binary, without decoding any of its contents.
+
+    Like git does, a file is considered binary if a bounded sample of it contains a NUL byte.
+    Files with a UTF-16/UTF-32 BOM are considered binary as well.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+
+    Returns
+    -------
+    bool
+        Whether the file looks binary.
+    """
+    head, tail = _read_sample(fpath)
+    return head.startswith(_WIDE_BOMS) or b"\0" in head or b"\0" in tail
+
+
+def sniff_encoding(fpath: str) -> str | None:
+    """
+    Detect whether a file is text and how it should be decoded, reading a bounded sample only.
+
+    At most ``SNIFF_SIZE`` bytes from both the head and the tail of the file are read.
+    Files with a UTF-16/UTF-32 BOM or a NUL byte in the sample are considered binary.
+    The sample is then validated with an incremental decoder, so a multi-byte character
+    cut at either end of it doesn't count as an error.
+
+    Parameters
+    ----------
+    fpath : str
+        The file path to be sniffed.
+
+    Returns
+    -------
+    str or None
+        The encoding to read the file with (``"utf-8-sig"`` if it has a UTF-8 BOM, otherwise
+        the preferred locale encoding), or ``None`` if the file isn't decodable text.
+    """
+    encoding: str = getpreferredencoding(False)
+    head, tail = _read_sample(fpath)
+    if head.startswith(BOM_UTF8):
+        encoding, head = "utf-8-sig", head[len(BOM_UTF8):]
+    elif head.startswith(_WIDE_BOMS):
+        return None
+
+    if b"\0" in head or b"\0" in tail:
+        return None
+
+    try:
+        getincrementaldecoder(encoding)().decode(head, final=len(tail) == 0)
+    except UnicodeDecodeError:
+        return None
+
+    if tail:
+        for skip in range(4):
+            try:
+                getincrementaldecoder(encoding)().decode(tail[skip:], final=True)
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            return None
+
+    return encoding
 
 
 def try_open(fpath: str) -> bool:
     """
-    Try to open a file, unless a ``UnicodeDecodeError`` triggers.
+    Check whether a file can be decoded, without reading all of its contents.
+
+    Parameters
+    ----------
+    fpath : str
+        The file path to try and open.
+
+    Returns
+    -------
+    bool
+        Whether the file looks like decodable text.
+
+    See Also
+    --------
+    sniff_encoding : The bounded sniffing is done here.
+    """
+    return sniff_encoding(fpath) is not None
+
+
+def build_suffix_index(exts: Iterable[str]) -> Dict[str, Any]:
+    """
+    Build a reversed-suffix trie of file extensions.
+
+    Each node is a dictionary keyed by characters, read from the end of the extension.
+    The node where an extension ends stores it under the empty-string key.
+
+    Parameters
+    ----------
+    exts : Iterable[str]
+        The file extensions to be indexed.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The root node of the trie.
+    """
+    root: Dict[str, Any] = dict()
+    for ext in exts:
+        if ext == "":
+            continue
+
+        node: Dict[str, Any] = root
+        for char in reversed(ext):
+            node = node.setdefault(char, dict())
+
+        node[""] = ext
+
+    return root
+
+
+def match_suffix(name: str, index: Dict[str, Any]) -> str | None:
+    """
+    Find the longest indexed file extension the given file name ends with.
+
+    Parameters
+    ----------
+    name : str
+        The file name.
+    index : Dict[str, Any]
+        The trie generated by ``build_suffix_index()``.
+
+    Returns
+    -------
+    str or None
+        The longest matching file extension, or ``None`` if there is none.
+    """
+    node: Dict[str, Any] = index
+    found: str | None = None
+    for char in reversed(name):
+        child: Dict[str, Any] | None = node.get(char)
+        if child is None:
+            break
+
+        node = child
+        found = node.get("", found)
+
+    return found
+
+
+def compile_excludes(patterns: Iterable[str]) -> Pattern[str] | None:
+    """
+    Compile a list of glob patterns into a single regular expression.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        The glob patterns (e.g. ``"vendor"`` or ``"docs/*.md"``).
+
+    Returns
+    -------
+    re.Pattern[str] or None
+        The compiled pattern, or ``None`` if no glob patterns were given.
+    """
+    regexes: List[str] = [f"(?:{translate(pattern)})" for pattern in patterns]
+    if len(regexes) == 0:
+        return None
+
+    return compile("|".join(regexes))
+
+
+def scan_dir(
+    path: str,
+    excluded: FrozenSet[str],
+    excludes: Pattern[str] | None,
+    rel: str = "",
+    enter: Callable[[str], bool] | None = None,
+) -> Iterator[DirEntry[str]]:
+    """
+    Lazily yield the files inside a directory and below, pruning excluded directories.
+
+    Directories are traversed top-down in the same order as ``os.walk()``, and symbolic links
+    to directories are not followed. The type information of each ``os.DirEntry`` is reused,
+    so no extra ``stat`` calls are made. The ``on_dir_enter`` hooks are emitted for every
+    directory scanned.
+
+    Parameters
+    ----------
+    path : str
+        The target directory.
+    excluded : FrozenSet[str]
+        The directory names to be skipped.
+    excludes : re.Pattern[str] or None
+        The compiled exclusion globs, matched against both the name and the relative path
+        of every entry.
+    rel : str, optional, default=""
+        The path of the directory relative to the one the exclusion globs are relative to,
+        using forward slashes and ending with one (e.g. ``"src/"``), if they differ.
+    enter : Callable[[str], bool], optional, default=None
+        A function called with every directory before it is scanned. If it returns ``False``
+        the directory is skipped.
+
+    Yields
+    ------
+    os.DirEntry[str]
+        The ``DirEntry`` object of each file found.
+    """
+    entered = callbacks("on_dir_enter")
+    stack: List[Tuple[str, str]] = [(path, rel)]
+    while stack:
+        top, rel = stack.pop()
+        if enter is not None and not enter(top):
+            continue
+
+        try:
+            entries = scandir(top)
+        except OSError:
+            continue
+
+        if entered:
+            emit(entered, top)
+
+        dirs: List[Tuple[str, str]] = list()
+        with entries:
+            for entry in entries:
+                name: str = entry.name
+                if excludes is not None and (
+                    excludes.match(name) is not None or excludes.match(rel + name) is not None
+                ):
+                    continue
+
+                try:
+                    is_dir: bool = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    yield entry
+                elif name not in excluded and not entry.is_symlink():
+                    dirs.append((entry.path, f"{rel}{name}/"))
+
+        stack.extend(reversed(dirs))
+
+
+def _real_prefix(path: str) -> str:
+    """
+    Resolve a directory path, so the files below it can be identified cheaply.
+
+    Parameters
+    ----------
+    path : str
+        The directory path.
+
+    Returns
+    -------
+    str
+        The canonical path of the directory, ending with a path separator.
+    """
+    root: str = realpath(path)
+    return root if root.endswith(sep) else root + sep
+
+
+def _unseen(key: str, seen: Set[str]) -> bool:
+    """
+    Check whether a file is found for the first time, recording it.
+
+    Parameters
+    ----------
+    key : str
+        The canonical path of the file.
+    seen : Set[str]
+        The canonical paths of the files found so far.
+
+    Returns
+    -------
+    bool
+        Whether the file wasn't found before.
+    """
+    if key in seen:
+        return False
+
+    seen.add(key)
+    return True
+
+
+def _walk_dir(
+    path: str,
+    index: Dict[str, Any],
+    excluded: FrozenSet[str],
+    excludes: Pattern[str] | None,
+    seen: Set[str],
+) -> Iterator[BatchPairDict]:
+    """
+    Lazily match the files inside a directory and below.
+
+    Parameters
+    ----------
+    path : str
+        The target directory.
+    index : Dict[str, Any]
+        The suffix index returned by ``build_suffix_index()``.
+    excluded : FrozenSet[str]
+        The directory names to be skipped.
+    excludes : re.Pattern[str] or None
+        The compiled exclusion globs.
+    seen : Set[str]
+        The canonical paths of the files found so far. Files already in it are skipped.
+
+    Yields
+    ------
+    BatchPairDict
+        A ``BatchPairDict`` object for each matching file found for the first time.
+    """
+    matched = callbacks("on_file_matched")
+    root: str = _real_prefix(path)
+    start: int = len(path)
+    for entry in scan_dir(path, excluded, excludes):
+        ext: str | None = match_suffix(entry.name, index)
+        if ext is None or not _unseen(root + entry.path[start:].lstrip(sep), seen):
+            continue
+
+        if matched:
+            emit(matched, entry.path, ext)
+
+        yield BatchPairDict(fpath=entry.path, ft_ext=ext)
+
+
+def _match_file(
+    path: str, index: Dict[str, Any], excludes: Pattern[str] | None, seen: Set[str]
+) -> BatchPairDict | None:
+    """
+    Match a file passed explicitly instead of a directory.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    index : Dict[str, Any]
+        The suffix index returned by ``build_suffix_index()``.
+    excludes : re.Pattern[str] or None
+        The compiled exclusion globs, matched against both the name and the path of the file.
+    seen : Set[str]
+        The canonical paths of the files found so far.
+
+    Returns
+    -------
+    BatchPairDict or None
+        The ``BatchPairDict`` object of the file, or ``None`` if it doesn't match,
+        isn't a regular file or was already found.
+    """
+    name: str = basename(path)
+    ext: str | None = match_suffix(name, index)
+    if ext is None or not isfile(path):
+        return None
+
+    if excludes is not None and (
+        excludes.match(name) is not None
+        or excludes.match(normpath(path).replace(sep, "/")) is not None
+    ):
+        return None
+
+    if not _unseen(_real_prefix(dirname(abspath(path))) + name, seen):
+        return None
+
+    emit(callbacks("on_file_matched"), path, ext)
+
+    return BatchPairDict(fpath=path, ft_ext=ext)
+
+
+def iter_file_list(source: str, null: bool = False) -> Iterator[str]:
+    """
+    Lazily read a list of paths from a file or from stdin.
+
+    If the list can't be opened or read, the program is killed with exit code 1.
+
+    Parameters
+    ----------
+    source : str
+        The path of the list file, or ``"-"`` for stdin.
+    null : bool, optional, default=False
+        Whether the paths are separated by NUL characters instead of newlines.
+
+    Yields
+    ------
+    str
+        Every non-empty path in the list, as soon as it is read.
+    """
+    try:
+        file = cast(BufferedReader, stdin.buffer if source == "-" else open(source, "rb"))
+    except OSError:
+        die(f"Unable to read `{source}`!", code=1)
+        return
+
+    try:
+        if not null:
+            for line in file:
+                line = line.rstrip(b"\r\n")
+                if line:
+                    yield fsdecode(line)
+
+            return
+
+        rest: bytes = b""
+        while chunk := file.read1(_LIST_BLOCK_SIZE):
+            *items, rest = (rest + chunk).split(b"\0")
+            for item in items:
+                if item:
+                    yield fsdecode(item)
+
+        if rest:
+            yield fsdecode(rest)
+    except OSError:
+        die(f"Unable to read `{source}`!", code=1)
+    finally:
+        if file is not stdin.buffer:
+            file.close()
+
+
+def iter_paths(
+    paths: Iterable[str], exts: List[str], excludes: List[str] | None = None
+) -> Iterator[BatchPairDict]:
+    """
+    Lazily yield all the matching paths in the given directories and below.
+
+    Directories listed in ``EXCLUDED_DIRS`` are never descended into. Every file is matched
+    only once (even if more than one of the given paths lead to it), against the longest
+    file extension it ends with, and the ``on_file_matched`` hooks are emitted for it.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The specified directory paths. Files are matched directly, without any walking.
+    exts : List[str]
+        A list of specified file extensions.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+
+    Yields
+    ------
+    BatchPairDict
+        A ``BatchPairDict`` object for each matching file, as soon as it is found.
+    """
+    excluded: FrozenSet[str] = frozenset(EXCLUDED_DIRS)
+    pattern = compile_excludes(excludes if excludes is not None else list())
+    index: Dict[str, Any] = build_suffix_index(exts)
+    seen: Set[str] = set()
+    for path in paths:
+        if not isdir(path):
+            file = _match_file(path, index, pattern, seen)
+            if file is not None:
+                yield file
+
+            continue
+
+        yield from _walk_dir(path, index, excluded, pattern, seen)
+
+
+def is_excluded(rel: str, excluded: FrozenSet[str], excludes: Pattern[str] | None) -> bool:
+    """
+    Check whether a relative file path would be pruned by ``scan_dir()``.
+
+    Parameters
+    ----------
+    rel : str
+        The file path, relative to the target directory and using forward slashes.
+    excluded : FrozenSet[str]
+        The directory names to be skipped.
+    excludes : re.Pattern[str] or None
+        The compiled exclusion globs, matched against both the name and the relative path
+        of every component.
+
+    Returns
+    -------
+    bool
+        Whether the file or any of its parent directories is excluded.
+    """
+    parts: List[str] = rel.split("/")
+    for i, name in enumerate(parts):
+        if i < len(parts) - 1 and name in excluded:
+            return True
+
+        if excludes is not None and (
+            excludes.match(name) is not None or excludes.match("/".join(parts[: i + 1])) is not None
+        ):
+            return True
+
+    return False
+
+
+def _filter_repo_paths(
+    path: str,
+    work_tree: str,
+    rels: Iterable[str],
+    index: Dict[str, Any],
+    excluded: FrozenSet[str],
+    excludes: Pattern[str] | None,
+    seen: Set[str],
+) -> Iterator[BatchPairDict]:
+    """
+    Lazily match the git paths below a target directory.
 
     Parameters
     ----------
-    fpath : str
-        The file path to try and open.
+    path : str
+        The target directory.
+    work_tree : str
+        The work tree containing the target directory.
+    rels : Iterable[str]
+        The paths relative to the work tree, using forward slashes.
+    index : Dict[str, Any]
+        The suffix index returned by ``build_suffix_index()``.
+    excluded : FrozenSet[str]
+        The directory names to be skipped.
+    excludes : re.Pattern[str] or None
+        The compiled exclusion globs.
+    seen : Set[str]
+        The canonical paths of the files found so far. Files already in it are skipped.
 
-    Returns
-    -------
-    bool
-        Whether the file triggers a ``UnicodeDecodeError`` or not.
+    Yields
+    ------
+    BatchPairDict
+        A ``BatchPairDict`` object for each matching file that exists in the work tree
+        and is found for the first time.
+    """
+    matched = callbacks("on_file_matched")
+    root: str = _real_prefix(path)
+    prefix: str = relpath(abspath(path), work_tree).replace(sep, "/") + "/"
+    if prefix == "./":
+        prefix = ""
+
+    for rel in rels:
+        if not rel.startswith(prefix):
+            continue
+
+        rel = rel[len(prefix):]
+        ext: str | None = match_suffix(rel[rel.rfind("/") + 1:], index)
+        if ext is None or is_excluded(rel, excluded, excludes):
+            continue
+
+        native: str = rel.replace("/", sep)
+        fpath = join(path, native)
+        if not isfile(fpath) or not _unseen(root + native, seen):
+            continue
+
+        if matched:
+            emit(matched, fpath, ext)
+
+        yield BatchPairDict(fpath=fpath, ft_ext=ext)
+
+
+def iter_tracked_paths(
+    paths: Iterable[str], exts: List[str], excludes: List[str] | None = None
+) -> Iterator[BatchPairDict]:
+    """
+    Lazily yield all the matching paths tracked by git in the given directories and below.
+
+    The paths are listed from the local ``.git/index`` file instead of walking the filesystem,
+    so untracked files are never matched. Directories outside a git work tree (or whose index
+    can't be read) are walked like ``iter_paths()`` does. Exclusions work the same way.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The specified directory paths. Files are matched directly, without any walking.
+    exts : List[str]
+        A list of specified file extensions.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+
+    Yields
+    ------
+    BatchPairDict
+        A ``BatchPairDict`` object for each matching file that exists in the work tree.
+    """
+    excluded: FrozenSet[str] = frozenset(EXCLUDED_DIRS)
+    pattern = compile_excludes(excludes if excludes is not None else list())
+    index: Dict[str, Any] = build_suffix_index(exts)
+    seen: Set[str] = set()
+    for path in paths:
+        if not isdir(path):
+            file = _match_file(path, index, pattern, seen)
+            if file is not None:
+                yield file
+
+            continue
+
+        repo = find_repo(abspath(path))
+        entries: List[IndexEntry] | None = None
+        if repo is not None:
+            try:
+                entries = list(read_index(repo[1]))
+            except (OSError, ValueError):
+                entries = None
+
+        if repo is None or entries is None:
+            yield from _walk_dir(path, index, excluded, pattern, seen)
+            continue
+
+        rels = (entry.path for entry in entries)
+        yield from _filter_repo_paths(path, repo[0], rels, index, excluded, pattern, seen)
+
+
+def iter_changed_paths(
+    paths: Iterable[str], exts: List[str], ref: str, excludes: List[str] | None = None
+) -> Iterator[BatchPairDict]:
+    """
+    Lazily yield all the matching paths changed since a git revision in the given directories.
+
+    The changed paths are obtained from ``git diff``, so only the files touched since ``ref``
+    (committed or not) are matched. The program is killed if a directory is outside a git
+    work tree or the revision can't be resolved, so a mistyped revision never passes silently.
+    Exclusions work the same way as in ``iter_paths()``.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The specified directory paths. Files are matched directly, without any walking.
+    exts : List[str]
+        A list of specified file extensions.
+    ref : str
+        The git revision to compare against.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+
+    Yields
+    ------
+    BatchPairDict
+        A ``BatchPairDict`` object for each matching file that exists in the work tree.
     """
-    with open(fpath, "r") as file:
-        success: bool = True
+    excluded: FrozenSet[str] = frozenset(EXCLUDED_DIRS)
+    pattern = compile_excludes(excludes if excludes is not None else list())
+    index: Dict[str, Any] = build_suffix_index(exts)
+    seen: Set[str] = set()
+    for path in paths:
+        if not isdir(path):
+            file = _match_file(path, index, pattern, seen)
+            if file is not None:
+                yield file
+
+            continue
+
+        repo = find_repo(abspath(path))
+        if repo is None:
+            die(f"`{path}` is not inside a git work tree!", code=1)
+            return
+
         try:
-            file.read()
-        except UnicodeDecodeError:
-            success = False
-        except Exception:
-            die("Something went wrong in `try_open()`!", code=2)
+            rels = changed_paths(repo[0], ref)
+        except ValueError as e:
+            die(f"Unable to get the files changed since `{ref}` in `{path}`: {e}", code=1)
+            return
 
-    return success
+        yield from _filter_repo_paths(path, repo[0], rels, index, excluded, pattern, seen)
 
 
-def bootstrap_paths(paths: List[str], exts: List[str]) -> List[BatchPairDict]:
+def bootstrap_paths(
+    paths: List[str], exts: List[str], excludes: List[str] | None = None
+) -> List[BatchPairDict]:
     """
     Bootstrap all the matching paths in current dir and below.
 
@@ -69,29 +991,46 @@ def bootstrap_paths(paths: List[str], exts: List[str]) -> List[BatchPairDict]:
         A list of specified file paths.
     exts : List[str]
         A list of specified file extensions.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
 
     Returns
     -------
     List[BatchPairDict]
         A list of ``BatchPairDict`` type objects.
     """
-    result = list()
-    for path in paths:
-        if not isdir(path):
-            continue
+    return list(iter_paths(paths, exts, excludes))
 
-        root: str
-        dirs: List[str]
-        files: List[str]
-        for root, dirs, files in walk(path):
-            for file in files:
-                for ext in exts:
-                    if not file.endswith(ext):
-                        continue
 
-                    result.append(BatchPairDict(fpath=join(root, file), ft_ext=ext))
+def open_batch_path(path: BatchPairDict) -> BatchPathDict | None:
+    """
+    Open a single file given its ``BatchPairDict`` object.
 
-    return result
+    Parameters
+    ----------
+    path : BatchPairDict
+        The ``BatchPairDict`` object of the target file.
+
+    Returns
+    -------
+    BatchPathDict or None
+        The opened ``BatchPathDict`` object, or ``None`` if the file can't be opened.
+    """
+    fpath, ext = path.fpath, path.ft_ext
+    try:
+        encoding: str | None = sniff_encoding(fpath)
+        if encoding is None:
+            return None
+
+        return BatchPathDict(file=open(fpath, "r", encoding=encoding), ft_ext=ext)
+    except KeyboardInterrupt:
+        die("\nProgram interrupted!", code=1)  # Kills the program
+    except FileNotFoundError:
+        error(f"File `{fpath}` is not available!")
+    except Exception:
+        error(f"Something went wrong while trying to open `{fpath}`!")
+
+    return None
 
 
 def open_batch_paths(paths: List[BatchPairDict]) -> Dict[str, BatchPathDict]:
@@ -110,49 +1049,35 @@ def open_batch_paths(paths: List[BatchPairDict]) -> Dict[str, BatchPathDict]:
     """
     result: Dict[str, BatchPathDict] = dict()
     for path in paths:
-        fpath, ext = path.fpath, path.ft_ext
-        if not try_open(fpath):
-            continue
-
-        try:
-            result[fpath] = BatchPathDict(file=open(fpath, "r"), ft_ext=ext)
-        except KeyboardInterrupt:
-            die("\nProgram interrupted!", code=1)  # Kills the program
-        except FileNotFoundError:
-            error(f"File `{fpath}` is not available!")
-        except Exception:
-            error(f"Something went wrong while trying to open `{fpath}`!")
+        opened = open_batch_path(path)
+        if opened is not None:
+            result[path.fpath] = opened
 
     return result
 
 
-def modify_file(file: TextIOWrapper, comments: Dict[str, str], ext: str, **kwargs) -> str:
+def _patch_lines(data: List[str], comment: str, **kwargs) -> List[str]:
     """
-    Modify a file containing a bad EOF comment.
+    Insert or replace the EOF comment in a list of lines.
 
     Parameters
     ----------
-    file : TextIOWrapper
-        The file object to be read.
-    comments : Dict[str, str]
-        A filetype-to-comment dictionary.
-    ext : str
-        The file-type/file-extension given by the user.
+    data : List[str]
+        The lines of the file to be patched.
+    comment : str
+        The EOF comment to be inserted.
     **kwargs
         Contains the ``newline``, ``matching`` and ``crlf`` boolean attributes.
 
     Returns
     -------
-    str
-        The modified contents of the given file.
+    List[str]
+        The patched lines.
     """
     matching: bool = kwargs.get("matching", False)
     newline: bool = kwargs.get("newline", False)
     crlf: bool = kwargs.get("crlf", False)
 
-    data: List[str] = file.read().split("\n")
-    file.close()
-
     if len(data) >= 1 and data[-1] != "":
         data.append("")
 
@@ -160,17 +1085,17 @@ def modify_file(file: TextIOWrapper, comments: Dict[str, str], ext: str, **kwarg
         data[-2] = ""
 
     if len(data) == 0:
-        data = [comments[ext], ""]
+        data = [comment, ""]
     elif len(data) == 1:
         if matching:
-            data = [comments[ext], ""]
+            data = [comment, ""]
         else:
-            data.insert(0, comments[ext])
+            data.insert(0, comment)
     elif len(data) >= 2:
         if matching:
-            data[-2] = comments[ext]
+            data[-2] = comment
         else:
-            data.insert(-1, comments[ext])
+            data.insert(-1, comment)
 
     if len(data) >= 3:
         if newline and data[-3] != "":
@@ -182,26 +1107,280 @@ def modify_file(file: TextIOWrapper, comments: Dict[str, str], ext: str, **kwarg
     if crlf:
         data.insert(-1, "\r")
 
-    return "\n".join(data)
+    return data
 
 
-def get_last_line(file: TextIOWrapper) -> LineBool:
+def _patch_tail(data: bytes, comment: str, **kwargs) -> bytes:
     """
-    Return the last line of a file and indicates whether it already has a newline.
+    Insert or replace the EOF comment in the encoded trailing lines of a file.
+
+    Parameters
+    ----------
+    data : bytes
+        The trailing lines, as returned by ``_read_tail()``.
+    comment : str
+        The EOF comment to be inserted.
+    **kwargs
+        Contains the ``newline``, ``matching`` and ``crlf`` boolean attributes,
+        as well as the ``encoding`` of the data.
+
+    Returns
+    -------
+    bytes
+        The patched trailing lines, using the same line separator as the original ones.
+    """
+    encoding: str = kwargs.get("encoding", getpreferredencoding(False))
+    text: str = data.decode(encoding)
+    nwl: str = "\r\n" if "\r\n" in text else "\r" if "\r" in text else "\n"
+
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines: List[str] = _patch_lines(text.split("\n"), comment, **kwargs)
+    return nwl.join(lines).encode(encoding)
+
+
+def modify_file(file: TextIOWrapper, comments: Dict[str, str], ext: str, **kwargs) -> str:
+    """
+    Modify a file containing a bad EOF comment.
 
     Parameters
     ----------
     file : TextIOWrapper
-        The file to retrieve the last line data from.
+        The file object to be read.
+    comments : Dict[str, str]
+        A filetype-to-comment dictionary.
+    ext : str
+        The file-type/file-extension given by the user.
+    **kwargs
+        Contains the ``newline``, ``matching`` and ``crlf`` boolean attributes.
 
     Returns
     -------
-    LineBool
-        An object containing both the last line in a string and a boolean indicating a newline.
+    str
+        The modified contents of the given file.
     """
     data: List[str] = file.read().split("\n")
     file.close()
 
+    return "\n".join(_patch_lines(data, comments[ext], **kwargs))
+
+
+def modify_file_tail(fpath: str, comment: str, **kwargs) -> int:
+    """
+    Modify a file containing a bad EOF comment by rewriting only its tail.
+
+    The file is truncated where its last lines start and the patched lines are appended,
+    so the rest of its contents is never read nor written.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file to be modified.
+    comment : str
+        The EOF comment to be inserted.
+    **kwargs
+        Contains the ``newline``, ``matching`` and ``crlf`` boolean attributes,
+        as well as the ``encoding`` of the file.
+
+    Returns
+    -------
+    int
+        The amount of bytes written.
+    """
+    with open(fpath, "r+b") as file:
+        offset, data = _read_tail(file, 2)
+        if offset > 0 and kwargs.get("encoding") == "utf-8-sig":
+            kwargs["encoding"] = "utf-8"
+
+        patched: bytes = _patch_tail(data, comment, **kwargs)
+
+        file.seek(offset)
+        file.truncate()
+        written: int = file.write(patched)
+
+    _count_io(written=written)
+    return written
+
+
+def encode_comments(comments: Dict[str, str]) -> Dict[str, Dict[bytes, bytes]]:
+    """
+    Encode every EOF comment once, for the byte-level engine.
+
+    The default comments are taken already encoded from ``comments.table.COMMENT_BYTES``,
+    only the customized ones are encoded here.
+
+    Parameters
+    ----------
+    comments : Dict[str, str]
+        A filetype-to-comment dictionary.
+
+    Returns
+    -------
+    Dict[str, Dict[bytes, bytes]]
+        The encoded comment line of each filetype, keyed by its line separator
+        (none, LF, CRLF or CR).
+    """
+    encoded: Dict[str, Dict[bytes, bytes]] = dict()
+    for ext, comment in comments.items():
+        line = COMMENT_BYTES[ext] if COMMENTS.get(ext) == comment else comment.encode("utf-8")
+        encoded[ext] = {sep: line + sep for sep in _SEPARATORS}
+
+    return encoded
+
+
+def _tail_lines(raw: BinaryIO) -> Tuple[int, bytes, List[_Span]]:
+    """
+    Read the last lines of a binary stream and locate them, without decoding anything.
+
+    Parameters
+    ----------
+    raw : BinaryIO
+        The seekable binary stream to be read.
+
+    Returns
+    -------
+    offset : int
+        The offset where the returned data starts.
+    data : bytes
+        The trailing data of the stream, as returned by ``_read_tail()``.
+    lines : List[Tuple[int, int, int]]
+        The start, the end of the contents and the end of the separator of each line in
+        ``data``. A UTF-8 BOM at the start of the stream is left out of its first line.
+    """
+    offset, data = _read_tail(raw, 2)
+    start: int = len(BOM_UTF8) if offset == 0 and data.startswith(BOM_UTF8) else 0
+    lines: List[_Span] = list()
+    for m in _NEWLINE.finditer(data, start):
+        lines.append((start, m.start(), m.end()))
+        start = m.end()
+
+    if start < len(data):
+        lines.append((start, len(data), len(data)))
+
+    return offset, data, lines
+
+
+def search_tail_bytes(
+    fpath: str, ext: str, comment: Dict[bytes, bytes], newline: bool
+) -> EOFCommentSearch | None:
+    """
+    Check the EOF comment of a file by comparing raw bytes only.
+
+    The last line of the file, including its own line separator, is compared against the
+    precomputed comment line for that separator, so nothing is ever decoded.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+    ext : str
+        The file-type/file-extension.
+    comment : Dict[bytes, bytes]
+        The encoded comment lines of the filetype, as returned by ``encode_comments()``.
+    newline : bool
+        Whether an empty line is required before the comment.
+
+    Returns
+    -------
+    EOFCommentSearch or None
+        The search data needed to fix the file, or ``None`` if it's already correct.
+    """
+    with open(fpath, "rb") as file:
+        _, data, lines = _tail_lines(file)
+
+    if len(lines) == 0:
+        return EOFCommentSearch(
+            state=IOWrapperBool(file=None, had_nwl=False, crlf=False), lang=ext, match=False
+        )
+
+    view = memoryview(data)
+    start, end, stop = lines[-1]
+    had_nwl: bool = len(lines) >= 2 and lines[-2][0] == lines[-2][1]
+    if view[start:stop] == comment.get(data[end:stop]) and (had_nwl or not newline):
+        return None
+
+    return EOFCommentSearch(
+        state=IOWrapperBool(file=None, had_nwl=had_nwl, crlf=data[end:stop] == b"\r\n"),
+        lang=ext,
+        match=matches_bytes(view[start:end]),
+    )
+
+
+def modify_tail_bytes(fpath: str, comment: Dict[bytes, bytes], **kwargs) -> int:
+    """
+    Modify a file containing a bad EOF comment by patching its raw tail.
+
+    Only the bytes from the replaced line onwards are rewritten, using the line separator
+    already found in the file, so everything else round-trips byte for byte.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file to be modified.
+    comment : Dict[bytes, bytes]
+        The encoded comment lines of the filetype, as returned by ``encode_comments()``.
+    **kwargs
+        Contains the ``newline`` and ``matching`` boolean attributes.
+
+    Returns
+    -------
+    int
+        The amount of bytes written.
+    """
+    newline: bool = kwargs.get("newline", False)
+    matching: bool = kwargs.get("matching", False)
+    with open(fpath, "r+b") as file:
+        offset, data, lines = _tail_lines(file)
+
+        nwl: bytes = b"\n"
+        for _, end, stop in reversed(lines):
+            if stop > end:
+                nwl = data[end:stop]
+                break
+
+        cut: int = len(data)
+        patch: bytes = comment[nwl]
+        if len(lines) > 0:
+            start, end, stop = lines[-1]
+            if matching:
+                cut = start
+                if len(lines) >= 2:
+                    prev_start, prev_end, _ = lines[-2]
+                    if newline and prev_end > prev_start:
+                        patch = nwl + patch
+                    elif not newline and prev_end == prev_start:
+                        cut = prev_start
+            elif not newline and end == start:
+                cut = start
+            else:
+                cut = stop
+                if newline and end > start:
+                    patch = nwl + patch
+
+                if stop == end:
+                    patch = nwl + patch
+
+        file.seek(offset + cut)
+        file.truncate()
+        written: int = file.write(patch)
+
+    _count_io(written=written)
+    return written
+
+
+def _last_line(data: List[str]) -> LineBool:
+    """
+    Get the last line of some text split by LF, and whether it's preceded by an empty line.
+
+    Parameters
+    ----------
+    data : List[str]
+        The trailing lines of the text.
+
+    Returns
+    -------
+    LineBool
+        An object containing both the last line in a string and a boolean indicating a newline.
+    """
     if data[-1] != "":
         data.append("")
 
@@ -211,7 +1390,7 @@ def get_last_line(file: TextIOWrapper) -> LineBool:
     elif len(data) == 1:
         line = data[0]
     elif len(data) >= 2:
-        line: str = data[-2]
+        line = data[-2]
         if line == "\r":
             line, crlf = "", True
 
@@ -221,4 +1400,140 @@ def get_last_line(file: TextIOWrapper) -> LineBool:
     return LineBool(line=line, had_nwl=had_nwl, crlf=crlf)
 
 
+def _last_separators(data: bytearray, start: int, stop: int) -> List[int]:
+    """
+    Find the last few line separators (LF, CRLF or CR) inside a region of a buffer.
+
+    Only the region is searched, from its end, so every byte of a stream is scanned once.
+
+    Parameters
+    ----------
+    data : bytearray
+        The buffer.
+    start : int
+        The start of the region. It must not fall inside a CRLF separator.
+    stop : int
+        The end of the region. It must not fall inside a CRLF separator.
+
+    Returns
+    -------
+    List[int]
+        The end offsets of up to ``_STREAM_LOOKAHEAD`` separators, in ascending order.
+    """
+    found: List[int] = list()
+    while len(found) < _STREAM_LOOKAHEAD:
+        pos: int = max(data.rfind(b"\n", start, stop), data.rfind(b"\r", start, stop))
+        if pos < 0:
+            break
+
+        found.append(pos + 1)
+        stop = pos - 1 if pos > start and data[pos - 1] == 0x0D and data[pos] == 0x0A else pos
+
+    found.reverse()
+    return found
+
+
+def filter_stream(src: BinaryIO, dst: BinaryIO, comment: str, **kwargs) -> bool:
+    """
+    Copy a stream while ensuring its EOF comment, holding back only its last few lines.
+
+    Everything but a small lookahead buffer of trailing lines is written to ``dst`` as soon as
+    it is read, so the memory used doesn't depend on the size of the stream. Every byte is
+    scanned for line separators only once, so very long lines are handled in linear time.
+
+    Parameters
+    ----------
+    src : BinaryIO
+        The input stream.
+    dst : BinaryIO
+        The output stream.
+    comment : str
+        The EOF comment to be ensured.
+    **kwargs
+        Contains the ``newline`` boolean attribute and the ``encoding`` of the stream.
+
+    Returns
+    -------
+    bool
+        Whether the EOF comment had to be changed.
+
+    Raises
+    ------
+    UnicodeDecodeError
+        If the trailing lines can't be decoded. They are written unchanged before raising.
+    """
+    newline: bool = kwargs.get("newline", False)
+    encoding: str = kwargs.get("encoding", getpreferredencoding(False))
+    read = cast(BufferedReader, src).read1 if hasattr(src, "read1") else src.read
+
+    held = bytearray()
+    ends: Deque[int] = deque(maxlen=_STREAM_LOOKAHEAD)
+    scanned: int = 0
+    while chunk := read(_TAIL_BLOCK_SIZE):
+        held += chunk
+        stop: int = len(held) - 1 if held.endswith(b"\r") else len(held)
+        ends.extend(_last_separators(held, scanned, stop))
+        scanned = stop
+        if len(ends) < _STREAM_LOOKAHEAD:
+            continue
+
+        cut: int = ends.popleft()
+        dst.write(held[:cut])
+        del held[:cut]
+        scanned -= cut
+        ends = deque((end - cut for end in ends), maxlen=_STREAM_LOOKAHEAD)
+
+    offset, data = _read_tail(BytesIO(held), 2)
+    dst.write(held[:offset])
+    try:
+        text: str = data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+    except UnicodeDecodeError:
+        dst.write(data)
+        raise
+
+    line, had_nwl, crlf = _last_line(text.split("\n"))
+    if line == comment and (had_nwl or not newline):
+        dst.write(data)
+        return False
+
+    dst.write(
+        _patch_tail(
+            data,
+            comment,
+            newline=newline,
+            had_nwl=had_nwl,
+            matching=matches(line),
+            crlf=crlf,
+            encoding=encoding,
+        )
+    )
+    return True
+
+
+def get_last_line(file: TextIOWrapper) -> LineBool:
+    """
+    Return the last line of a file and indicates whether it already has a newline.
+
+    Only the tail of seekable files is read, regardless of their size.
+
+    Parameters
+    ----------
+    file : TextIOWrapper
+        The file to retrieve the last line data from.
+
+    Returns
+    -------
+    LineBool
+        An object containing both the last line in a string and a boolean indicating a newline.
+    """
+    if file.seekable():
+        data: List[str] = _decode_tail(file, 2)[1].split("\n")
+    else:
+        data = file.read().split("\n")
+
+    file.close()
+
+    return _last_line(data)
+
+
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -1,21 +1,102 @@
 from io import TextIOWrapper
+from os import DirEntry
+from re import Pattern
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
-from .types import BatchPairDict, BatchPathDict, LineBool
+from .types import BatchPairDict, BatchPathDict, EOFCommentSearch, LineBool
 
 __all__ = [
+    "DEFAULT_MAX_OPEN",
+    "ENGINES",
     "EXCLUDED_DIRS",
+    "MMAP_THRESHOLD",
+    "SNIFF_SIZE",
     "bootstrap_paths",
+    "build_suffix_index",
+    "compile_excludes",
+    "encode_comments",
+    "filter_stream",
     "get_last_line",
+    "io_counters",
+    "is_excluded",
+    "iter_changed_paths",
+    "iter_file_list",
+    "iter_paths",
+    "iter_tracked_paths",
+    "looks_binary",
+    "match_suffix",
     "modify_file",
+    "modify_file_tail",
+    "modify_tail_bytes",
+    "open_batch_path",
     "open_batch_paths",
+    "scan_dir",
+    "search_tail_bytes",
+    "sniff_encoding",
+    "tail_matches",
     "try_open",
 ]
 
 EXCLUDED_DIRS: list[str]
+DEFAULT_MAX_OPEN: int
+MMAP_THRESHOLD: int
+SNIFF_SIZE: int
+ENGINES: tuple[str, str]
+
+def io_counters() -> tuple[int, int]:
+    """
+    Get the amount of bytes read from and written to files by the current thread so far.
+
+    Only the reads and writes done while checking and fixing files are counted.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The amount of bytes read and written.
+    """
+
+def looks_binary(fpath: str) -> bool:
+    """
+    Check whether a file looks binary, without decoding any of its contents.
+
+    Like git does, a file is considered binary if a bounded sample of it contains a NUL byte.
+    Files with a UTF-16/UTF-32 BOM are considered binary as well.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+
+    Returns
+    -------
+    bool
+        Whether the file looks binary.
+    """
+
+def sniff_encoding(fpath: str) -> str | None:
+    """
+    Detect whether a file is text and how it should be decoded, reading a bounded sample only.
+
+    At most ``SNIFF_SIZE`` bytes from both the head and the tail of the file are read.
+    Files with a UTF-16/UTF-32 BOM or a NUL byte in the sample are considered binary.
+    The sample is then validated with an incremental decoder, so a multi-byte character
+    cut at either end of it doesn't count as an error.
+
+    Parameters
+    ----------
+    fpath : str
+        The file path to be sniffed.
+
+    Returns
+    -------
+    str or None
+        The encoding to read the file with (``"utf-8-sig"`` if it has a UTF-8 BOM, otherwise
+        the preferred locale encoding), or ``None`` if the file isn't decodable text.
+    """
 
 def try_open(fpath: str) -> bool:
     """
-    Try to open a file, unless a ``UnicodeDecodeError`` triggers.
+    Check whether a file can be decoded, without reading all of its contents.
 
     Parameters
     ----------
@@ -25,10 +106,220 @@ def try_open(fpath: str) -> bool:
     Returns
     -------
     bool
-        Whether the file triggers a ``UnicodeDecodeError`` or not.
+        Whether the file looks like decodable text.
+
+    See Also
+    --------
+    sniff_encoding : The bounded sniffing is done here.
+    """
+
+def build_suffix_index(exts: Iterable[str]) -> dict[str, Any]:
+    """
+    Build a reversed-suffix trie of file extensions.
+
+    Each node is a dictionary keyed by characters, read from the end of the extension.
+    The node where an extension ends stores it under the empty-string key.
+
+    Parameters
+    ----------
+    exts : Iterable[str]
+        The file extensions to be indexed.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The root node of the trie.
+    """
+
+def match_suffix(name: str, index: dict[str, Any]) -> str | None:
+    """
+    Find the longest indexed file extension the given file name ends with.
+
+    Parameters
+    ----------
+    name : str
+        The file name.
+    index : Dict[str, Any]
+        The trie generated by ``build_suffix_index()``.
+
+    Returns
+    -------
+    str or None
+        The longest matching file extension, or ``None`` if there is none.
+    """
+
+def compile_excludes(patterns: Iterable[str]) -> Pattern[str] | None:
+    """
+    Compile a list of glob patterns into a single regular expression.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        The glob patterns (e.g. ``"vendor"`` or ``"docs/*.md"``).
+
+    Returns
+    -------
+    re.Pattern[str] or None
+        The compiled pattern, or ``None`` if no glob patterns were given.
+    """
+
+def scan_dir(
+    path: str,
+    excluded: frozenset[str],
+    excludes: Pattern[str] | None,
+    rel: str = "",
+    enter: Callable[[str], bool] | None = None,
+) -> Iterator[DirEntry[str]]:
+    """
+    Lazily yield the files inside a directory and below, pruning excluded directories.
+
+    Directories are traversed top-down in the same order as ``os.walk()``, and symbolic links
+    to directories are not followed. The type information of each ``os.DirEntry`` is reused,
+    so no extra ``stat`` calls are made. The ``on_dir_enter`` hooks are emitted for every
+    directory scanned.
+
+    Parameters
+    ----------
+    path : str
+        The target directory.
+    excluded : FrozenSet[str]
+        The directory names to be skipped.
+    excludes : re.Pattern[str] or None
+        The compiled exclusion globs, matched against both the name and the relative path
+        of every entry.
+    rel : str, optional, default=""
+        The path of the directory relative to the one the exclusion globs are relative to,
+        using forward slashes and ending with one (e.g. ``"src/"``), if they differ.
+    enter : Callable[[str], bool], optional, default=None
+        A function called with every directory before it is scanned. If it returns ``False``
+        the directory is skipped.
+
+    Yields
+    ------
+    os.DirEntry[str]
+        The ``DirEntry`` object of each file found.
+    """
+
+def iter_file_list(source: str, null: bool = False) -> Iterator[str]:
+    """
+    Lazily read a list of paths from a file or from stdin.
+
+    If the list can't be opened or read, the program is killed with exit code 1.
+
+    Parameters
+    ----------
+    source : str
+        The path of the list file, or ``"-"`` for stdin.
+    null : bool, optional, default=False
+        Whether the paths are separated by NUL characters instead of newlines.
+
+    Yields
+    ------
+    str
+        Every non-empty path in the list, as soon as it is read.
+    """
+
+def iter_paths(
+    paths: Iterable[str], exts: list[str], excludes: list[str] | None = None
+) -> Iterator[BatchPairDict]:
+    """
+    Lazily yield all the matching paths in the given directories and below.
+
+    Directories listed in ``EXCLUDED_DIRS`` are never descended into. Every file is matched
+    only once (even if more than one of the given paths lead to it), against the longest
+    file extension it ends with, and the ``on_file_matched`` hooks are emitted for it.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The specified directory paths. Files are matched directly, without any walking.
+    exts : List[str]
+        A list of specified file extensions.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+
+    Yields
+    ------
+    BatchPairDict
+        A ``BatchPairDict`` object for each matching file, as soon as it is found.
+    """
+
+def is_excluded(rel: str, excluded: frozenset[str], excludes: Pattern[str] | None) -> bool:
+    """
+    Check whether a relative file path would be pruned by ``scan_dir()``.
+
+    Parameters
+    ----------
+    rel : str
+        The file path, relative to the target directory and using forward slashes.
+    excluded : FrozenSet[str]
+        The directory names to be skipped.
+    excludes : re.Pattern[str] or None
+        The compiled exclusion globs, matched against both the name and the relative path
+        of every component.
+
+    Returns
+    -------
+    bool
+        Whether the file or any of its parent directories is excluded.
     """
 
-def bootstrap_paths(paths: list[str], exts: list[str]) -> list[BatchPairDict]:
+def iter_tracked_paths(
+    paths: Iterable[str], exts: list[str], excludes: list[str] | None = None
+) -> Iterator[BatchPairDict]:
+    """
+    Lazily yield all the matching paths tracked by git in the given directories and below.
+
+    The paths are listed from the local ``.git/index`` file instead of walking the filesystem,
+    so untracked files are never matched. Directories outside a git work tree (or whose index
+    can't be read) are walked like ``iter_paths()`` does. Exclusions work the same way.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The specified directory paths. Files are matched directly, without any walking.
+    exts : List[str]
+        A list of specified file extensions.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+
+    Yields
+    ------
+    BatchPairDict
+        A ``BatchPairDict`` object for each matching file that exists in the work tree.
+    """
+
+def iter_changed_paths(
+    paths: Iterable[str], exts: list[str], ref: str, excludes: list[str] | None = None
+) -> Iterator[BatchPairDict]:
+    """
+    Lazily yield all the matching paths changed since a git revision in the given directories.
+
+    The changed paths are obtained from ``git diff``, so only the files touched since ``ref``
+    (committed or not) are matched. The program is killed if a directory is outside a git
+    work tree or the revision can't be resolved, so a mistyped revision never passes silently.
+    Exclusions work the same way as in ``iter_paths()``.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The specified directory paths. Files are matched directly, without any walking.
+    exts : List[str]
+        A list of specified file extensions.
+    ref : str
+        The git revision to compare against.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+
+    Yields
+    ------
+    BatchPairDict
+        A ``BatchPairDict`` object for each matching file that exists in the work tree.
+    """
+
+def bootstrap_paths(
+    paths: list[str], exts: list[str], excludes: list[str] | None = None
+) -> list[BatchPairDict]:
     """
     Bootstrap all the matching paths in current dir and below.
 
@@ -38,6 +329,8 @@ def bootstrap_paths(paths: list[str], exts: list[str]) -> list[BatchPairDict]:
         A list of specified file paths.
     exts : List[str]
         A list of specified file extensions.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
 
     Returns
     -------
@@ -45,6 +338,21 @@ def bootstrap_paths(paths: list[str], exts: list[str]) -> list[BatchPairDict]:
         A list of ``BatchPairDict`` type objects.
     """
 
+def open_batch_path(path: BatchPairDict) -> BatchPathDict | None:
+    """
+    Open a single file given its ``BatchPairDict`` object.
+
+    Parameters
+    ----------
+    path : BatchPairDict
+        The ``BatchPairDict`` object of the target file.
+
+    Returns
+    -------
+    BatchPathDict or None
+        The opened ``BatchPathDict`` object, or ``None`` if the file can't be opened.
+    """
+
 def open_batch_paths(paths: list[BatchPairDict]) -> dict[str, BatchPathDict]:
     """
     Return a list of TextIO objects given file path strings.
@@ -81,10 +389,155 @@ def modify_file(file: TextIOWrapper, comments: dict[str, str], ext: str, **kwarg
         The modified contents of the given file.
     """
 
+def modify_file_tail(fpath: str, comment: str, **kwargs) -> int:
+    """
+    Modify a file containing a bad EOF comment by rewriting only its tail.
+
+    The file is truncated where its last lines start and the patched lines are appended,
+    so the rest of its contents is never read nor written.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file to be modified.
+    comment : str
+        The EOF comment to be inserted.
+    **kwargs
+        Contains the ``newline``, ``matching`` and ``crlf`` boolean attributes,
+        as well as the ``encoding`` of the file.
+
+    Returns
+    -------
+    int
+        The amount of bytes written.
+    """
+
+def encode_comments(comments: dict[str, str]) -> dict[str, dict[bytes, bytes]]:
+    """
+    Encode every EOF comment once, for the byte-level engine.
+
+    The default comments are taken already encoded from ``comments.table.COMMENT_BYTES``,
+    only the customized ones are encoded here.
+
+    Parameters
+    ----------
+    comments : Dict[str, str]
+        A filetype-to-comment dictionary.
+
+    Returns
+    -------
+    Dict[str, Dict[bytes, bytes]]
+        The encoded comment line of each filetype, keyed by its line separator
+        (none, LF, CRLF or CR).
+    """
+
+def search_tail_bytes(
+    fpath: str, ext: str, comment: dict[bytes, bytes], newline: bool
+) -> EOFCommentSearch | None:
+    """
+    Check the EOF comment of a file by comparing raw bytes only.
+
+    The last line of the file, including its own line separator, is compared against the
+    precomputed comment line for that separator, so nothing is ever decoded.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+    ext : str
+        The file-type/file-extension.
+    comment : Dict[bytes, bytes]
+        The encoded comment lines of the filetype, as returned by ``encode_comments()``.
+    newline : bool
+        Whether an empty line is required before the comment.
+
+    Returns
+    -------
+    EOFCommentSearch or None
+        The search data needed to fix the file, or ``None`` if it's already correct.
+    """
+
+def modify_tail_bytes(fpath: str, comment: dict[bytes, bytes], **kwargs) -> int:
+    """
+    Modify a file containing a bad EOF comment by patching its raw tail.
+
+    Only the bytes from the replaced line onwards are rewritten, using the line separator
+    already found in the file, so everything else round-trips byte for byte.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file to be modified.
+    comment : Dict[bytes, bytes]
+        The encoded comment lines of the filetype, as returned by ``encode_comments()``.
+    **kwargs
+        Contains the ``newline`` and ``matching`` boolean attributes.
+
+    Returns
+    -------
+    int
+        The amount of bytes written.
+    """
+
+def tail_matches(fpath: str, comment: bytes, newline: bool) -> bool:
+    """
+    Check whether a file already ends with the given EOF comment, without decoding it.
+
+    The file is memory-mapped and only the bytes around the comment are compared, so only
+    its last pages are ever touched. A ``False`` result means that the file has to be checked
+    the regular way, not that it's wrong.
+
+    Parameters
+    ----------
+    fpath : str
+        The path of the file.
+    comment : bytes
+        The encoded EOF comment.
+    newline : bool
+        Whether an empty line is required before the comment.
+
+    Returns
+    -------
+    bool
+        Whether the file is known to be correct.
+    """
+
+def filter_stream(src: BinaryIO, dst: BinaryIO, comment: str, **kwargs) -> bool:
+    """
+    Copy a stream while ensuring its EOF comment, holding back only its last few lines.
+
+    Everything but a small lookahead buffer of trailing lines is written to ``dst`` as soon as
+    it is read, so the memory used doesn't depend on the size of the stream. Every byte is
+    scanned for line separators only once, so very long lines are handled in linear time.
+
+    Parameters
+    ----------
+    src : BinaryIO
+        The input stream.
+    dst : BinaryIO
+        The output stream.
+    comment : str
+        The EOF comment to be ensured.
+    **kwargs
+        Contains the ``newline`` boolean attribute and the ``encoding`` of the stream.
+
+    Returns
+    -------
+    bool
+        Whether the EOF comment had to be changed.
+
+    Raises
+    ------
+    UnicodeDecodeError
+        If the trailing lines can't be decoded. They are written unchanged before raising.
+    """
+
 def get_last_line(file: TextIOWrapper) -> LineBool:
     """
     Return the last line of a file and indicates whether it already has a newline.
 
+    Only the tail of seekable files is read, regardless of their size.
+
     Parameters
     ----------
     file : TextIOWrapper
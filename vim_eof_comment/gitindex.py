@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+Git repository utilities.
+
+The index is read in pure Python; only ``changed_paths()`` runs the ``git`` executable.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+__all__ = ["changed_paths", "entry_is_clean", "find_repo", "object_format", "read_index"]
+
+from os import stat_result
+from os.path import dirname, isdir, isfile, join
+from stat import S_IFMT, S_IFREG
+from struct import Struct
+from struct import error as struct_error
+from typing import Iterator, List, Tuple
+
+from .types import IndexEntry
+
+_HEADER = Struct(">4sLL")
+_ENTRY = Struct(">10L")
+_FLAGS = Struct(">H")
+
+_SIGNATURE: bytes = b"DIRC"
+_HASH_SIZES = {"sha1": 20, "sha256": 32}
+
+_NAME_MASK: int = 0x0FFF
+_STAGE_MASK: int = 0x3000
+_EXTENDED: int = 0x4000
+_SKIP_WORKTREE: int = 0x4000
+_INTENT_TO_ADD: int = 0x2000
+
+_MASK_32: int = 0xFFFFFFFF
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """
+    Decode an offset varint, as used by the version 4 index format.
+
+    Parameters
+    ----------
+    data : bytes
+        The index data.
+    offset : int
+        The offset of the varint.
+
+    Returns
+    -------
+    Tuple[int, int]
+        The decoded value and the offset right after the varint.
+    """
+    byte = data[offset]
+    offset += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[offset]
+        offset += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+
+    return value, offset
+
+
+def find_repo(path: str) -> Tuple[str, str] | None:
+    """
+    Find the git repository containing the given directory.
+
+    Both ``.git`` directories and ``.git`` files (as used by worktrees and submodules)
+    are supported.
+
+    Parameters
+    ----------
+    path : str
+        The absolute path of a directory.
+
+    Returns
+    -------
+    Tuple[str, str] or None
+        The work tree and the git directory, or ``None`` if the directory isn't inside
+        a git work tree.
+    """
+    while True:
+        dotgit = join(path, ".git")
+        if isdir(dotgit) and isfile(join(dotgit, "HEAD")):
+            return path, dotgit
+
+        if isfile(dotgit):
+            with open(dotgit, "r") as file:
+                line = file.readline().strip()
+
+            if line.startswith("gitdir:"):
+                return path, join(path, line[7:].strip())
+
+        parent = dirname(path)
+        if parent == path:
+            return None
+
+        path = parent
+
+
+def object_format(git_dir: str) -> str:
+    """
+    Get the object format (hash algorithm) of a git repository.
+
+    Parameters
+    ----------
+    git_dir : str
+        The git directory.
+
+    Returns
+    -------
+    str
+        Either ``"sha1"`` or ``"sha256"``.
+    """
+    common_dir = git_dir
+    if isfile(join(git_dir, "commondir")):
+        with open(join(git_dir, "commondir"), "r") as file:
+            common_dir = join(git_dir, file.read().strip())
+
+    try:
+        with open(join(common_dir, "config"), "r") as file:
+            section = ""
+            for line in file:
+                line = line.strip()
+                if line.startswith("["):
+                    section = line[1:line.find("]")].strip().lower()
+                    continue
+
+                key, _, value = line.partition("=")
+                if section == "extensions" and key.strip().lower() == "objectformat":
+                    return value.strip().lower()
+    except OSError:
+        pass
+
+    return "sha1"
+
+
+def read_index(git_dir: str) -> Iterator[IndexEntry]:
+    """
+    Read the stage 0 regular file entries of a git index.
+
+    The version 2, 3 and 4 index formats are supported, for both SHA-1 and SHA-256
+    repositories. Conflicted, skip-worktree and intent-to-add entries are left out.
+
+    Parameters
+    ----------
+    git_dir : str
+        The git directory.
+
+    Yields
+    ------
+    IndexEntry
+        Every regular file entry, in index order.
+
+    Raises
+    ------
+    ValueError
+        If the index is truncated or corrupt, or its version isn't supported.
+    """
+    with open(join(git_dir, "index"), "rb") as file:
+        data = file.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Truncated git index in `{git_dir}`")
+
+    signature, version, count = _HEADER.unpack_from(data, 0)
+    if signature != _SIGNATURE or version not in (2, 3, 4):
+        raise ValueError(f"Unsupported git index in `{git_dir}`")
+
+    hash_size = _HASH_SIZES.get(object_format(git_dir), 20)
+    limit = len(data) - hash_size  # Every entry is followed by at least the checksum
+    offset = _HEADER.size
+    previous = b""
+    for _ in range(count):
+        start = offset
+        try:
+            fields = _ENTRY.unpack_from(data, offset)
+            offset += _ENTRY.size
+            oid = data[offset:offset + hash_size].hex()
+            offset += hash_size
+            (flags,) = _FLAGS.unpack_from(data, offset)
+            offset += _FLAGS.size
+
+            extended = 0
+            if flags & _EXTENDED:
+                (extended,) = _FLAGS.unpack_from(data, offset)
+                offset += _FLAGS.size
+
+            if version == 4:
+                strip, offset = _read_varint(data, offset)
+                end = data.index(b"\0", offset)
+                name = previous[:len(previous) - strip] + data[offset:end]
+                offset = end + 1
+            else:
+                length = flags & _NAME_MASK
+                end = offset + length if length < _NAME_MASK else data.index(b"\0", offset)
+                name = data[offset:end]
+                offset = start + ((end - start + 8) & ~7)
+        except (IndexError, ValueError, struct_error) as e:
+            raise ValueError(f"Truncated git index in `{git_dir}`") from e
+
+        if offset > limit:
+            raise ValueError(f"Truncated git index in `{git_dir}`")
+
+        previous = name
+        mode = fields[6]
+        if flags & _STAGE_MASK or extended & (_SKIP_WORKTREE | _INTENT_TO_ADD):
+            continue
+
+        if S_IFMT(mode) != S_IFREG:
+            continue
+
+        yield IndexEntry(
+            path=name.decode("utf-8", "surrogateescape"),
+            oid=oid,
+            mode=mode,
+            ino=fields[5],
+            size=fields[9],
+            mtime=(fields[2], fields[3]),
+        )
+
+
+def entry_is_clean(entry: IndexEntry, st: stat_result, index_mtime: int) -> bool:
+    """
+    Check whether a file still matches its index entry, judging by its stat data only.
+
+    Entries that are as recent as the index itself ("racily clean" entries) are never
+    trusted, just like git does.
+
+    Parameters
+    ----------
+    entry : IndexEntry
+        The index entry of the file.
+    st : os.stat_result
+        The current stat data of the file.
+    index_mtime : int
+        The modification time of the index file, in nanoseconds.
+
+    Returns
+    -------
+    bool
+        Whether the blob ID of the entry can be trusted for the file.
+    """
+    seconds, nanoseconds = entry.mtime
+    if st.st_size & _MASK_32 != entry.size or st.st_ino & _MASK_32 != entry.ino:
+        return False
+
+    if (st.st_mtime_ns // 1_000_000_000) & _MASK_32 != seconds:
+        return False
+
+    if nanoseconds and st.st_mtime_ns % 1_000_000_000 != nanoseconds:
+        return False
+
+    return seconds * 1_000_000_000 + nanoseconds < index_mtime
+
+
+def _git(work_tree: str, *args: str) -> bytes:
+    """
+    Run a ``git`` command inside a work tree.
+
+    Parameters
+    ----------
+    work_tree : str
+        The work tree.
+    *args : str
+        The arguments of the command.
+
+    Returns
+    -------
+    bytes
+        The standard output of the command.
+
+    Raises
+    ------
+    ValueError
+        If ``git`` can't be run or the command fails.
+    """
+    from subprocess import DEVNULL, run
+
+    try:
+        proc = run(["git", "-C", work_tree, *args], stdin=DEVNULL, capture_output=True)
+    except OSError as e:
+        raise ValueError(f"Unable to run git: {e}") from e
+
+    if proc.returncode != 0:
+        lines = proc.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise ValueError(lines[0] if lines else f"git exited with code {proc.returncode}")
+
+    return proc.stdout
+
+
+def changed_paths(work_tree: str, ref: str) -> List[str]:
+    """
+    List the files changed in a work tree since it diverged from the given git revision.
+
+    The work tree is compared against the merge base of ``ref`` and ``HEAD``, so changes
+    made upstream after the branch point (e.g. on ``origin/main``) are left out. Both committed
+    and uncommitted changes to tracked files are included, deleted files aren't.
+
+    Parameters
+    ----------
+    work_tree : str
+        The work tree.
+    ref : str
+        The git revision to compare against.
+
+    Returns
+    -------
+    List[str]
+        The paths of the changed files, relative to the work tree and using forward slashes.
+
+    Raises
+    ------
+    ValueError
+        If ``git`` can't be run, or the revision is invalid or can't be resolved.
+    """
+    if not ref or ref.startswith("-"):
+        raise ValueError(f"Invalid git revision `{ref}`")
+
+    base = _git(work_tree, "merge-base", ref, "HEAD").decode("ascii").strip()
+    out = _git(work_tree, "diff", "--name-only", "-z", "--diff-filter=d", base, "--")
+    return [path for path in out.decode("utf-8", "surrogateescape").split("\0") if path]
+
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -0,0 +1,113 @@
+from os import stat_result
+from typing import Iterator, List, Tuple
+
+from .types import IndexEntry
+
+__all__ = ["changed_paths", "entry_is_clean", "find_repo", "object_format", "read_index"]
+
+def find_repo(path: str) -> Tuple[str, str] | None:
+    """
+    Find the git repository containing the given directory.
+
+    Both ``.git`` directories and ``.git`` files (as used by worktrees and submodules)
+    are supported.
+
+    Parameters
+    ----------
+    path : str
+        The absolute path of a directory.
+
+    Returns
+    -------
+    Tuple[str, str] or None
+        The work tree and the git directory, or ``None`` if the directory isn't inside
+        a git work tree.
+    """
+
+def object_format(git_dir: str) -> str:
+    """
+    Get the object format (hash algorithm) of a git repository.
+
+    Parameters
+    ----------
+    git_dir : str
+        The git directory.
+
+    Returns
+    -------
+    str
+        Either ``"sha1"`` or ``"sha256"``.
+    """
+
+def read_index(git_dir: str) -> Iterator[IndexEntry]:
+    """
+    Read the stage 0 regular file entries of a git index.
+
+    The version 2, 3 and 4 index formats are supported, for both SHA-1 and SHA-256
+    repositories. Conflicted, skip-worktree and intent-to-add entries are left out.
+
+    Parameters
+    ----------
+    git_dir : str
+        The git directory.
+
+    Yields
+    ------
+    IndexEntry
+        Every regular file entry, in index order.
+
+    Raises
+    ------
+    ValueError
+        If the index is truncated or corrupt, or its version isn't supported.
+    """
+
+def entry_is_clean(entry: IndexEntry, st: stat_result, index_mtime: int) -> bool:
+    """
+    Check whether a file still matches its index entry, judging by its stat data only.
+
+    Entries that are as recent as the index itself ("racily clean" entries) are never
+    trusted, just like git does.
+
+    Parameters
+    ----------
+    entry : IndexEntry
+        The index entry of the file.
+    st : os.stat_result
+        The current stat data of the file.
+    index_mtime : int
+        The modification time of the index file, in nanoseconds.
+
+    Returns
+    -------
+    bool
+        Whether the blob ID of the entry can be trusted for the file.
+    """
+
+def changed_paths(work_tree: str, ref: str) -> List[str]:
+    """
+    List the files changed in a work tree since it diverged from the given git revision.
+
+    The work tree is compared against the merge base of ``ref`` and ``HEAD``, so changes
+    made upstream after the branch point (e.g. on ``origin/main``) are left out. Both committed
+    and uncommitted changes to tracked files are included, deleted files aren't.
+
+    Parameters
+    ----------
+    work_tree : str
+        The work tree.
+    ref : str
+        The git revision to compare against.
+
+    Returns
+    -------
+    List[str]
+        The paths of the changed files, relative to the work tree and using forward slashes.
+
+    Raises
+    ------
+    ValueError
+        If ``git`` can't be run, or the revision is invalid or can't be resolved.
+    """
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+Profiling and tracing hooks.
+
+Callbacks can be attached to the following events:
+
+* ``on_dir_enter(path)``: a directory is about to be scanned.
+* ``on_file_matched(fpath, ext)``: a file matched one of the specified file extensions.
+* ``on_file_checked(fpath, verdict, bytes_read, elapsed)``: a file was checked, where
+  ``verdict`` is one of ``VERDICTS``.
+* ``on_file_written(fpath, bytes_written, elapsed)``: the EOF comment of a file was fixed.
+
+Callbacks may be called from worker threads, so they must be thread-safe. An exception raised
+by a callback is reported to stderr and otherwise ignored, so it never aborts a run. When nothing
+is registered for an event, emitting it costs no more than checking an empty tuple.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+__all__ = ["EVENTS", "VERDICTS", "callbacks", "clear", "emit", "register", "unregister", "verdict"]
+
+from threading import Lock
+from typing import Any, Callable, Dict, Tuple
+
+from .types import CheckResult
+from .util import error
+
+EVENTS: Tuple[str, ...] = ("on_dir_enter", "on_file_matched", "on_file_checked", "on_file_written")
+VERDICTS: Tuple[str, ...] = ("unchanged", "changed", "skipped", "failed")
+
+_LOCK = Lock()
+_HOOKS: Dict[str, Tuple[Callable[..., None], ...]] = dict.fromkeys(EVENTS, ())
+
+
+def _check_event(event: str) -> None:
+    """
+    Make sure an event is known.
+
+    Parameters
+    ----------
+    event : str
+        The name of the event.
+
+    Raises
+    ------
+    ValueError
+        If the event isn't one of ``EVENTS``.
+    """
+    if event not in _HOOKS:
+        raise ValueError(f"Unknown hook event `{event}`")
+
+
+def register(event: str, callback: Callable[..., None]) -> None:
+    """
+    Attach a callback to an event.
+
+    The same callback can be attached more than once, and will be called that many times.
+
+    Parameters
+    ----------
+    event : str
+        One of ``EVENTS``.
+    callback : Callable[..., None]
+        The function to be called with the arguments of the event.
+
+    Raises
+    ------
+    ValueError
+        If the event is unknown.
+    """
+    _check_event(event)
+    with _LOCK:
+        _HOOKS[event] = (*_HOOKS[event], callback)
+
+
+def unregister(event: str, callback: Callable[..., None]) -> None:
+    """
+    Detach a callback from an event.
+
+    Parameters
+    ----------
+    event : str
+        One of ``EVENTS``.
+    callback : Callable[..., None]
+        The function attached with ``register()``. Only its last attachment is removed.
+
+    Raises
+    ------
+    ValueError
+        If the event is unknown or the callback isn't attached to it.
+    """
+    _check_event(event)
+    with _LOCK:
+        hooks = list(_HOOKS[event])
+        if callback not in hooks:
+            raise ValueError(f"Callback not registered for hook event `{event}`")
+
+        del hooks[len(hooks) - 1 - hooks[::-1].index(callback)]
+        _HOOKS[event] = tuple(hooks)
+
+
+def clear(event: str | None = None) -> None:
+    """
+    Detach all the callbacks from an event.
+
+    Parameters
+    ----------
+    event : str, optional, default=None
+        One of ``EVENTS``. If ``None`` every event is cleared.
+
+    Raises
+    ------
+    ValueError
+        If the event is unknown.
+    """
+    if event is not None:
+        _check_event(event)
+
+    with _LOCK:
+        for name in EVENTS if event is None else (event,):
+            _HOOKS[name] = ()
+
+
+def callbacks(event: str) -> Tuple[Callable[..., None], ...]:
+    """
+    Get the callbacks currently attached to an event.
+
+    The returned tuple is a snapshot, so hot loops should fetch it once and iterate over it
+    (or skip any extra work if it's empty).
+
+    Parameters
+    ----------
+    event : str
+        One of ``EVENTS``.
+
+    Returns
+    -------
+    Tuple[Callable[..., None], ...]
+        The attached callbacks, in registration order.
+
+    Raises
+    ------
+    ValueError
+        If the event is unknown.
+    """
+    _check_event(event)
+    return _HOOKS[event]
+
+
+def emit(hooks: Tuple[Callable[..., None], ...], *args: Any) -> None:
+    """
+    Call the given callbacks, reporting (and otherwise ignoring) any exception they raise.
+
+    Parameters
+    ----------
+    hooks : Tuple[Callable[..., None], ...]
+        The callbacks returned by ``callbacks()``.
+    *args : Any
+        The arguments of the event.
+    """
+    for callback in hooks:
+        try:
+            callback(*args)
+        except Exception as e:
+            name: str = getattr(callback, "__qualname__", repr(callback))
+            error(f"Hook `{name}` raised {type(e).__name__}: {e}\n", end="")
+
+
+def verdict(result: CheckResult | None) -> str:
+    """
+    Get the verdict of a check, as passed to the ``on_file_checked`` callbacks.
+
+    Parameters
+    ----------
+    result : CheckResult or None
+        The result of the check, or ``None`` if the file couldn't be decoded.
+
+    Returns
+    -------
+    str
+        One of ``VERDICTS``.
+    """
+    if result is None:
+        return "skipped"
+
+    if result.error is not None:
+        return "failed"
+
+    return "changed" if result.changed else "unchanged"
+
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -0,0 +1,111 @@
+from typing import Any, Callable
+
+from .types import CheckResult
+
+__all__ = ["EVENTS", "VERDICTS", "callbacks", "clear", "emit", "register", "unregister", "verdict"]
+
+EVENTS: tuple[str, ...]
+VERDICTS: tuple[str, ...]
+
+def register(event: str, callback: Callable[..., None]) -> None:
+    """
+    Attach a callback to an event.
+
+    The same callback can be attached more than once, and will be called that many times.
+
+    Parameters
+    ----------
+    event : str
+        One of ``EVENTS``.
+    callback : Callable[..., None]
+        The function to be called with the arguments of the event.
+
+    Raises
+    ------
+    ValueError
+        If the event is unknown.
+    """
+
+def unregister(event: str, callback: Callable[..., None]) -> None:
+    """
+    Detach a callback from an event.
+
+    Parameters
+    ----------
+    event : str
+        One of ``EVENTS``.
+    callback : Callable[..., None]
+        The function attached with ``register()``. Only its last attachment is removed.
+
+    Raises
+    ------
+    ValueError
+        If the event is unknown or the callback isn't attached to it.
+    """
+
+def clear(event: str | None = None) -> None:
+    """
+    Detach all the callbacks from an event.
+
+    Parameters
+    ----------
+    event : str, optional, default=None
+        One of ``EVENTS``. If ``None`` every event is cleared.
+
+    Raises
+    ------
+    ValueError
+        If the event is unknown.
+    """
+
+def callbacks(event: str) -> tuple[Callable[..., None], ...]:
+    """
+    Get the callbacks currently attached to an event.
+
+    The returned tuple is a snapshot, so hot loops should fetch it once and iterate over it
+    (or skip any extra work if it's empty).
+
+    Parameters
+    ----------
+    event : str
+        One of ``EVENTS``.
+
+    Returns
+    -------
+    Tuple[Callable[..., None], ...]
+        The attached callbacks, in registration order.
+
+    Raises
+    ------
+    ValueError
+        If the event is unknown.
+    """
+
+def emit(hooks: tuple[Callable[..., None], ...], *args: Any) -> None:
+    """
+    Call the given callbacks, reporting (and otherwise ignoring) any exception they raise.
+
+    Parameters
+    ----------
+    hooks : Tuple[Callable[..., None], ...]
+        The callbacks returned by ``callbacks()``.
+    *args : Any
+        The arguments of the event.
+    """
+
+def verdict(result: CheckResult | None) -> str:
+    """
+    Get the verdict of a check, as passed to the ``on_file_checked`` callbacks.
+
+    Parameters
+    ----------
+    result : CheckResult or None
+        The result of the check, or ``None`` if the file couldn't be decoded.
+
+    Returns
+    -------
+    str
+        One of ``VERDICTS``.
+    """
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
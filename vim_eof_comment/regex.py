@@ -6,16 +6,25 @@ EOF comments checker regex matching utilities.
 Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 """
 
-__all__ = ["matches"]
+__all__ = ["matches", "matches_bytes", "matches_many"]
 
 from re import Pattern, compile
-from typing import List
+from typing import Iterable, List
+
+_OPTION: str = "[a-zA-Z]+(?:=[a-zA-Z0-9_]*)?"
+_MODELINE: Pattern[str] = compile(
+    f"vim:(?:(?:{_OPTION}:)+|\\sset(?:\\s{_OPTION})*\\s{_OPTION}:)"
+)
+_MODELINE_BYTES: Pattern[bytes] = compile(_MODELINE.pattern.encode("ascii"))
 
 
 def matches(s: str) -> bool:
     """
     Check if given string matches any of the given patterns.
 
+    Both the ``vim:opt=val:`` and the ``vim: set opt=val:`` modeline syntaxes are matched
+    by a single precompiled pattern.
+
     Parameters
     ----------
     s : str
@@ -26,15 +35,42 @@ def matches(s: str) -> bool:
     bool
         Whether the string matches the default regex.
     """
-    pats: List[Pattern[str]] = [
-        compile("vim:([a-zA-Z]+(=[a-zA-Z0-9_]*)?:)+"),
-        compile("vim:\\sset(\\s[a-zA-Z]+(=[a-zA-Z0-9_]*)?)*\\s[a-zA-Z]+(=[a-zA-Z0-9_]*)?:"),
-    ]
-    for pattern in pats:
-        if pattern.search(s) is not None:
-            return True
-
-    return False
+    return _MODELINE.search(s) is not None
+
+
+def matches_bytes(s: bytes | memoryview) -> bool:
+    """
+    Check if given raw line matches any of the given patterns, without decoding it.
+
+    Parameters
+    ----------
+    s : bytes or memoryview
+        The line to be matched.
+
+    Returns
+    -------
+    bool
+        Whether the line matches the default regex.
+    """
+    return _MODELINE_BYTES.search(s) is not None
+
+
+def matches_many(lines: Iterable[str]) -> List[bool]:
+    """
+    Check if each of the given strings matches any of the given patterns.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The strings to be matched.
+
+    Returns
+    -------
+    List[bool]
+        Whether each string matches the default regex, in the same order.
+    """
+    search = _MODELINE.search
+    return [search(line) is not None for line in lines]
 
 
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -1,9 +1,14 @@
-__all__ = ["matches"]
+from typing import Iterable
+
+__all__ = ["matches", "matches_bytes", "matches_many"]
 
 def matches(s: str) -> bool:
     """
     Check if given string matches any of the given patterns.
 
+    Both the ``vim:opt=val:`` and the ``vim: set opt=val:`` modeline syntaxes are matched
+    by a single precompiled pattern.
+
     Parameters
     ----------
     s : str
@@ -15,4 +20,34 @@ def matches(s: str) -> bool:
         Whether the string matches the default regex.
     """
 
+def matches_bytes(s: bytes | memoryview) -> bool:
+    """
+    Check if given raw line matches any of the given patterns, without decoding it.
+
+    Parameters
+    ----------
+    s : bytes or memoryview
+        The line to be matched.
+
+    Returns
+    -------
+    bool
+        Whether the line matches the default regex.
+    """
+
+def matches_many(lines: Iterable[str]) -> list[bool]:
+    """
+    Check if each of the given strings matches any of the given patterns.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The strings to be matched.
+
+    Returns
+    -------
+    List[bool]
+        Whether each string matches the default regex, in the same order.
+    """
+
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+Run statistics utilities.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+__all__ = ["PHASES", "RunStats", "format_stats", "measure", "measure_iter"]
+
+from contextlib import nullcontext
+from threading import Lock
+from time import perf_counter, thread_time
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+from .file import io_counters
+from .types import CheckResult
+
+PHASES: Tuple[str, ...] = ("discovery", "open", "check", "write")
+
+_UNITS: Tuple[str, ...] = ("B", "KiB", "MiB", "GiB")
+_NO_MEASURE: ContextManager[None] = nullcontext()
+
+_T = TypeVar("_T")
+
+
+class RunStats:
+    """
+    The timings and counters of a run.
+
+    Every phase is measured in the thread doing the work, so the wall and CPU times of a phase
+    are summed over all workers and can exceed the elapsed time of the run.
+
+    Attributes
+    ----------
+    wall : Dict[str, float]
+        The wall time of every phase, in seconds.
+    cpu : Dict[str, float]
+        The CPU time of every phase, in seconds.
+    elapsed : float
+        The wall time of the whole run, in seconds.
+    files : int
+        The amount of matching files.
+    skipped : int
+        The amount of files that couldn't be decoded (e.g. binary files).
+    cached : int
+        The amount of files not read because they didn't change since their last check
+        (they are counted as unchanged or changed as well).
+    unchanged : int
+        The amount of files that already had the right EOF comment.
+    changed : int
+        The amount of files missing the right EOF comment.
+    fixed : int
+        The amount of files whose EOF comment was fixed.
+    failed : int
+        The amount of files that couldn't be checked or fixed.
+    bytes_read : int
+        The amount of bytes read from the files.
+    bytes_written : int
+        The amount of bytes written to the files.
+
+    Methods
+    -------
+    add(phase, wall, cpu, read=0, written=0)
+    add_cached()
+    count_check(result)
+    count_fix(result)
+    merge(other)
+    files_per_second()
+    """
+
+    __lock: Lock
+    wall: Dict[str, float]
+    cpu: Dict[str, float]
+    elapsed: float
+    files: int
+    skipped: int
+    cached: int
+    unchanged: int
+    changed: int
+    fixed: int
+    failed: int
+    bytes_read: int
+    bytes_written: int
+
+    def __init__(self):
+        self.__lock = Lock()
+        self.wall = dict.fromkeys(PHASES, 0.0)
+        self.cpu = dict.fromkeys(PHASES, 0.0)
+        self.elapsed = 0.0
+        self.files = 0
+        self.skipped = 0
+        self.cached = 0
+        self.unchanged = 0
+        self.changed = 0
+        self.fixed = 0
+        self.failed = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the state to be pickled, leaving the lock out.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The attributes of the object, except for its lock.
+        """
+        state = self.__dict__.copy()
+        del state["_RunStats__lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a pickled state, with a new lock.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state returned by ``__getstate__()``.
+        """
+        self.__dict__.update(state)
+        self.__lock = Lock()
+
+    def add(self, phase: str, wall: float, cpu: float, read: int = 0, written: int = 0) -> None:
+        """
+        Add a measurement to a phase.
+
+        Parameters
+        ----------
+        phase : str
+            One of ``PHASES``.
+        wall : float
+            The wall time, in seconds.
+        cpu : float
+            The CPU time, in seconds.
+        read : int, optional, default=0
+            The amount of bytes read.
+        written : int, optional, default=0
+            The amount of bytes written.
+        """
+        with self.__lock:
+            self.wall[phase] += wall
+            self.cpu[phase] += cpu
+            self.bytes_read += read
+            self.bytes_written += written
+
+    def add_cached(self) -> None:
+        """Count a file found up to date in the scan cache."""
+        with self.__lock:
+            self.cached += 1
+
+    def count_check(self, result: CheckResult | None) -> None:
+        """
+        Count the result of a check.
+
+        Parameters
+        ----------
+        result : CheckResult or None
+            The result of the check, or ``None`` if the file couldn't be decoded.
+        """
+        with self.__lock:
+            self.files += 1
+            if result is None:
+                self.skipped += 1
+            elif result.error is not None:
+                self.failed += 1
+            elif result.changed:
+                self.changed += 1
+            else:
+                self.unchanged += 1
+
+    def count_fix(self, result: CheckResult) -> None:
+        """
+        Count the result of a fix.
+
+        Parameters
+        ----------
+        result : CheckResult
+            The result returned by the fix, with its ``error`` set if the file couldn't be
+            modified.
+        """
+        if not result.changed:
+            return
+
+        with self.__lock:
+            if result.error is not None:
+                self.failed += 1
+            else:
+                self.fixed += 1
+
+    def merge(self, other: "RunStats") -> None:
+        """
+        Add the timings and counters of other statistics (e.g. from a worker process).
+
+        Parameters
+        ----------
+        other : RunStats
+            The statistics to be added.
+        """
+        with self.__lock:
+            for phase in PHASES:
+                self.wall[phase] += other.wall[phase]
+                self.cpu[phase] += other.cpu[phase]
+
+            self.files += other.files
+            self.skipped += other.skipped
+            self.cached += other.cached
+            self.unchanged += other.unchanged
+            self.changed += other.changed
+            self.fixed += other.fixed
+            self.failed += other.failed
+            self.bytes_read += other.bytes_read
+            self.bytes_written += other.bytes_written
+
+    def files_per_second(self) -> float:
+        """
+        Get the throughput of the run.
+
+        Returns
+        -------
+        float
+            The amount of files processed per second, or ``0.0`` if nothing was measured.
+        """
+        return self.files / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _Measure:
+    """
+    A context manager adding the time and I/O spent inside it to a phase.
+
+    Parameters
+    ----------
+    stats : RunStats
+        The statistics to be updated.
+    phase : str
+        One of ``PHASES``.
+    """
+
+    __stats: RunStats
+    __phase: str
+    __start: Tuple[float, float, int, int]
+
+    def __init__(self, stats: RunStats, phase: str):
+        self.__stats = stats
+        self.__phase = phase
+
+    def __enter__(self) -> None:
+        """Start measuring."""
+        self.__start = (perf_counter(), thread_time(), *io_counters())
+
+    def __exit__(self, *exc_info) -> None:
+        """
+        Stop measuring and update the statistics.
+
+        Parameters
+        ----------
+        *exc_info
+            The exception being raised, if any. It is never suppressed.
+        """
+        wall, cpu, read, written = self.__start
+        now_read, now_written = io_counters()
+        self.__stats.add(
+            self.__phase,
+            perf_counter() - wall,
+            thread_time() - cpu,
+            read=now_read - read,
+            written=now_written - written,
+        )
+
+
+def measure(stats: RunStats | None, phase: str) -> ContextManager[None]:
+    """
+    Measure a block of code as part of a phase.
+
+    Parameters
+    ----------
+    stats : RunStats or None
+        The statistics to be updated. If ``None`` nothing is measured at all.
+    phase : str
+        One of ``PHASES``.
+
+    Returns
+    -------
+    ContextManager[None]
+        The context manager to wrap the block of code with.
+    """
+    if stats is None:
+        return _NO_MEASURE
+
+    return _Measure(stats, phase)
+
+
+def measure_iter(stats: RunStats | None, phase: str, items: Iterable[_T]) -> Iterable[_T]:
+    """
+    Measure the time spent producing the items of a lazy iterable as part of a phase.
+
+    Parameters
+    ----------
+    stats : RunStats or None
+        The statistics to be updated. If ``None`` the iterable is returned as is.
+    phase : str
+        One of ``PHASES``.
+    items : Iterable[_T]
+        The iterable to be measured (e.g. a directory walk).
+
+    Returns
+    -------
+    Iterable[_T]
+        An iterable yielding the same items.
+    """
+    if stats is None:
+        return items
+
+    return _measured(stats, phase, iter(items))
+
+
+def _measured(stats: RunStats, phase: str, iterator: Iterator[_T]) -> Iterator[_T]:
+    """
+    Yield the items of an iterator, measuring every step.
+
+    Parameters
+    ----------
+    stats : RunStats
+        The statistics to be updated.
+    phase : str
+        One of ``PHASES``.
+    iterator : Iterator[_T]
+        The iterator to be measured.
+
+    Yields
+    ------
+    _T
+        The next item of the iterator.
+    """
+    while True:
+        with _Measure(stats, phase):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+
+        yield item
+
+
+def _format_size(size: int) -> str:
+    """
+    Format an amount of bytes for humans.
+
+    Parameters
+    ----------
+    size : int
+        The amount of bytes.
+
+    Returns
+    -------
+    str
+        The formatted amount, using binary units.
+    """
+    value = float(size)
+    for unit in _UNITS[:-1]:
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+
+        value /= 1024
+
+    return f"{value:.1f} {_UNITS[-1]}"
+
+
+def format_stats(stats: RunStats) -> str:
+    """
+    Format the statistics of a run as a table.
+
+    Parameters
+    ----------
+    stats : RunStats
+        The statistics to be formatted.
+
+    Returns
+    -------
+    str
+        The formatted statistics.
+    """
+    lines: List[str] = [f"{'phase':<12}{'wall':>12}{'cpu':>12}"]
+    for phase in PHASES:
+        wall, cpu = stats.wall[phase] * 1000, stats.cpu[phase] * 1000
+        lines.append(f"{phase:<12}{wall:>10.1f}ms{cpu:>10.1f}ms")
+
+    lines.append(f"{'total':<12}{stats.elapsed * 1000:>10.1f}ms")
+    lines.append(
+        f"files: {stats.files} ({stats.files_per_second():.1f}/s), skipped: {stats.skipped}, "
+        + f"cached: {stats.cached}, unchanged: {stats.unchanged}, changed: {stats.changed}, "
+        + f"fixed: {stats.fixed}, failed: {stats.failed}"
+    )
+    lines.append(
+        f"read: {_format_size(stats.bytes_read)}, written: {_format_size(stats.bytes_written)}"
+    )
+    return "\n".join(lines)
+
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -0,0 +1,197 @@
+from threading import Lock
+from typing import Any, ContextManager, Iterable, TypeVar
+
+from .types import CheckResult
+
+__all__ = ["PHASES", "RunStats", "format_stats", "measure", "measure_iter"]
+
+_T = TypeVar("_T")
+
+PHASES: tuple[str, ...]
+
+class RunStats:
+    """
+    The timings and counters of a run.
+
+    Every phase is measured in the thread doing the work, so the wall and CPU times of a phase
+    are summed over all workers and can exceed the elapsed time of the run.
+
+    Attributes
+    ----------
+    wall : Dict[str, float]
+        The wall time of every phase, in seconds.
+    cpu : Dict[str, float]
+        The CPU time of every phase, in seconds.
+    elapsed : float
+        The wall time of the whole run, in seconds.
+    files : int
+        The amount of matching files.
+    skipped : int
+        The amount of files that couldn't be decoded (e.g. binary files).
+    cached : int
+        The amount of files not read because they didn't change since their last check
+        (they are counted as unchanged or changed as well).
+    unchanged : int
+        The amount of files that already had the right EOF comment.
+    changed : int
+        The amount of files missing the right EOF comment.
+    fixed : int
+        The amount of files whose EOF comment was fixed.
+    failed : int
+        The amount of files that couldn't be checked or fixed.
+    bytes_read : int
+        The amount of bytes read from the files.
+    bytes_written : int
+        The amount of bytes written to the files.
+
+    Methods
+    -------
+    add(phase, wall, cpu, read=0, written=0)
+    add_cached()
+    count_check(result)
+    count_fix(result)
+    merge(other)
+    files_per_second()
+    """
+
+    __lock: Lock
+    wall: dict[str, float]
+    cpu: dict[str, float]
+    elapsed: float
+    files: int
+    skipped: int
+    cached: int
+    unchanged: int
+    changed: int
+    fixed: int
+    failed: int
+    bytes_read: int
+    bytes_written: int
+    def __init__(self) -> None: ...
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Get the state to be pickled, leaving the lock out.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The attributes of the object, except for its lock.
+        """
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Restore a pickled state, with a new lock.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The state returned by ``__getstate__()``.
+        """
+    def add(self, phase: str, wall: float, cpu: float, read: int = 0, written: int = 0) -> None:
+        """
+        Add a measurement to a phase.
+
+        Parameters
+        ----------
+        phase : str
+            One of ``PHASES``.
+        wall : float
+            The wall time, in seconds.
+        cpu : float
+            The CPU time, in seconds.
+        read : int, optional, default=0
+            The amount of bytes read.
+        written : int, optional, default=0
+            The amount of bytes written.
+        """
+    def add_cached(self) -> None:
+        """Count a file found up to date in the scan cache."""
+    def count_check(self, result: CheckResult | None) -> None:
+        """
+        Count the result of a check.
+
+        Parameters
+        ----------
+        result : CheckResult or None
+            The result of the check, or ``None`` if the file couldn't be decoded.
+        """
+    def count_fix(self, result: CheckResult) -> None:
+        """
+        Count the result of a fix.
+
+        Parameters
+        ----------
+        result : CheckResult
+            The result returned by the fix, with its ``error`` set if the file couldn't be
+            modified.
+        """
+    def merge(self, other: RunStats) -> None:
+        """
+        Add the timings and counters of other statistics (e.g. from a worker process).
+
+        Parameters
+        ----------
+        other : RunStats
+            The statistics to be added.
+        """
+    def files_per_second(self) -> float:
+        """
+        Get the throughput of the run.
+
+        Returns
+        -------
+        float
+            The amount of files processed per second, or ``0.0`` if nothing was measured.
+        """
+
+def measure(stats: RunStats | None, phase: str) -> ContextManager[None]:
+    """
+    Measure a block of code as part of a phase.
+
+    Parameters
+    ----------
+    stats : RunStats or None
+        The statistics to be updated. If ``None`` nothing is measured at all.
+    phase : str
+        One of ``PHASES``.
+
+    Returns
+    -------
+    ContextManager[None]
+        The context manager to wrap the block of code with.
+    """
+
+def measure_iter(stats: RunStats | None, phase: str, items: Iterable[_T]) -> Iterable[_T]:
+    """
+    Measure the time spent producing the items of a lazy iterable as part of a phase.
+
+    Parameters
+    ----------
+    stats : RunStats or None
+        The statistics to be updated. If ``None`` the iterable is returned as is.
+    phase : str
+        One of ``PHASES``.
+    items : Iterable[_T]
+        The iterable to be measured (e.g. a directory walk).
+
+    Returns
+    -------
+    Iterable[_T]
+        An iterable yielding the same items.
+    """
+
+def format_stats(stats: RunStats) -> str:
+    """
+    Format the statistics of a run as a table.
+
+    Parameters
+    ----------
+    stats : RunStats
+        The statistics to be formatted.
+
+    Returns
+    -------
+    str
+        The formatted statistics.
+    """
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -9,20 +9,23 @@ Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
 __all__ = [
     "BatchPairDict",
     "BatchPathDict",
+    "CheckResult",
     "CommentMap",
     "EOFCommentSearch",
     "IOWrapperBool",
     "IndentHandler",
     "IndentMap",
+    "IndexEntry",
     "LineBool",
     "ParserSpec",
     "VersionInfo",
 ]
 
 from io import TextIOWrapper
-from typing import Any, Dict, List, Tuple, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, TypedDict
 
-from argcomplete.completers import ChoicesCompleter, DirectoriesCompleter
+if TYPE_CHECKING:
+    from argcomplete.completers import ChoicesCompleter, DirectoriesCompleter, FilesCompleter
 
 
 class VersionInfo:
@@ -200,8 +203,8 @@ class ParserSpec:
         A list containing all the relevant iterations of the same option.
     kwargs : Dict[str, Any]
         Extra arguments for ``argparse.ArgumentParser``.
-    completer : DirectoriesCompleter or ChoicesCompleter
-        An ``argcomplete`` completer object.
+    completer : DirectoriesCompleter, FilesCompleter, ChoicesCompleter or None
+        An ``argcomplete`` completer object, if shell completion is active.
 
     Attributes
     ----------
@@ -209,19 +212,19 @@ class ParserSpec:
         A list containing all the relevant iterations of the same option.
     kwargs : Dict[str, Any]
         Extra arguments for ``argparse.ArgumentParser``.
-    completer : DirectoriesCompleter or ChoicesCompleter
-        An ``argcomplete`` completer object.
+    completer : DirectoriesCompleter, FilesCompleter, ChoicesCompleter or None
+        An ``argcomplete`` completer object, if shell completion is active.
     """
 
     opts: List[str]
     kwargs: Dict[str, Any]
-    completer: ChoicesCompleter | DirectoriesCompleter
+    completer: "ChoicesCompleter | DirectoriesCompleter | FilesCompleter | None"
 
     def __init__(
         self,
         opts: List[str],
         kwargs: Dict[str, Any],
-        completer: ChoicesCompleter | DirectoriesCompleter,
+        completer: "ChoicesCompleter | DirectoriesCompleter | FilesCompleter | None",
     ):
         self.opts = opts
         self.kwargs = kwargs
@@ -290,8 +293,8 @@ class IOWrapperBool:
 
     Parameters
     ----------
-    file : io.TextIOWrapper
-        The opened file as a ``io.TextIOWrapper`` wrapper.
+    file : io.TextIOWrapper or None
+        The opened file as a ``io.TextIOWrapper`` wrapper, or ``None`` if it was already closed.
     had_nwl : bool
         Whether the file has a newline or not.
     crlf : bool
@@ -299,30 +302,30 @@ class IOWrapperBool:
 
     Attributes
     ----------
-    file : io.TextIOWrapper
-        The opened file as a ``io.TextIOWrapper`` wrapper.
+    file : io.TextIOWrapper or None
+        The opened file as a ``io.TextIOWrapper`` wrapper, or ``None`` if it was already closed.
     had_nwl : bool
         Whether the file has a newline or not.
     crlf : bool
         Whether the file is CRLF-terminated.
     """
 
-    file: TextIOWrapper
+    file: TextIOWrapper | None
     had_nwl: bool
     crlf: bool
 
-    def __init__(self, file: TextIOWrapper, had_nwl: bool, crlf: bool):
+    def __init__(self, file: TextIOWrapper | None, had_nwl: bool, crlf: bool):
         self.file = file
         self.had_nwl = had_nwl
         self.crlf = crlf
 
-    def __iterables(self) -> Tuple[TextIOWrapper, bool, bool]:
+    def __iterables(self) -> Tuple[TextIOWrapper | None, bool, bool]:
         """
         Generate iterables.
 
         Returns
         -------
-        Tuple[io.TextIOWrapper, bool, bool]
+        Tuple[io.TextIOWrapper or None, bool, bool]
             The ``file``, ``had_nwl`` and ``crlf`` attributes.
         """
         return (self.file, self.had_nwl, self.crlf)
@@ -514,4 +517,144 @@ class EOFCommentSearch:
         yield from self.__iterables()
 
 
+class CheckResult:
+    """
+    An object containing ``fpath``, ``ft_ext``, ``changed``, ``search``, ``error`` and ``encoding``.
+
+    Parameters
+    ----------
+    fpath : str
+        The target file's path.
+    ft_ext : str
+        The file-type/file-extension.
+    search : EOFCommentSearch or None
+        The search result if the file needs to be changed, otherwise ``None``.
+    error : str or None, optional, default=None
+        The error message if the file couldn't be processed.
+    encoding : str or None, optional, default=None
+        The encoding the file was decoded with, if known.
+
+    Attributes
+    ----------
+    fpath : str
+        The target file's path.
+    ft_ext : str
+        The file-type/file-extension.
+    changed : bool
+        Whether the file needs to be changed.
+    search : EOFCommentSearch or None
+        The search result if the file needs to be changed, otherwise ``None``.
+    error : str or None
+        The error message if the file couldn't be processed.
+    encoding : str or None
+        The encoding the file was decoded with, if known.
+    """
+
+    fpath: str
+    ft_ext: str
+    changed: bool
+    search: EOFCommentSearch | None
+    error: str | None
+    encoding: str | None
+
+    def __init__(
+        self,
+        fpath: str,
+        ft_ext: str,
+        search: EOFCommentSearch | None,
+        error: str | None = None,
+        encoding: str | None = None,
+    ):
+        self.fpath = fpath
+        self.ft_ext = ft_ext
+        self.changed = search is not None
+        self.search = search
+        self.error = error
+        self.encoding = encoding
+
+    def __iterables(
+        self,
+    ) -> Tuple[str, str, bool, EOFCommentSearch | None, str | None, str | None]:
+        """
+        Generate iterables.
+
+        Returns
+        -------
+        Tuple[str, str, bool, EOFCommentSearch or None, str or None, str or None]
+            The ``fpath``, ``ft_ext``, ``changed``, ``search``, ``error`` and ``encoding``
+            attributes.
+        """
+        return (self.fpath, self.ft_ext, self.changed, self.search, self.error, self.encoding)
+
+    def __iter__(self):
+        """Iterate over objects."""
+        yield from self.__iterables()
+
+
+class IndexEntry:
+    """
+    An object containing the relevant fields of a git index entry.
+
+    Parameters
+    ----------
+    path : str
+        The path of the entry, relative to the work tree and using forward slashes.
+    oid : str
+        The hexadecimal object ID of the blob.
+    mode : int
+        The file mode of the entry.
+    ino : int
+        The inode number (truncated to 32 bits) of the file when it was staged.
+    size : int
+        The size (truncated to 32 bits) of the file when it was staged.
+    mtime : Tuple[int, int]
+        The modification time (seconds and nanoseconds) of the file when it was staged.
+
+    Attributes
+    ----------
+    path : str
+        The path of the entry, relative to the work tree and using forward slashes.
+    oid : str
+        The hexadecimal object ID of the blob.
+    mode : int
+        The file mode of the entry.
+    ino : int
+        The inode number (truncated to 32 bits) of the file when it was staged.
+    size : int
+        The size (truncated to 32 bits) of the file when it was staged.
+    mtime : Tuple[int, int]
+        The modification time (seconds and nanoseconds) of the file when it was staged.
+    """
+
+    path: str
+    oid: str
+    mode: int
+    ino: int
+    size: int
+    mtime: Tuple[int, int]
+
+    def __init__(self, path: str, oid: str, mode: int, ino: int, size: int, mtime: Tuple[int, int]):
+        self.path = path
+        self.oid = oid
+        self.mode = mode
+        self.ino = ino
+        self.size = size
+        self.mtime = mtime
+
+    def __iterables(self) -> Tuple[str, str, int, int, int, Tuple[int, int]]:
+        """
+        Generate iterables.
+
+        Returns
+        -------
+        Tuple[str, str, int, int, int, Tuple[int, int]]
+            The ``path``, ``oid``, ``mode``, ``ino``, ``size`` and ``mtime`` attributes.
+        """
+        return (self.path, self.oid, self.mode, self.ino, self.size, self.mtime)
+
+    def __iter__(self):
+        """Iterate over objects."""
+        yield from self.__iterables()
+
+
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
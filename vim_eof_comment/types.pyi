@@ -1,16 +1,18 @@
 from io import TextIOWrapper
 from typing import Any, TypedDict
 
-from argcomplete.completers import ChoicesCompleter, DirectoriesCompleter
+from argcomplete.completers import ChoicesCompleter, DirectoriesCompleter, FilesCompleter
 
 __all__ = [
     "BatchPairDict",
     "BatchPathDict",
+    "CheckResult",
     "CommentMap",
     "EOFCommentSearch",
     "IOWrapperBool",
     "IndentHandler",
     "IndentMap",
+    "IndexEntry",
     "LineBool",
     "ParserSpec",
     "VersionInfo",
@@ -162,8 +164,8 @@ class ParserSpec:
         A list containing all the relevant iterations of the same option.
     kwargs : Dict[str, Any]
         Extra arguments for ``argparse.ArgumentParser``.
-    completer : DirectoriesCompleter or ChoicesCompleter
-        An ``argcomplete`` completer object.
+    completer : DirectoriesCompleter, FilesCompleter, ChoicesCompleter or None
+        An ``argcomplete`` completer object, if shell completion is active.
 
     Attributes
     ----------
@@ -171,18 +173,18 @@ class ParserSpec:
         A list containing all the relevant iterations of the same option.
     kwargs : Dict[str, Any]
         Extra arguments for ``argparse.ArgumentParser``.
-    completer : DirectoriesCompleter or ChoicesCompleter
-        An ``argcomplete`` completer object.
+    completer : DirectoriesCompleter, FilesCompleter, ChoicesCompleter or None
+        An ``argcomplete`` completer object, if shell completion is active.
     """
 
     opts: list[str]
     kwargs: dict[str, Any]
-    completer: ChoicesCompleter | DirectoriesCompleter
+    completer: ChoicesCompleter | DirectoriesCompleter | FilesCompleter | None
     def __init__(
         self,
         opts: list[str],
         kwargs: dict[str, Any],
-        completer: ChoicesCompleter | DirectoriesCompleter,
+        completer: ChoicesCompleter | DirectoriesCompleter | FilesCompleter | None,
     ) -> None: ...
 
 class CommentMap:
@@ -242,8 +244,8 @@ class IOWrapperBool:
 
     Parameters
     ----------
-    file : io.TextIOWrapper
-        The opened file as a ``io.TextIOWrapper`` wrapper.
+    file : io.TextIOWrapper or None
+        The opened file as a ``io.TextIOWrapper`` wrapper, or ``None`` if it was already closed.
     had_nwl : bool
         Whether the file has a newline or not.
     crlf : bool
@@ -251,25 +253,25 @@ class IOWrapperBool:
 
     Attributes
     ----------
-    file : io.TextIOWrapper
-        The opened file as a ``io.TextIOWrapper`` wrapper.
+    file : io.TextIOWrapper or None
+        The opened file as a ``io.TextIOWrapper`` wrapper, or ``None`` if it was already closed.
     had_nwl : bool
         Whether the file has a newline or not.
     crlf : bool
         Whether the file is CRLF-terminated.
     """
 
-    file: TextIOWrapper
+    file: TextIOWrapper | None
     had_nwl: bool
     crlf: bool
-    def __init__(self, file: TextIOWrapper, had_nwl: bool, crlf: bool) -> None: ...
-    def __iterables(self) -> tuple[TextIOWrapper, bool, bool]:
+    def __init__(self, file: TextIOWrapper | None, had_nwl: bool, crlf: bool) -> None: ...
+    def __iterables(self) -> tuple[TextIOWrapper | None, bool, bool]:
         """
         Generate iterables.
 
         Returns
         -------
-        Tuple[io.TextIOWrapper, bool, bool]
+        Tuple[io.TextIOWrapper or None, bool, bool]
             The ``file``, ``had_nwl`` and ``crlf`` attributes.
         """
     def __iter__(self):
@@ -423,4 +425,122 @@ class EOFCommentSearch:
     def __iter__(self):
         """Iterate over objects."""
 
+class CheckResult:
+    """
+    An object containing ``fpath``, ``ft_ext``, ``changed``, ``search``, ``error`` and ``encoding``.
+
+    Parameters
+    ----------
+    fpath : str
+        The target file's path.
+    ft_ext : str
+        The file-type/file-extension.
+    search : EOFCommentSearch or None
+        The search result if the file needs to be changed, otherwise ``None``.
+    error : str or None, optional, default=None
+        The error message if the file couldn't be processed.
+    encoding : str or None, optional, default=None
+        The encoding the file was decoded with, if known.
+
+    Attributes
+    ----------
+    fpath : str
+        The target file's path.
+    ft_ext : str
+        The file-type/file-extension.
+    changed : bool
+        Whether the file needs to be changed.
+    search : EOFCommentSearch or None
+        The search result if the file needs to be changed, otherwise ``None``.
+    error : str or None
+        The error message if the file couldn't be processed.
+    encoding : str or None
+        The encoding the file was decoded with, if known.
+    """
+
+    fpath: str
+    ft_ext: str
+    changed: bool
+    search: EOFCommentSearch | None
+    error: str | None
+    encoding: str | None
+    def __init__(
+        self,
+        fpath: str,
+        ft_ext: str,
+        search: EOFCommentSearch | None,
+        error: str | None = None,
+        encoding: str | None = None,
+    ) -> None: ...
+    def __iterables(
+        self,
+    ) -> tuple[str, str, bool, EOFCommentSearch | None, str | None, str | None]:
+        """
+        Generate iterables.
+
+        Returns
+        -------
+        Tuple[str, str, bool, EOFCommentSearch or None, str or None, str or None]
+            The ``fpath``, ``ft_ext``, ``changed``, ``search``, ``error`` and ``encoding``
+            attributes.
+        """
+    def __iter__(self):
+        """Iterate over objects."""
+
+class IndexEntry:
+    """
+    An object containing the relevant fields of a git index entry.
+
+    Parameters
+    ----------
+    path : str
+        The path of the entry, relative to the work tree and using forward slashes.
+    oid : str
+        The hexadecimal object ID of the blob.
+    mode : int
+        The file mode of the entry.
+    ino : int
+        The inode number (truncated to 32 bits) of the file when it was staged.
+    size : int
+        The size (truncated to 32 bits) of the file when it was staged.
+    mtime : Tuple[int, int]
+        The modification time (seconds and nanoseconds) of the file when it was staged.
+
+    Attributes
+    ----------
+    path : str
+        The path of the entry, relative to the work tree and using forward slashes.
+    oid : str
+        The hexadecimal object ID of the blob.
+    mode : int
+        The file mode of the entry.
+    ino : int
+        The inode number (truncated to 32 bits) of the file when it was staged.
+    size : int
+        The size (truncated to 32 bits) of the file when it was staged.
+    mtime : Tuple[int, int]
+        The modification time (seconds and nanoseconds) of the file when it was staged.
+    """
+
+    path: str
+    oid: str
+    mode: int
+    ino: int
+    size: int
+    mtime: tuple[int, int]
+    def __init__(
+        self, path: str, oid: str, mode: int, ino: int, size: int, mtime: tuple[int, int]
+    ) -> None: ...
+    def __iterables(self) -> tuple[str, str, int, int, int, tuple[int, int]]:
+        """
+        Generate iterables.
+
+        Returns
+        -------
+        Tuple[str, str, int, int, int, Tuple[int, int]]
+            The ``path``, ``oid``, ``mode``, ``ino``, ``size`` and ``mtime`` attributes.
+        """
+    def __iter__(self):
+        """Iterate over objects."""
+
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
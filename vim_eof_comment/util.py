@@ -10,12 +10,14 @@ __all__ = [
     "die",
     "error",
     "gen_indent_maps",
+    "render_literal",
+    "render_mapping",
     "verbose_print",
 ]
 
 from sys import exit as Exit
 from sys import stderr, stdout
-from typing import Callable, Dict, List, TextIO
+from typing import Any, Callable, Dict, List, Mapping, TextIO
 
 from .types import IndentHandler, IndentMap
 
@@ -166,4 +168,75 @@ def gen_indent_maps(maps: List[IndentHandler]) -> Dict[str, IndentMap] | None:
     return map_d
 
 
+def render_literal(value: Any, indent: str | None = None) -> str:
+    """
+    Render a constant as Python source, using double quotes.
+
+    Mappings are rendered frozen, as ``types.MappingProxyType`` objects.
+
+    Parameters
+    ----------
+    value : Any
+        A string, bytes, number, boolean, tuple or mapping of those.
+    indent : str, optional, default=None
+        If given, a tuple is rendered one item per line, closing at this indentation.
+
+    Returns
+    -------
+    str
+        The Python source of the value.
+    """
+    import json
+
+    if isinstance(value, Mapping):
+        items = ", ".join(f"{render_literal(k)}: {render_literal(v)}" for k, v in value.items())
+        return f"MappingProxyType({{{items}}})"
+
+    if isinstance(value, tuple) and indent is not None:
+        lines = [f"{indent}    {render_literal(v)}," for v in value]
+        return "\n".join(["(", *lines, f"{indent})"])
+
+    if isinstance(value, tuple):
+        items = ", ".join(render_literal(v) for v in value)
+        return f"({items},)" if len(value) == 1 else f"({items})"
+
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+
+    if isinstance(value, bytes) and value.isascii():
+        return "b" + json.dumps(value.decode("ascii"))
+
+    return repr(value)
+
+
+def render_mapping(name: str, annotation: str, items: Mapping[str, Any]) -> str:
+    """
+    Render a frozen dictionary assignment for a generated module.
+
+    Parameters
+    ----------
+    name : str
+        The name of the constant.
+    annotation : str
+        The type annotation of the constant.
+    items : Mapping[str, Any]
+        The contents of the dictionary.
+
+    Returns
+    -------
+    str
+        The Python source of the assignment.
+    """
+    lines: List[str] = [f"{name}: {annotation} = MappingProxyType(", "    {"]
+    for key, value in items.items():
+        line = f"        {render_literal(key)}: {render_literal(value)},"
+        if len(line) > 100:
+            line = f"        {render_literal(key)}: {render_literal(value, '        ')},"
+
+        lines.append(line)
+
+    lines.extend(["    }", ")"])
+    return "\n".join(lines)
+
+
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
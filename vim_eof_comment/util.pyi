@@ -1,8 +1,15 @@
-from typing import Callable, TextIO
+from typing import Any, Callable, Mapping, TextIO
 
 from .types import IndentHandler, IndentMap
 
-__all__ = ["die", "error", "gen_indent_maps", "verbose_print"]
+__all__ = [
+    "die",
+    "error",
+    "gen_indent_maps",
+    "render_literal",
+    "render_mapping",
+    "verbose_print",
+]
 
 def error(*msg, **kwargs) -> None:
     """
@@ -100,4 +107,42 @@ def gen_indent_maps(maps: list[IndentHandler]) -> dict[str, IndentMap] | None:
                   is less or equal to one.
     """
 
+def render_literal(value: Any, indent: str | None = None) -> str:
+    """
+    Render a constant as Python source, using double quotes.
+
+    Mappings are rendered frozen, as ``types.MappingProxyType`` objects.
+
+    Parameters
+    ----------
+    value : Any
+        A string, bytes, number, boolean, tuple or mapping of those.
+    indent : str, optional, default=None
+        If given, a tuple is rendered one item per line, closing at this indentation.
+
+    Returns
+    -------
+    str
+        The Python source of the value.
+    """
+
+def render_mapping(name: str, annotation: str, items: Mapping[str, Any]) -> str:
+    """
+    Render a frozen dictionary assignment for a generated module.
+
+    Parameters
+    ----------
+    name : str
+        The name of the constant.
+    annotation : str
+        The type annotation of the constant.
+    items : Mapping[str, Any]
+        The contents of the dictionary.
+
+    Returns
+    -------
+    str
+        The Python source of the assignment.
+    """
+
 # vim: set ts=4 sts=4 sw=4 et ai si sta:
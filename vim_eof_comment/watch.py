@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+Filesystem watching utilities.
+
+On Linux the kernel's inotify API is used through ``ctypes``, elsewhere the matching files
+are polled periodically.
+
+Copyright (c) 2025 Guennadi Maximov C. All Rights Reserved.
+"""
+
+__all__ = ["DEFAULT_DEBOUNCE", "DEFAULT_POLL_INTERVAL", "inotify_available", "watch_paths"]
+
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from os import close, fsencode, read, sep, stat
+from os.path import basename, isdir, join, relpath
+from re import Pattern
+from select import select
+from struct import Struct
+from sys import platform
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Tuple
+
+from .file import (
+    EXCLUDED_DIRS,
+    build_suffix_index,
+    compile_excludes,
+    is_excluded,
+    iter_paths,
+    match_suffix,
+    scan_dir,
+)
+from .types import BatchPairDict
+
+DEFAULT_DEBOUNCE: float = 0.2
+DEFAULT_POLL_INTERVAL: float = 1.0
+
+_IN_CLOSE_WRITE: int = 0x00000008
+_IN_MOVED_TO: int = 0x00000080
+_IN_CREATE: int = 0x00000100
+_IN_Q_OVERFLOW: int = 0x00004000
+_IN_IGNORED: int = 0x00008000
+_IN_ONLYDIR: int = 0x01000000
+_IN_ISDIR: int = 0x40000000
+_IN_CLOEXEC: int = 0o2000000
+
+_WATCH_MASK: int = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_ONLYDIR
+_EVENT = Struct("iIII")
+_READ_SIZE: int = 65536
+_MAX_DELAY_FACTOR: int = 5
+
+
+@lru_cache(maxsize=None)
+def _load_libc() -> Any | None:
+    """
+    Load the C library if it provides the inotify API, only once per process.
+
+    Returns
+    -------
+    ctypes.CDLL or None
+        The C library, or ``None`` if inotify isn't available.
+    """
+    if not platform.startswith("linux"):
+        return None
+
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+
+    return libc
+
+
+def inotify_available() -> bool:
+    """
+    Check whether the inotify API can be used.
+
+    Returns
+    -------
+    bool
+        Whether inotify is available.
+    """
+    return _load_libc() is not None
+
+
+class _Inotify:
+    """
+    A recursive inotify watcher over some directory trees.
+
+    Parameters
+    ----------
+    libc : ctypes.CDLL
+        The C library providing the inotify API.
+    paths : List[str]
+        The target directories.
+    index : Dict[str, Any]
+        The suffix index returned by ``build_suffix_index()``.
+    excludes : re.Pattern[str] or None
+        The compiled exclusion globs.
+
+    Methods
+    -------
+    wait(debounce)
+    close()
+    """
+
+    __libc: Any
+    __fd: int
+    __dirs: Dict[int, Tuple[str, str]]
+    __index: Dict[str, Any]
+    __excluded: FrozenSet[str]
+    __excludes: Pattern[str] | None
+
+    def __init__(
+        self, libc: Any, paths: List[str], index: Dict[str, Any], excludes: Pattern[str] | None
+    ):
+        fd: int = libc.inotify_init1(_IN_CLOEXEC)
+        if fd < 0:
+            from ctypes import get_errno
+
+            raise OSError(get_errno(), "inotify_init1() failed")
+
+        self.__libc = libc
+        self.__fd = fd
+        self.__dirs = dict()
+        self.__index = index
+        self.__excluded = frozenset(EXCLUDED_DIRS)
+        self.__excludes = excludes
+        for path in paths:
+            self.__add_tree(path, path)
+
+    def __watch_dir(self, top: str, path: str) -> bool:
+        """
+        Watch a single directory.
+
+        Parameters
+        ----------
+        top : str
+            The target directory it belongs to.
+        path : str
+            The directory to be watched.
+
+        Returns
+        -------
+        bool
+            Whether the directory is now watched.
+        """
+        wd: int = self.__libc.inotify_add_watch(self.__fd, fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            return False
+
+        self.__dirs[wd] = (path, top)
+        return True
+
+    def __add_tree(self, path: str, top: str) -> List[str]:
+        """
+        Watch a directory and all of its non-excluded subdirectories.
+
+        Parameters
+        ----------
+        path : str
+            The directory to be watched.
+        top : str
+            The target directory it belongs to.
+
+        Returns
+        -------
+        List[str]
+            The matching files already inside the directory tree.
+        """
+        rel = relpath(path, top).replace(sep, "/")
+        entries = scan_dir(
+            path,
+            self.__excluded,
+            self.__excludes,
+            "" if rel == "." else f"{rel}/",
+            partial(self.__watch_dir, top),
+        )
+        index = self.__index
+        return [entry.path for entry in entries if match_suffix(entry.name, index) is not None]
+
+    def __read_events(self) -> Tuple[List[str], bool]:
+        """
+        Read and decode the pending inotify events.
+
+        Returns
+        -------
+        Tuple[List[str], bool]
+            The matching files that changed, and whether the event queue overflowed.
+        """
+        data = read(self.__fd, _READ_SIZE)
+        changed: List[str] = list()
+        overflow = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                overflow = True
+                continue
+
+            if mask & _IN_IGNORED:
+                self.__dirs.pop(wd, None)
+                continue
+
+            if wd not in self.__dirs or not name:
+                continue
+
+            root, top = self.__dirs[wd]
+            path = join(root, name)
+            rel = relpath(path, top).replace(sep, "/")
+            if mask & _IN_ISDIR:
+                if name not in self.__excluded and not is_excluded(
+                    rel, self.__excluded, self.__excludes
+                ):
+                    changed.extend(self.__add_tree(path, top))
+
+                continue
+
+            if mask & _IN_CREATE:
+                continue
+
+            if match_suffix(name, self.__index) is not None and not is_excluded(
+                rel, self.__excluded, self.__excludes
+            ):
+                changed.append(path)
+
+        return changed, overflow
+
+    def wait(self, debounce: float) -> Tuple[List[str], bool]:
+        """
+        Block until some matching files change, then coalesce them until things calm down.
+
+        Parameters
+        ----------
+        debounce : float
+            The amount of seconds without new events to wait for before returning.
+
+        Returns
+        -------
+        Tuple[List[str], bool]
+            The changed files (without duplicates) and whether any events were lost.
+        """
+        changed: Dict[str, None] = dict()
+        overflow = False
+        deadline: float | None = None
+        while True:
+            timeout: float | None = None
+            if deadline is not None:
+                timeout = max(0.0, min(debounce, deadline - monotonic()))
+
+            ready, _, _ = select([self.__fd], [], [], timeout)
+            if not ready:
+                return list(changed), overflow
+
+            paths, lost = self.__read_events()
+            overflow = overflow or lost
+            changed.update(dict.fromkeys(paths))
+            if deadline is None and (changed or overflow):
+                deadline = monotonic() + debounce * _MAX_DELAY_FACTOR
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        close(self.__fd)
+
+
+def _snapshot(
+    paths: List[str], exts: List[str], excludes: List[str] | None
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Get the modification time and size of every matching file.
+
+    Parameters
+    ----------
+    paths : List[str]
+        The target directories.
+    exts : List[str]
+        A list of specified file extensions.
+    excludes : List[str] or None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+
+    Returns
+    -------
+    Dict[str, Tuple[int, int]]
+        The modification time (in nanoseconds) and size of each file, by path.
+    """
+    snapshot: Dict[str, Tuple[int, int]] = dict()
+    for path in iter_paths(paths, exts, excludes):
+        try:
+            st = stat(path.fpath)
+        except OSError:
+            continue
+
+        snapshot[path.fpath] = (st.st_mtime_ns, st.st_size)
+
+    return snapshot
+
+
+def _inotify_batches(
+    watcher: _Inotify,
+    dirs: List[str],
+    exts: List[str],
+    excludes: List[str] | None,
+    debounce: float,
+    batch: Callable[[Iterable[str]], List[BatchPairDict]],
+) -> Iterator[List[BatchPairDict]]:
+    """
+    Yield the batches of files reported by an inotify watcher.
+
+    Parameters
+    ----------
+    watcher : _Inotify
+        The watcher over the target directories.
+    dirs : List[str]
+        The target directories, scanned again if any events are lost.
+    exts : List[str]
+        A list of specified file extensions.
+    excludes : List[str] or None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+    debounce : float
+        The debounce delay, in seconds.
+    batch : Callable[[Iterable[str]], List[BatchPairDict]]
+        The function turning the changed paths into ``BatchPairDict`` objects.
+
+    Yields
+    ------
+    List[BatchPairDict]
+        The ``BatchPairDict`` objects of the files changed since the last batch.
+    """
+    while True:
+        changed, overflow = watcher.wait(debounce)
+        if overflow:
+            yield list(iter_paths(dirs, exts, excludes))
+        elif changed:
+            yield batch(changed)
+
+
+def _poll_batches(
+    dirs: List[str],
+    exts: List[str],
+    excludes: List[str] | None,
+    poll_interval: float,
+    snapshot: Dict[str, Tuple[int, int]],
+    batch: Callable[[Iterable[str]], List[BatchPairDict]],
+) -> Iterator[List[BatchPairDict]]:
+    """
+    Yield the batches of files found to be changed by periodically scanning some directories.
+
+    Parameters
+    ----------
+    dirs : List[str]
+        The target directories.
+    exts : List[str]
+        A list of specified file extensions.
+    excludes : List[str] or None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+    poll_interval : float
+        The delay between scans, in seconds.
+    snapshot : Dict[str, Tuple[int, int]]
+        The first scan, as returned by ``_snapshot()``.
+    batch : Callable[[Iterable[str]], List[BatchPairDict]]
+        The function turning the changed paths into ``BatchPairDict`` objects.
+
+    Yields
+    ------
+    List[BatchPairDict]
+        The ``BatchPairDict`` objects of the files changed since the last batch.
+    """
+    while True:
+        sleep(poll_interval)
+        current = _snapshot(dirs, exts, excludes)
+        changed = [fpath for fpath, sig in current.items() if snapshot.get(fpath) != sig]
+        snapshot = current
+        if changed:
+            yield batch(changed)
+
+
+@contextmanager
+def watch_paths(
+    paths: Iterable[str], exts: List[str], excludes: List[str] | None = None, **kwargs
+) -> Iterator[Iterator[List[BatchPairDict]]]:
+    """
+    Watch the given directories for matching files being written.
+
+    The directories are watched as soon as the context is entered, so any file written before
+    iterating over the batches (e.g. during an initial check) is reported with the first one.
+    Bursts of events are debounced and coalesced, so a file saved many times in a row is only
+    yielded once. If inotify isn't available (or its event queue overflows) the directories are
+    scanned instead. The batches never end on their own.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The target directories. Any other path is ignored.
+    exts : List[str]
+        A list of specified file extensions.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+    **kwargs
+        Contains the ``debounce`` delay and the ``poll_interval`` used without inotify
+        (both in seconds).
+
+    Yields
+    ------
+    Iterator[List[BatchPairDict]]
+        The ``BatchPairDict`` objects of the files changed since the last batch, in batches.
+    """
+    debounce: float = kwargs.get("debounce", DEFAULT_DEBOUNCE)
+    poll_interval: float = kwargs.get("poll_interval", DEFAULT_POLL_INTERVAL)
+    dirs: List[str] = [path for path in paths if isdir(path)]
+    index: Dict[str, Any] = build_suffix_index(exts)
+
+    def batch(fpaths: Iterable[str]) -> List[BatchPairDict]:
+        result: List[BatchPairDict] = list()
+        for fpath in fpaths:
+            ext: str | None = match_suffix(basename(fpath), index)
+            if ext is not None:
+                result.append(BatchPairDict(fpath=fpath, ft_ext=ext))
+
+        return result
+
+    libc = _load_libc()
+    watcher: _Inotify | None = None
+    if libc is not None:
+        try:
+            watcher = _Inotify(libc, dirs, index, compile_excludes(excludes or list()))
+        except OSError:
+            watcher = None
+
+    if watcher is None:
+        snapshot = _snapshot(dirs, exts, excludes)
+        yield _poll_batches(dirs, exts, excludes, poll_interval, snapshot, batch)
+        return
+
+    try:
+        yield _inotify_batches(watcher, dirs, exts, excludes, debounce, batch)
+    finally:
+        watcher.close()
+
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta:
@@ -0,0 +1,52 @@
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List
+
+from .types import BatchPairDict
+
+__all__ = ["DEFAULT_DEBOUNCE", "DEFAULT_POLL_INTERVAL", "inotify_available", "watch_paths"]
+
+DEFAULT_DEBOUNCE: float
+DEFAULT_POLL_INTERVAL: float
+
+def inotify_available() -> bool:
+    """
+    Check whether the inotify API can be used.
+
+    Returns
+    -------
+    bool
+        Whether inotify is available.
+    """
+
+@contextmanager
+def watch_paths(
+    paths: Iterable[str], exts: List[str], excludes: List[str] | None = None, **kwargs
+) -> Iterator[Iterator[List[BatchPairDict]]]:
+    """
+    Watch the given directories for matching files being written.
+
+    The directories are watched as soon as the context is entered, so any file written before
+    iterating over the batches (e.g. during an initial check) is reported with the first one.
+    Bursts of events are debounced and coalesced, so a file saved many times in a row is only
+    yielded once. If inotify isn't available (or its event queue overflows) the directories are
+    scanned instead. The batches never end on their own.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        The target directories. Any other path is ignored.
+    exts : List[str]
+        A list of specified file extensions.
+    excludes : List[str], optional, default=None
+        Glob patterns of the file and directory names (or relative paths) to be skipped.
+    **kwargs
+        Contains the ``debounce`` delay and the ``poll_interval`` used without inotify
+        (both in seconds).
+
+    Yields
+    ------
+    Iterator[List[BatchPairDict]]
+        The ``BatchPairDict`` objects of the files changed since the last batch, in batches.
+    """
+
+# vim: set ts=4 sts=4 sw=4 et ai si sta: